@@ -0,0 +1,129 @@
+import hmac
+import os
+from functools import lru_cache
+from typing import Iterator, Optional
+from uuid import UUID
+
+from fastapi import Depends, Header, HTTPException
+from sqlalchemy.orm import Session
+
+from app.domain.exceptions.domain_exceptions import DomainValidationError
+from app.infrastructure.persistence.sqlite.database import SHARDED, SessionLocal
+from app.infrastructure.persistence.sqlite.models import InvestigationModel
+from app.infrastructure.persistence.sqlite.sharding import (
+    ShardNotFoundError,
+    get_shard_router,
+)
+from app.infrastructure.persistence.sqlite.repositories.evidence_repo import (
+    SQLiteEvidenceRepository,
+)
+from app.infrastructure.persistence.sqlite.repositories.evidence_similarity_repo import (
+    SQLiteEvidenceSimilarityRepository,
+)
+from app.infrastructure.persistence.sqlite.repositories.investigation_repo import (
+    ShardedInvestigationRepository,
+    SQLiteInvestigationRepository,
+)
+from app.infrastructure.persistence.sqlite.repositories.person_repo import (
+    SQLitePersonRepository,
+)
+from app.infrastructure.storage.blob_store import BlobStore
+from app.interfaces.repositories.evidence_repository import EvidenceRepository
+from app.interfaces.repositories.evidence_similarity_repository import (
+    EvidenceSimilarityRepository,
+)
+from app.interfaces.repositories.investigation_repository import InvestigationRepository
+from app.interfaces.repositories.person_repository import PersonRepository
+
+
+# Rotas administrativas exigem este token; sem ele configurado, ficam
+# desabilitadas
+ADMIN_TOKEN = os.getenv("OSINT_ADMIN_TOKEN")
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
+
+def admin_token_valido(token: Optional[str]) -> bool:
+    if not ADMIN_TOKEN or not token:
+        return False
+    return hmac.compare_digest(
+        token.encode("utf-8"), ADMIN_TOKEN.encode("utf-8")
+    )
+
+
+def require_admin(
+    token: Optional[str] = Header(None, alias=ADMIN_TOKEN_HEADER),
+) -> None:
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Administração desabilitada.")
+
+    if not admin_token_valido(token):
+        raise HTTPException(
+            status_code=401, detail="Token administrativo inválido."
+        )
+
+
+def get_investigation_session(investigation_id: UUID) -> Iterator[Session]:
+    """
+    Resolve a sessão pelo investigation_id da rota: o shard da
+    investigação no layout particionado, ou o banco único.
+    Investigações inexistentes resultam em 404.
+    """
+
+    if SHARDED:
+        try:
+            session = get_shard_router().session_for(investigation_id)
+        except ShardNotFoundError:
+            raise HTTPException(status_code=404, detail="Investigação não encontrada.")
+        except DomainValidationError as exc:
+            raise HTTPException(status_code=409, detail=str(exc))
+    else:
+        session = SessionLocal()
+
+    try:
+        if not session.get(InvestigationModel, str(investigation_id)):
+            raise HTTPException(status_code=404, detail="Investigação não encontrada.")
+
+        yield session
+    finally:
+        session.close()
+
+
+def get_investigation_repository() -> Iterator[InvestigationRepository]:
+    """
+    Repositório de investigações fora do escopo de uma investigação já
+    existente (criação): no layout particionado, a gravação registra o
+    shard da nova investigação.
+    """
+
+    if SHARDED:
+        yield ShardedInvestigationRepository(get_shard_router())
+        return
+
+    session = SessionLocal()
+    try:
+        yield SQLiteInvestigationRepository(session)
+    finally:
+        session.close()
+
+
+def get_person_repository(
+    session: Session = Depends(get_investigation_session),
+) -> PersonRepository:
+    return SQLitePersonRepository(session)
+
+
+def get_evidence_repository(
+    session: Session = Depends(get_investigation_session),
+) -> EvidenceRepository:
+    return SQLiteEvidenceRepository(session)
+
+
+def get_similarity_repository(
+    session: Session = Depends(get_investigation_session),
+) -> EvidenceSimilarityRepository:
+    return SQLiteEvidenceSimilarityRepository(session)
+
+
+@lru_cache
+def get_blob_store() -> BlobStore:
+    return BlobStore(os.getenv("OSINT_BLOB_DIR", "./blobs"))
@@ -0,0 +1,52 @@
+from dataclasses import asdict
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
+
+from app.api.dependencies import require_admin
+from app.infrastructure.profiling.profiler import profiler
+
+
+router = APIRouter(
+    prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)]
+)
+
+
+class ProfilingConfig(BaseModel):
+    enabled: Optional[bool] = None
+    sample_rate: Optional[float] = None
+    modo: Optional[str] = None
+
+
+def _estado_profiler() -> dict:
+    return {
+        "enabled": profiler.enabled,
+        "sample_rate": profiler.sample_rate,
+        "modo": profiler.modo,
+        "output_dir": profiler.output_dir,
+    }
+
+
+@router.get("/profiling")
+def get_profiling():
+    return _estado_profiler()
+
+
+@router.put("/profiling")
+def configure_profiling(config: ProfilingConfig):
+    try:
+        profiler.configure(
+            enabled=config.enabled,
+            sample_rate=config.sample_rate,
+            modo=config.modo,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    return _estado_profiler()
+
+
+@router.get("/profiling/slowest")
+def list_slowest_executions(limit: int = Query(20, ge=1, le=100)):
+    return [asdict(execucao) for execucao in profiler.slowest(limit)]
@@ -0,0 +1,137 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.api.dependencies import (
+    get_blob_store,
+    get_evidence_repository,
+    get_investigation_session,
+    get_similarity_repository,
+)
+from app.domain.exceptions.domain_exceptions import DomainValidationError
+from app.domain.value_objects.evidence_type import EvidenceType
+from app.interfaces.repositories.evidence_repository import (
+    EvidenceFilter,
+    EvidenceRepository,
+)
+from app.infrastructure.storage.blob_store import BlobStore
+from app.interfaces.repositories.evidence_similarity_repository import (
+    EvidenceSimilarityRepository,
+)
+from app.interfaces.repositories.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+
+router = APIRouter(
+    prefix="/investigations/{investigation_id}/evidences", tags=["evidences"]
+)
+
+attachments_router = APIRouter(
+    prefix="/investigations/{investigation_id}/attachments", tags=["evidences"]
+)
+
+
+@router.get("")
+def list_evidences(
+    investigation_id: UUID,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fonte: Optional[str] = None,
+    tipo: Optional[EvidenceType] = None,
+    desde: Optional[datetime] = None,
+    ate: Optional[datetime] = None,
+    incluir_dado: bool = False,
+    evidence_repository: EvidenceRepository = Depends(get_evidence_repository),
+):
+    try:
+        page = evidence_repository.list_page(
+            investigation_id,
+            cursor=cursor,
+            limit=limit,
+            filtros=EvidenceFilter(
+                fonte=fonte,
+                tipo=tipo.value if tipo else None,
+                desde=desde,
+                ate=ate,
+            ),
+            incluir_dado=incluir_dado,
+        )
+    except DomainValidationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    items = []
+    for evidence in page.items:
+        item = {
+            "id": str(evidence.id),
+            "person_id": str(evidence.person_id) if evidence.person_id else None,
+            "tipo": evidence.tipo,
+            "fonte": evidence.fonte,
+            "coletado_por": evidence.coletado_por,
+            "data_coleta": evidence.data_coleta.isoformat(),
+            "hash_integridade": evidence.hash_integridade,
+        }
+        if incluir_dado:
+            item["dado"] = evidence.dado
+        items.append(item)
+
+    return {"items": items, "next_cursor": page.next_cursor}
+
+
+@router.get("/{evidence_id}/similar")
+def list_similar_evidences(
+    investigation_id: UUID,
+    evidence_id: UUID,
+    limiar: float = Query(0.8, ge=0.0, le=1.0),
+    similarity_repository: EvidenceSimilarityRepository = Depends(
+        get_similarity_repository
+    ),
+):
+    return [
+        {"id": str(similar_id), "similaridade": score}
+        for similar_id, score in similarity_repository.similar(
+            evidence_id, limiar=limiar, investigation_id=investigation_id
+        )
+    ]
+
+
+@attachments_router.post("", status_code=201)
+def upload_attachment(
+    arquivo: UploadFile,
+    investigation_id: UUID,
+    _session: Session = Depends(get_investigation_session),
+    blob_store: BlobStore = Depends(get_blob_store),
+):
+    # UploadFile já é um arquivo temporário em disco; o BlobStore
+    # lê em blocos, sem carregar o anexo inteiro em memória. A
+    # investigação fica como dona do anexo até ser expurgada
+    location = blob_store.put(arquivo.file, owner=str(investigation_id))
+    return location.to_dado(content_type=arquivo.content_type)
+
+
+@attachments_router.get("/{sha256}")
+def download_attachment(
+    investigation_id: UUID,
+    sha256: str,
+    _session: Session = Depends(get_investigation_session),
+    blob_store: BlobStore = Depends(get_blob_store),
+):
+    # Só a investigação que anexou o conteúdo pode lê-lo: o sha256 é
+    # compartilhado entre investigações pela deduplicação
+    location = blob_store.locate(sha256, owner=str(investigation_id))
+
+    if not location:
+        raise HTTPException(status_code=404, detail="Anexo não encontrado.")
+
+    # Os middlewares podem enfileirar o bloco depois que o iterador avança
+    # e libera o memoryview: cada bloco é copiado antes de ser entregue
+    return StreamingResponse(
+        (bytes(chunk) for chunk in blob_store.iter_chunks(location)),
+        media_type="application/octet-stream",
+        headers={
+            "Content-Length": str(location.length),
+            "ETag": f'"{sha256}"',
+        },
+    )
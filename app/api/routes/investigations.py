@@ -0,0 +1,71 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+
+from app.api.dependencies import get_investigation_repository
+from app.domain.entities.investigation import Investigation
+from app.domain.exceptions.domain_exceptions import DomainValidationError
+from app.domain.value_objects.base_legal import LegalBasisType
+from app.interfaces.repositories.investigation_repository import InvestigationRepository
+from app.use_cases.investigation.create_investigation import (
+    CreateInvestigation,
+    CreateInvestigationInput,
+)
+
+
+router = APIRouter(prefix="/investigations", tags=["investigations"])
+
+
+class CreateInvestigationRequest(BaseModel):
+    titulo: str
+    objetivo: str
+    fundamento_legal: LegalBasisType
+    descricao_base_legal: str
+    consentimento: bool = False
+
+
+def _resumo(investigation: Investigation) -> dict:
+    return {
+        "id": str(investigation.id),
+        "titulo": investigation.titulo,
+        "finalidade": investigation.finalidade,
+        "fundamento_legal": investigation.base_legal.fundamento.value,
+        "status": investigation.status.value,
+        "data_criacao": investigation.data_criacao.isoformat(),
+    }
+
+
+@router.post("", status_code=201)
+def create_investigation(
+    request: CreateInvestigationRequest,
+    investigation_repository: InvestigationRepository = Depends(
+        get_investigation_repository
+    ),
+):
+    try:
+        investigation = CreateInvestigation(investigation_repository).execute(
+            CreateInvestigationInput(**request.model_dump())
+        )
+    except DomainValidationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    return _resumo(investigation)
+
+
+@router.get("/{investigation_id}")
+def get_investigation(
+    investigation_id: UUID,
+    investigation_repository: InvestigationRepository = Depends(
+        get_investigation_repository
+    ),
+):
+    try:
+        investigation = investigation_repository.get_by_id(investigation_id)
+    except DomainValidationError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+
+    if not investigation:
+        raise HTTPException(status_code=404, detail="Investigação não encontrada.")
+
+    return _resumo(investigation)
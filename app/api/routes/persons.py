@@ -0,0 +1,39 @@
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.api.dependencies import get_person_repository
+from app.domain.exceptions.domain_exceptions import DomainValidationError
+from app.interfaces.repositories.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.interfaces.repositories.person_repository import PersonRepository
+
+
+router = APIRouter(prefix="/investigations/{investigation_id}/persons", tags=["persons"])
+
+
+@router.get("")
+def list_persons(
+    investigation_id: UUID,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    person_repository: PersonRepository = Depends(get_person_repository),
+):
+    try:
+        page = person_repository.list_page(
+            investigation_id, cursor=cursor, limit=limit
+        )
+    except DomainValidationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    return {
+        "items": [
+            {
+                "id": str(person.id),
+                "display_name": person.display_name,
+                "created_at": person.created_at.isoformat(),
+            }
+            for person in page.items
+        ],
+        "next_cursor": page.next_cursor,
+    }
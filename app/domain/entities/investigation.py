@@ -4,6 +4,7 @@ from enum import Enum
 from typing import List, Optional
 
 from app.domain.value_objects.base_legal import BaseLegal
+from app.domain.value_objects.collection_budget import CollectionBudget, CollectionUsage
 from app.domain.exceptions.domain_exceptions import DomainValidationError
 
 
@@ -38,6 +39,8 @@ class Investigation:
         self.scope: Optional[str] = None
         self.allowed_sources: Optional[List[str]] = None
         self.legal_notes: Optional[str] = None
+        self.collection_budget: Optional[CollectionBudget] = None
+        self.collection_usage: CollectionUsage = CollectionUsage()
 
         # Ciclo de vida
         self.status: InvestigationStatus = InvestigationStatus.ABERTA
@@ -73,6 +76,7 @@ class Investigation:
         scope: str,
         allowed_sources: List[str],
         legal_notes: Optional[str] = None,
+        collection_budget: Optional[CollectionBudget] = None,
     ) -> None:
         if self.planejamento_definido():
             raise DomainValidationError(
@@ -94,6 +98,7 @@ class Investigation:
         self.scope = scope.strip()
         self.allowed_sources = allowed_sources
         self.legal_notes = legal_notes.strip() if legal_notes else None
+        self.collection_budget = collection_budget
 
     # =========================
     # CICLO DE VIDA
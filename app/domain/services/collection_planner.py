@@ -0,0 +1,91 @@
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Mapping
+
+from app.domain.entities.identifier import Identifier
+
+
+# Peso do tempo (em unidades de custo por segundo) na priorização
+CUSTO_POR_SEGUNDO = 0.1
+
+
+@dataclass(frozen=True)
+class SourceProfile:
+    """
+    Histórico de uma fonte OSINT: latência média, taxa de sucesso
+    (consultas que geraram evidência) e custo de cota por consulta.
+    `tipos_suportados` vazio significa que a fonte aceita qualquer tipo.
+    """
+
+    fonte: str
+    latencia_media: float = 1.0
+    taxa_sucesso: float = 0.5
+    custo_por_chamada: float = 1.0
+    tipos_suportados: FrozenSet[str] = field(default_factory=frozenset)
+
+    def aceita(self, identifier: Identifier) -> bool:
+        return not self.tipos_suportados or (
+            identifier.tipo.value in self.tipos_suportados
+        )
+
+    @property
+    def rendimento(self) -> float:
+        """
+        Evidências esperadas por unidade de custo (cota + tempo).
+        """
+
+        custo_efetivo = self.custo_por_chamada + self.latencia_media * CUSTO_POR_SEGUNDO
+        return self.taxa_sucesso / max(custo_efetivo, 1e-9)
+
+
+@dataclass(frozen=True)
+class PlannedLookup:
+    identifier: Identifier
+    fonte: str
+    custo_estimado: float
+    latencia_estimada: float
+    rendimento: float
+
+
+class CollectionPlanner:
+    """
+    Serviço de domínio que monta o plano de execução de uma coleta:
+    descarta pares identificador/fonte incompatíveis e ordena as consultas
+    das mais baratas e produtivas para as mais caras.
+    """
+
+    def plan(
+        self,
+        identifiers: List[Identifier],
+        sources: List[str],
+        perfis: Mapping[str, SourceProfile],
+    ) -> List[PlannedLookup]:
+        consultas: List[PlannedLookup] = []
+
+        for fonte in dict.fromkeys(sources):
+            perfil = perfis.get(fonte) or SourceProfile(fonte=fonte)
+
+            for identifier in identifiers:
+                if not perfil.aceita(identifier):
+                    continue
+
+                consultas.append(
+                    PlannedLookup(
+                        identifier=identifier,
+                        fonte=fonte,
+                        custo_estimado=perfil.custo_por_chamada,
+                        latencia_estimada=perfil.latencia_media,
+                        rendimento=perfil.rendimento,
+                    )
+                )
+
+        # Ordenação estável: empates preservam a ordem solicitada
+        consultas.sort(key=lambda consulta: -consulta.rendimento)
+        return consultas
+
+    @staticmethod
+    def estimar(consultas: List[PlannedLookup]) -> Dict[str, float]:
+        return {
+            "chamadas": len(consultas),
+            "custo": sum(c.custo_estimado for c in consultas),
+            "tempo_segundos": sum(c.latencia_estimada for c in consultas),
+        }
@@ -0,0 +1,110 @@
+from typing import Any, Dict, Optional
+
+from app.domain.exceptions.domain_exceptions import DomainValidationError
+
+
+class CollectionBudget:
+    """
+    Value Object que representa o orçamento de coleta OSINT de uma
+    investigação: número de consultas, tempo total e custo de cota.
+    Limites ausentes (None) não são aplicados.
+    """
+
+    def __init__(
+        self,
+        max_chamadas: Optional[int] = None,
+        max_tempo_segundos: Optional[float] = None,
+        max_custo: Optional[float] = None,
+    ):
+        self.max_chamadas = max_chamadas
+        self.max_tempo_segundos = max_tempo_segundos
+        self.max_custo = max_custo
+
+        self._validar()
+
+    # =========================
+    # REGRAS DE NEGÓCIO
+    # =========================
+
+    def _validar(self) -> None:
+        for nome, valor in (
+            ("chamadas", self.max_chamadas),
+            ("tempo", self.max_tempo_segundos),
+            ("custo", self.max_custo),
+        ):
+            if valor is not None and valor <= 0:
+                raise DomainValidationError(
+                    f"Limite de {nome} do orçamento deve ser positivo."
+                )
+
+    def permite(
+        self,
+        consumo: "CollectionUsage",
+        custo_estimado: float = 0.0,
+        tempo_estimado: float = 0.0,
+    ) -> bool:
+        """
+        Indica se mais uma consulta cabe no orçamento, dado o consumo atual.
+        """
+
+        if self.max_chamadas is not None and consumo.chamadas + 1 > self.max_chamadas:
+            return False
+
+        if (
+            self.max_custo is not None
+            and consumo.custo + custo_estimado > self.max_custo
+        ):
+            return False
+
+        if (
+            self.max_tempo_segundos is not None
+            and consumo.tempo_segundos + tempo_estimado > self.max_tempo_segundos
+        ):
+            return False
+
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "max_chamadas": self.max_chamadas,
+            "max_tempo_segundos": self.max_tempo_segundos,
+            "max_custo": self.max_custo,
+        }
+
+    # =========================
+    # VALUE OBJECT BEHAVIOR
+    # =========================
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CollectionBudget):
+            return False
+
+        return self.to_dict() == other.to_dict()
+
+
+class CollectionUsage:
+    """
+    Consumo acumulado do orçamento de coleta de uma investigação.
+    """
+
+    def __init__(
+        self,
+        chamadas: int = 0,
+        tempo_segundos: float = 0.0,
+        custo: float = 0.0,
+    ):
+        self.chamadas = chamadas
+        self.tempo_segundos = tempo_segundos
+        self.custo = custo
+
+    def registrar(self, tempo_segundos: float, custo: float) -> None:
+        self.chamadas += 1
+        self.tempo_segundos += tempo_segundos
+        self.custo += custo
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "chamadas": self.chamadas,
+            "tempo_segundos": self.tempo_segundos,
+            "custo": self.custo,
+        }
@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class EvidenceType(Enum):
+    """
+    Origem de uma evidência: coleta automatizada em fontes OSINT
+    ou registro manual feito pelo analista.
+    """
+
+    OSINT_AUTOMATED = "OSINT_AUTOMATED"
+    MANUAL = "MANUAL"
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class IdentifierType(Enum):
+    """
+    Tipos de identificador observável que podem ser vinculados a uma pessoa.
+    """
+
+    EMAIL = "EMAIL"
+    TELEFONE = "TELEFONE"
+    USERNAME = "USERNAME"
+    DOMINIO = "DOMINIO"
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from app.domain.entities.investigation import Investigation
+from app.domain.exceptions.domain_exceptions import DomainValidationError
+from app.domain.value_objects.base_legal import LegalBasisType
+
+
+# Prazos padrão de retenção após o encerramento, por base legal
+PRAZOS_PADRAO: Dict[LegalBasisType, timedelta] = {
+    LegalBasisType.CONSENTIMENTO: timedelta(days=365),
+    LegalBasisType.LEGITIMO_INTERESSE: timedelta(days=2 * 365),
+    LegalBasisType.OBRIGACAO_LEGAL: timedelta(days=5 * 365),
+    LegalBasisType.EXERCICIO_REGULAR_DIREITO: timedelta(days=5 * 365),
+    LegalBasisType.PROTECAO_CREDITO: timedelta(days=5 * 365),
+}
+
+
+class RetentionPolicy:
+    """
+    Value Object que define por quanto tempo os dados de uma investigação
+    encerrada podem ser mantidos, conforme sua base legal (LGPD).
+    """
+
+    def __init__(self, prazos: Optional[Dict[LegalBasisType, timedelta]] = None):
+        self.prazos: Dict[LegalBasisType, timedelta] = {
+            **PRAZOS_PADRAO,
+            **(prazos or {}),
+        }
+
+        self._validar()
+
+    def _validar(self) -> None:
+        for fundamento, prazo in self.prazos.items():
+            if not isinstance(fundamento, LegalBasisType):
+                raise DomainValidationError("Fundamento legal inválido.")
+
+            if prazo <= timedelta(0):
+                raise DomainValidationError(
+                    f"Prazo de retenção inválido para {fundamento.value}."
+                )
+
+    def prazo(self, fundamento: LegalBasisType) -> timedelta:
+        return self.prazos[fundamento]
+
+    def expira_em(self, investigation: Investigation) -> Optional[datetime]:
+        """
+        Data a partir da qual a investigação pode ser expurgada.
+        Investigações abertas não expiram.
+        """
+
+        if investigation.esta_ativa() or not investigation.data_encerramento:
+            return None
+
+        return investigation.data_encerramento + self.prazo(
+            investigation.base_legal.fundamento
+        )
+
+    def expirada(self, investigation: Investigation, agora: datetime) -> bool:
+        expiracao = self.expira_em(investigation)
+        return expiracao is not None and expiracao <= agora
@@ -0,0 +1,342 @@
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - plataformas sem flock
+    fcntl = None
+
+
+GENESIS_HASH = "0" * 64
+
+# Cada linha é o corpo canônico seguido do hash: `{...,"hash":"<hex>"}`
+_SUFIXO_HASH = b',"hash":"'
+_TAMANHO_SUFIXO = len(_SUFIXO_HASH) + len(GENESIS_HASH) + 2
+
+
+class AuditLogError(RuntimeError):
+    """
+    Falha de gravação ou leitura do log de auditoria.
+    """
+
+
+def _canonico(valor: Any) -> Any:
+    """
+    Converte `valor` em uma estrutura JSON pura: chaves sempre texto e
+    tipos não nativos (UUID, datetime, Enum...) como texto.
+    """
+
+    if isinstance(valor, dict):
+        return {str(chave): _canonico(item) for chave, item in valor.items()}
+    if isinstance(valor, (list, tuple, set, frozenset)):
+        return [_canonico(item) for item in valor]
+    if valor is None or isinstance(valor, (str, int, float, bool)):
+        return valor
+    return str(valor)
+
+
+def _serializar(corpo: Dict[str, Any]) -> bytes:
+    return json.dumps(
+        corpo, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _hash_entrada(hash_anterior: str, corpo: bytes) -> str:
+    return hashlib.sha256(hash_anterior.encode("ascii") + corpo).hexdigest()
+
+
+def _separar_linha(linha: bytes) -> "tuple[bytes, str]":
+    """
+    Separa uma linha gravada em (bytes exatos do corpo, hash registrado).
+    """
+
+    linha = linha.rstrip(b"\n")
+    sufixo = linha[-_TAMANHO_SUFIXO:]
+
+    if not sufixo.startswith(_SUFIXO_HASH) or not sufixo.endswith(b'"}'):
+        raise AuditLogError("Linha do log de auditoria malformada.")
+
+    corpo = linha[:-_TAMANHO_SUFIXO] + b"}"
+    return corpo, sufixo[len(_SUFIXO_HASH):-2].decode("ascii")
+
+
+class AuditLog:
+    """
+    Log de auditoria append-only da cadeia de custódia.
+
+    Cada entrada é uma linha JSON encadeada por hash à anterior
+    (`hash = sha256(hash_anterior || corpo)`), o que torna qualquer alteração,
+    remoção ou reordenação detectável por `verify_chain`. O hash cobre
+    exatamente os bytes gravados do corpo canônico.
+
+    A escrita usa group commit: `append` serializa e encadeia a entrada na
+    thread de quem chama e apenas a enfileira; uma thread escritora drena a
+    fila, grava o lote e faz um único fsync para todas as requisições
+    concorrentes daquele lote. Uma falha de gravação é repassada a quem
+    aguarda a durabilidade e bloqueia novas entradas, pois a cadeia em
+    memória deixa de corresponder ao arquivo.
+
+    A cauda da cadeia é mantida em memória, portanto só um processo pode
+    escrever no arquivo: a instância toma um `flock` exclusivo enquanto
+    estiver aberta e recusa a abertura se outro processo já o detém.
+    """
+
+    def __init__(self, path: str, max_batch: int = 1024):
+        self.path = path
+        self.max_batch = max_batch
+
+        self._pendentes: List[bytes] = []
+        self._cond = threading.Condition()
+        self._fechado = False
+        self._falha: Optional[BaseException] = None
+
+        diretorio = os.path.dirname(os.path.abspath(path))
+        os.makedirs(diretorio, exist_ok=True)
+
+        # O lock precede a leitura da cauda: outro escritor poderia
+        # estender a cadeia entre a leitura e a primeira gravação
+        self._arquivo = open(path, "ab")
+        self._travar_arquivo()
+
+        self._seq_enfileirada, self._ultimo_hash = self._recuperar_cauda()
+        self._seq_duravel = self._seq_enfileirada
+
+        self._writer = threading.Thread(
+            target=self._loop_escrita, name="audit-group-commit", daemon=True
+        )
+        self._writer.start()
+
+    # =========================
+    # API
+    # =========================
+
+    def ensure_available(self) -> None:
+        """
+        Falha antecipadamente se o log não aceitar novas entradas, para que
+        uma operação auditada não seja executada sem poder ser registrada.
+        """
+
+        with self._cond:
+            self._verificar_disponivel()
+
+    def append(
+        self,
+        acao: str,
+        ator: str,
+        detalhes: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Enfileira uma entrada e retorna seu número de sequência sem
+        aguardar o fsync. Use `wait_durable` quando a durabilidade for
+        necessária antes de responder.
+        """
+
+        entrada = {
+            "acao": acao,
+            "ator": ator,
+            "timestamp": datetime.utcnow().isoformat(),
+            "detalhes": _canonico(detalhes or {}),
+        }
+
+        with self._cond:
+            self._verificar_disponivel()
+
+            # Sequência e encadeamento sob o lock: a ordem da cadeia é a
+            # ordem da fila
+            seq = self._seq_enfileirada + 1
+            entrada["seq"] = seq
+            entrada["hash_anterior"] = self._ultimo_hash
+
+            corpo = _serializar(entrada)
+            self._ultimo_hash = _hash_entrada(self._ultimo_hash, corpo)
+
+            self._pendentes.append(
+                corpo[:-1] + _SUFIXO_HASH + self._ultimo_hash.encode("ascii") + b'"}\n'
+            )
+            self._seq_enfileirada = seq
+            self._cond.notify_all()
+
+        return seq
+
+    def wait_durable(self, seq: int, timeout: Optional[float] = None) -> bool:
+        with self._cond:
+            duravel = self._cond.wait_for(
+                lambda: self._seq_duravel >= seq or self._falha is not None,
+                timeout=timeout,
+            )
+
+            if self._seq_duravel < seq and self._falha is not None:
+                raise AuditLogError(
+                    "Falha ao gravar o log de auditoria."
+                ) from self._falha
+
+            return duravel
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        with self._cond:
+            alvo = self._seq_enfileirada
+        return self.wait_durable(alvo, timeout=timeout)
+
+    def close(self) -> None:
+        with self._cond:
+            if self._fechado:
+                return
+            self._fechado = True
+            self._cond.notify_all()
+
+        self._writer.join()
+        self._arquivo.close()
+
+    def _verificar_disponivel(self) -> None:
+        if self._fechado:
+            raise AuditLogError("Log de auditoria encerrado.")
+
+        if self._falha is not None:
+            raise AuditLogError("Log de auditoria indisponível.") from self._falha
+
+    def _travar_arquivo(self) -> None:
+        if fcntl is None:
+            return
+
+        try:
+            fcntl.flock(self._arquivo.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError as exc:
+            self._arquivo.close()
+            raise AuditLogError(
+                "Log de auditoria já aberto para escrita por outro processo."
+            ) from exc
+
+    # =========================
+    # GROUP COMMIT
+    # =========================
+
+    def _loop_escrita(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pendentes or self._fechado)
+
+                if not self._pendentes and self._fechado:
+                    return
+
+                lote = self._pendentes[: self.max_batch]
+                del self._pendentes[: self.max_batch]
+                seq_lote = self._seq_duravel + len(lote)
+
+            try:
+                self._arquivo.write(b"".join(lote))
+                self._arquivo.flush()
+                os.fsync(self._arquivo.fileno())
+            except Exception as exc:
+                # Entradas seguintes já estão encadeadas a este lote:
+                # descarta a fila e passa a recusar novas entradas
+                with self._cond:
+                    self._falha = exc
+                    self._pendentes.clear()
+                    self._cond.notify_all()
+                continue
+
+            with self._cond:
+                self._seq_duravel = seq_lote
+                self._cond.notify_all()
+
+    def _recuperar_cauda(self) -> "tuple[int, str]":
+        """
+        Lê apenas a última linha completa do arquivo para continuar a
+        cadeia. Uma linha parcial no fim (queda durante a gravação) nunca
+        foi confirmada como durável e é descartada com truncate.
+        """
+
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return 0, GENESIS_HASH
+
+        with open(self.path, "r+b") as arquivo:
+            tamanho = arquivo.seek(0, os.SEEK_END)
+            posicao = tamanho
+            bloco = b""
+
+            # Lê do fim até conter a última linha completa inteira
+            while posicao > 0:
+                leitura = min(4096, posicao)
+                posicao -= leitura
+                arquivo.seek(posicao)
+                bloco = arquivo.read(leitura) + bloco
+
+                fim = bloco.rfind(b"\n")
+                if fim != -1 and bloco.rfind(b"\n", 0, fim) != -1:
+                    break
+
+            fim = bloco.rfind(b"\n")
+            parcial = len(bloco) - (fim + 1)
+            if parcial:
+                arquivo.truncate(tamanho - parcial)
+                arquivo.flush()
+                os.fsync(arquivo.fileno())
+
+        if fim == -1:
+            return 0, GENESIS_HASH
+
+        ultima = bloco[bloco.rfind(b"\n", 0, fim) + 1:fim]
+        corpo, hash_registrado = _separar_linha(ultima)
+        return json.loads(corpo)["seq"], hash_registrado
+
+
+# =========================
+# VERIFICAÇÃO
+# =========================
+
+
+@dataclass
+class ChainVerification:
+    valida: bool
+    entradas: int
+    erro: Optional[str] = None
+    seq_erro: Optional[int] = None
+
+
+def verify_chain(path: str) -> ChainVerification:
+    """
+    Verifica a cadeia de hashes em streaming, linha a linha,
+    com memória constante.
+    """
+
+    hash_anterior = GENESIS_HASH
+    seq_esperada = 1
+    total = 0
+
+    with open(path, "rb") as arquivo:
+        for linha in arquivo:
+            try:
+                corpo, hash_registrado = _separar_linha(linha)
+                entrada = json.loads(corpo)
+            except (AuditLogError, ValueError):
+                return ChainVerification(
+                    False, total, "Linha malformada.", seq_esperada
+                )
+
+            seq = entrada.get("seq")
+
+            if seq != seq_esperada:
+                return ChainVerification(
+                    False, total, "Sequência fora de ordem.", seq
+                )
+
+            if entrada.get("hash_anterior") != hash_anterior:
+                return ChainVerification(
+                    False, total, "Encadeamento quebrado.", seq
+                )
+
+            if _hash_entrada(hash_anterior, corpo) != hash_registrado:
+                return ChainVerification(
+                    False, total, "Hash da entrada não confere.", seq
+                )
+
+            hash_anterior = hash_registrado
+            seq_esperada += 1
+            total += 1
+
+    return ChainVerification(True, total)
@@ -0,0 +1,154 @@
+import contextvars
+import functools
+import hashlib
+import hmac
+import json
+import os
+import threading
+from dataclasses import asdict, fields, is_dataclass
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID
+
+from app.domain.exceptions.domain_exceptions import DomainValidationError
+from app.infrastructure.audit.audit_log import AuditLog
+
+
+AUDIT_LOG_PATH = os.getenv("OSINT_AUDIT_LOG_PATH", "./audit/custody.log")
+AUDIT_ACTOR_HEADER = "X-Actor"
+
+# Chave do servidor para o digest das entradas: sem ela, um sha256 simples
+# de dados de baixa entropia (um e-mail, um CPF) seria revertido por força
+# bruta. Sem chave configurada, apenas os ids são registrados.
+AUDIT_DIGEST_KEY = os.getenv("OSINT_AUDIT_DIGEST_KEY")
+ATOR_PADRAO = "SISTEMA"
+
+_audit_log: Optional[AuditLog] = None
+_audit_lock = threading.Lock()
+
+# Ator responsável pela execução corrente (definido pela camada de API)
+_ator_atual: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "audit_actor", default=ATOR_PADRAO
+)
+
+
+def get_audit_log() -> AuditLog:
+    global _audit_log
+
+    with _audit_lock:
+        if _audit_log is None:
+            _audit_log = AuditLog(AUDIT_LOG_PATH)
+        return _audit_log
+
+
+def close_audit_log() -> None:
+    global _audit_log
+
+    with _audit_lock:
+        if _audit_log is not None:
+            _audit_log.close()
+            _audit_log = None
+
+
+def set_audit_actor(ator: str) -> contextvars.Token:
+    return _ator_atual.set(ator)
+
+
+def reset_audit_actor(token: contextvars.Token) -> None:
+    _ator_atual.reset(token)
+
+
+def audited(func: Callable) -> Callable:
+    """
+    Decorator para `execute` de use cases: registra cada execução
+    (sucesso ou falha) no log de auditoria da cadeia de custódia.
+
+    O registro é feito após a execução, preservando a ordem de
+    persistência definida pelo próprio use case; a disponibilidade do log
+    é conferida antes, para que a operação não rode sem registro. Como o
+    log não pode ser editado nem expurgado, entradas e resultados são
+    registrados apenas por referência (ids e digests), nunca pelo conteúdo.
+    """
+
+    acao = func.__qualname__.split(".")[0]
+
+    @functools.wraps(func)
+    def wrapper(self, input_data: Any, *args, **kwargs):
+        audit_log = get_audit_log()
+        audit_log.ensure_available()
+
+        detalhes: Dict[str, Any] = {"entrada": _resumir_entrada(input_data)}
+
+        try:
+            resultado = func(self, input_data, *args, **kwargs)
+        except Exception as exc:
+            detalhes["status"] = "ERRO"
+            detalhes["erro"] = _resumir_erro(exc)
+            try:
+                audit_log.append(acao, _ator_atual.get(), detalhes)
+            except Exception as falha_log:
+                # O erro do use case segue como causa da falha de registro
+                raise falha_log from exc
+            raise
+
+        detalhes["status"] = "OK"
+        detalhes["resultado"] = _resumir_resultado(resultado)
+        audit_log.append(acao, _ator_atual.get(), detalhes)
+
+        return resultado
+
+    return wrapper
+
+
+def _resumir_entrada(input_data: Any) -> Dict[str, Any]:
+    """
+    Mantém apenas os ids da entrada e um HMAC do conteúdo completo, que
+    permite a quem detém a chave conferir a entrada original sem que ela
+    seja registrada.
+    """
+
+    if not is_dataclass(input_data):
+        return {}
+
+    resumo: Dict[str, Any] = {}
+    for campo in fields(input_data):
+        valor = getattr(input_data, campo.name)
+        if isinstance(valor, UUID):
+            resumo[campo.name] = str(valor)
+
+    if AUDIT_DIGEST_KEY:
+        conteudo = json.dumps(
+            asdict(input_data), sort_keys=True, ensure_ascii=False, default=str
+        ).encode("utf-8")
+        resumo["digest"] = hmac.new(
+            AUDIT_DIGEST_KEY.encode("utf-8"), conteudo, hashlib.sha256
+        ).hexdigest()
+
+    return resumo
+
+
+def _resumir_resultado(resultado: Any) -> Any:
+    """
+    Registra apenas referências (id e hash de integridade), nunca o
+    conteúdo coletado.
+    """
+
+    if resultado is None:
+        return None
+
+    if isinstance(resultado, (list, tuple)):
+        return [_resumir_resultado(item) for item in resultado]
+
+    resumo: Dict[str, Any] = {}
+    for campo in ("id", "hash_integridade"):
+        valor = getattr(resultado, campo, None)
+        if valor is not None:
+            resumo[campo] = valor
+
+    return resumo or type(resultado).__name__
+
+
+def _resumir_erro(exc: Exception) -> str:
+    # Mensagens de domínio são textos fixos; as demais podem conter dados
+    if isinstance(exc, DomainValidationError):
+        return f"{type(exc).__name__}: {exc}"
+    return type(exc).__name__
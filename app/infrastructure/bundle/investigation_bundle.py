@@ -0,0 +1,476 @@
+import hashlib
+import hmac
+import json
+import struct
+import zlib
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+from uuid import UUID
+
+from sqlalchemy import DateTime, delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.domain.entities.evidence import Evidence
+from app.domain.exceptions.domain_exceptions import DomainValidationError
+from app.domain.value_objects.evidence_type import EvidenceType
+from app.infrastructure.persistence.sqlite.database import Base
+from app.infrastructure.persistence.sqlite.models import (
+    BundleImportModel,
+    EvidenceModel,
+    IdentifierModel,
+    InvestigationModel,
+    PersonModel,
+)
+from app.infrastructure.persistence.sqlite.repositories.evidence_similarity_repo import (
+    SQLiteEvidenceSimilarityRepository,
+)
+from app.infrastructure.persistence.sqlite.sharding import (
+    ShardNotFoundError,
+    ShardRouter,
+)
+
+
+FORMATO = "osint-bundle/2"
+MAGIC = b"OSINTBND1\n"
+TRAILER_MAGIC = b"OSINTEND"
+
+# Cabeçalho de frame: tipo (4 bytes), tamanho comprimido, tamanho original
+_FRAME = struct.Struct(">4sII")
+# Trailer: offset do índice, offset do manifesto, magic
+_TRAILER = struct.Struct(">QQ8s")
+
+# Um frame fecha no que vier primeiro: limite de registros ou de bytes
+# (JSON sem compressão). Um único registro maior que o limite ocupa um
+# frame sozinho.
+REGISTROS_POR_CHUNK = 2000
+BYTES_POR_FRAME = 4 * 1024 * 1024
+MAX_BYTES_FRAME = 256 * 1024 * 1024
+YIELD_PER = 1000
+
+TIPO_INVESTIGACAO = b"INVS"
+TIPO_PESSOA = b"PERS"
+TIPO_IDENTIFICADOR = b"IDNT"
+TIPO_EVIDENCIA = b"EVID"
+TIPO_INDICE = b"INDX"
+TIPO_MANIFESTO = b"MNFT"
+
+# Ordem de carga respeita as chaves estrangeiras
+_MODELOS: Dict[bytes, Type[Base]] = {
+    TIPO_INVESTIGACAO: InvestigationModel,
+    TIPO_PESSOA: PersonModel,
+    TIPO_IDENTIFICADOR: IdentifierModel,
+    TIPO_EVIDENCIA: EvidenceModel,
+}
+
+
+def _serializar(model: Base) -> Dict[str, Any]:
+    linha = {}
+    for coluna in model.__table__.columns:
+        valor = getattr(model, coluna.key)
+        linha[coluna.key] = valor.isoformat() if isinstance(valor, datetime) else valor
+    return linha
+
+
+def _desserializar(modelo: Type[Base], linha: Dict[str, Any]) -> Dict[str, Any]:
+    for coluna in modelo.__table__.columns:
+        valor = linha.get(coluna.key)
+        if valor is not None and isinstance(coluna.type, DateTime):
+            linha[coluna.key] = datetime.fromisoformat(valor)
+    return linha
+
+
+def _assinar(manifesto: Dict[str, Any], chave: Optional[bytes]) -> str:
+    conteudo = json.dumps(manifesto, sort_keys=True).encode("utf-8")
+    if chave:
+        return hmac.new(chave, conteudo, hashlib.sha256).hexdigest()
+    return hashlib.sha256(conteudo).hexdigest()
+
+
+class BundleExporter:
+    """
+    Exporta uma investigação (pessoas, identificadores e evidências) para
+    um arquivo único, em frames comprimidos independentes.
+
+    Os registros são lidos do banco em streaming (`yield_per`) e gravados
+    em chunks limitados em registros e em bytes, então o uso de memória
+    não depende do tamanho da investigação. Ao final são gravados um
+    índice dos frames e um manifesto assinado (HMAC quando há chave) com
+    o digest encadeado dos `hash_integridade` das evidências e um digest
+    por tipo de frame sobre os bytes de todos os frames daquele tipo.
+    """
+
+    def __init__(self, session: Session, chave_assinatura: Optional[bytes] = None):
+        self.session = session
+        self.chave_assinatura = chave_assinatura
+
+    def export(self, investigation_id: UUID, destino: BinaryIO) -> Dict[str, Any]:
+        investigation = self.session.get(InvestigationModel, str(investigation_id))
+
+        if not investigation:
+            raise DomainValidationError("Investigação não encontrada.")
+
+        destino.write(MAGIC)
+        offset = len(MAGIC)
+        indice: List[Dict[str, Any]] = []
+        contagens: Dict[str, int] = {}
+        digest = hashlib.sha256()
+        digests_frames: Dict[str, str] = {}
+
+        investigation_id_str = str(investigation_id)
+        consultas = {
+            TIPO_INVESTIGACAO: select(InvestigationModel).where(
+                InvestigationModel.id == investigation_id_str
+            ),
+            TIPO_PESSOA: select(PersonModel)
+            .where(PersonModel.investigation_id == investigation_id_str)
+            .order_by(PersonModel.created_at, PersonModel.id),
+            TIPO_IDENTIFICADOR: select(IdentifierModel)
+            .join(PersonModel, PersonModel.id == IdentifierModel.person_id)
+            .where(PersonModel.investigation_id == investigation_id_str)
+            .order_by(IdentifierModel.id),
+            TIPO_EVIDENCIA: select(EvidenceModel)
+            .where(EvidenceModel.investigation_id == investigation_id_str)
+            .order_by(EvidenceModel.data_coleta, EvidenceModel.id),
+        }
+
+        for tipo, consulta in consultas.items():
+            total = 0
+            digest_tipo = hashlib.sha256()
+            modelos = self.session.scalars(
+                consulta.execution_options(yield_per=YIELD_PER)
+            )
+
+            for registros, bruto in self._chunks(modelos, tipo, digest):
+                digest_tipo.update(bruto)
+                tamanho = self._escrever_bruto(destino, tipo, bruto)
+                indice.append(
+                    {"tipo": tipo.decode(), "offset": offset, "registros": registros}
+                )
+                offset += tamanho
+                total += registros
+
+            contagens[tipo.decode()] = total
+            digests_frames[tipo.decode()] = digest_tipo.hexdigest()
+
+        offset_indice = offset
+        offset += self._escrever_frame(destino, TIPO_INDICE, indice)
+
+        manifesto = {
+            "formato": FORMATO,
+            "investigation_id": investigation_id_str,
+            "contagens": contagens,
+            "digest_evidencias": digest.hexdigest(),
+            "digests_frames": digests_frames,
+            "exportado_em": datetime.utcnow().isoformat(),
+        }
+        manifesto["assinatura"] = _assinar(manifesto, self.chave_assinatura)
+
+        offset_manifesto = offset
+        self._escrever_frame(destino, TIPO_MANIFESTO, manifesto)
+        destino.write(_TRAILER.pack(offset_indice, offset_manifesto, TRAILER_MAGIC))
+
+        return manifesto
+
+    @staticmethod
+    def _chunks(
+        modelos: Iterable[Base], tipo: bytes, digest: Any
+    ) -> Iterator[Tuple[int, bytes]]:
+        """
+        Agrupa os registros já serializados em frames (lista JSON) e
+        devolve (quantidade de registros, bytes do frame).
+        """
+
+        chunk: List[bytes] = []
+        tamanho = 0
+
+        for modelo in modelos:
+            linha = _serializar(modelo)
+            if tipo == TIPO_EVIDENCIA:
+                digest.update(linha["hash_integridade"].encode("ascii"))
+
+            registro = json.dumps(linha, ensure_ascii=False).encode("utf-8")
+            if chunk and tamanho + len(registro) > BYTES_POR_FRAME:
+                yield len(chunk), b"[" + b",".join(chunk) + b"]"
+                chunk, tamanho = [], 0
+
+            chunk.append(registro)
+            tamanho += len(registro) + 1
+
+            if len(chunk) >= REGISTROS_POR_CHUNK:
+                yield len(chunk), b"[" + b",".join(chunk) + b"]"
+                chunk, tamanho = [], 0
+
+        if chunk:
+            yield len(chunk), b"[" + b",".join(chunk) + b"]"
+
+    @classmethod
+    def _escrever_frame(cls, destino: BinaryIO, tipo: bytes, conteudo: Any) -> int:
+        bruto = json.dumps(conteudo, ensure_ascii=False).encode("utf-8")
+        return cls._escrever_bruto(destino, tipo, bruto)
+
+    @staticmethod
+    def _escrever_bruto(destino: BinaryIO, tipo: bytes, bruto: bytes) -> int:
+        comprimido = zlib.compress(bruto, 6)
+        destino.write(_FRAME.pack(tipo, len(comprimido), len(bruto)))
+        destino.write(comprimido)
+        return _FRAME.size + len(comprimido)
+
+
+class BundleImporter:
+    """
+    Importa um bundle gerado pelo BundleExporter.
+
+    A importação exige a chave de assinatura: sem ela, o manifesto só
+    carrega um sha256, que qualquer um recalcula, e o bundle é recusado a
+    menos que `aceitar_sem_assinatura` seja informado explicitamente.
+
+    O bundle é percorrido duas vezes, frame a frame e com memória
+    constante. A primeira passagem apenas confere: cada evidência é
+    reconstruída como entidade e seu `hash_integridade` recalculado, e o
+    digest dos bytes de cada tipo de frame e as contagens são comparados
+    com o manifesto; nada é gravado se houver divergência. A segunda
+    carrega cada frame em sua própria transação, junto com o marcador de
+    progresso em `bundle_imports`, de modo que nenhuma transação cresce
+    com o tamanho do bundle e uma importação interrompida é retomada do
+    frame seguinte ao último confirmado. As evidências importadas são
+    indexadas para a busca de similares na mesma transação do frame.
+
+    Com `router` (layout particionado), o shard da investigação é criado
+    no catálogo antes da carga.
+    """
+
+    def __init__(
+        self,
+        session: Optional[Session],
+        chave_assinatura: Optional[bytes] = None,
+        aceitar_sem_assinatura: bool = False,
+        router: Optional[ShardRouter] = None,
+    ):
+        if session is None and router is None:
+            raise ValueError("Informe session ou router.")
+
+        self.session = session
+        self.chave_assinatura = chave_assinatura
+        self.aceitar_sem_assinatura = aceitar_sem_assinatura
+        self.router = router
+
+    def read_manifest(self, origem: BinaryIO) -> Dict[str, Any]:
+        if not self.chave_assinatura and not self.aceitar_sem_assinatura:
+            raise DomainValidationError(
+                "Importação exige a chave de assinatura do bundle."
+            )
+
+        tamanho = origem.seek(0, 2)
+        if tamanho < len(MAGIC) + _TRAILER.size:
+            raise DomainValidationError("Bundle truncado ou corrompido.")
+
+        origem.seek(0)
+        if origem.read(len(MAGIC)) != MAGIC:
+            raise DomainValidationError("Arquivo não é um bundle de investigação.")
+
+        origem.seek(-_TRAILER.size, 2)
+        _, offset_manifesto, magic = _TRAILER.unpack(origem.read(_TRAILER.size))
+        if magic != TRAILER_MAGIC or offset_manifesto >= tamanho - _TRAILER.size:
+            raise DomainValidationError("Bundle truncado ou corrompido.")
+
+        origem.seek(offset_manifesto)
+        tipo, manifesto = self._ler_frame(origem)
+        if tipo != TIPO_MANIFESTO or not isinstance(manifesto, dict):
+            raise DomainValidationError("Manifesto do bundle não encontrado.")
+
+        assinatura = manifesto.pop("assinatura", None)
+        if not isinstance(assinatura, str) or not hmac.compare_digest(
+            assinatura, _assinar(manifesto, self.chave_assinatura)
+        ):
+            raise DomainValidationError("Assinatura do manifesto inválida.")
+
+        if manifesto.get("formato") != FORMATO:
+            raise DomainValidationError("Formato de bundle não suportado.")
+
+        manifesto["assinatura"] = assinatura
+        return manifesto
+
+    def import_(self, origem: BinaryIO) -> Dict[str, Any]:
+        manifesto = self.read_manifest(origem)
+        self._conferir(origem, manifesto)
+
+        session = self._sessao(UUID(manifesto["investigation_id"]))
+        try:
+            self._carregar(session, origem, manifesto)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            if session is not self.session:
+                session.close()
+
+        return manifesto
+
+    # =========================
+    # INTERNOS
+    # =========================
+
+    def _conferir(self, origem: BinaryIO, manifesto: Dict[str, Any]) -> None:
+        digest = hashlib.sha256()
+        digests_frames: Dict[str, Any] = {}
+        contagens: Dict[str, int] = {}
+
+        origem.seek(len(MAGIC))
+        for tipo, bruto in self._frames_de_dados(origem):
+            digests_frames.setdefault(tipo.decode(), hashlib.sha256()).update(bruto)
+
+            linhas = self._linhas(tipo, bruto)
+            if tipo == TIPO_EVIDENCIA:
+                for linha in linhas:
+                    self._verificar_evidencia(linha)
+                    digest.update(linha["hash_integridade"].encode("ascii"))
+
+            contagens[tipo.decode()] = contagens.get(tipo.decode(), 0) + len(linhas)
+
+        if digest.hexdigest() != manifesto["digest_evidencias"]:
+            raise DomainValidationError(
+                "Digest das evidências não confere com o manifesto."
+            )
+
+        vazio = hashlib.sha256().hexdigest()
+        for tipo, esperado in manifesto["digests_frames"].items():
+            calculado = digests_frames.get(tipo)
+            if (calculado.hexdigest() if calculado else vazio) != esperado:
+                raise DomainValidationError(
+                    f"Digest dos frames {tipo} não confere com o manifesto."
+                )
+
+        if set(digests_frames) - set(manifesto["digests_frames"]):
+            raise DomainValidationError("Frames não declarados no manifesto.")
+
+        if contagens != {k: v for k, v in manifesto["contagens"].items() if v}:
+            raise DomainValidationError(
+                "Contagem de registros não confere com o manifesto."
+            )
+
+    def _carregar(
+        self, session: Session, origem: BinaryIO, manifesto: Dict[str, Any]
+    ) -> None:
+        investigation_id = manifesto["investigation_id"]
+        marcador = session.get(BundleImportModel, investigation_id)
+
+        if marcador is None:
+            if session.get(InvestigationModel, investigation_id):
+                raise DomainValidationError("Investigação já existe no destino.")
+            carregados = 0
+        elif marcador.assinatura != manifesto["assinatura"]:
+            raise DomainValidationError(
+                "Investigação com importação de outro bundle em andamento."
+            )
+        else:
+            carregados = marcador.frames_carregados
+
+        similaridade = SQLiteEvidenceSimilarityRepository(session)
+
+        origem.seek(len(MAGIC))
+        for numero, (tipo, bruto) in enumerate(self._frames_de_dados(origem), 1):
+            if numero <= carregados:
+                continue
+
+            linhas = self._linhas(tipo, bruto)
+            session.execute(insert(_MODELOS[tipo]), linhas)
+            session.merge(
+                BundleImportModel(
+                    investigation_id=investigation_id,
+                    assinatura=manifesto["assinatura"],
+                    frames_carregados=numero,
+                    atualizado_em=datetime.utcnow(),
+                )
+            )
+
+            # Frame, marcador e índice de similaridade: uma única transação
+            if tipo == TIPO_EVIDENCIA:
+                similaridade.index_batch([self._entidade(linha) for linha in linhas])
+            session.commit()
+
+        session.execute(
+            delete(BundleImportModel).where(
+                BundleImportModel.investigation_id == investigation_id
+            )
+        )
+        session.commit()
+
+    def _sessao(self, investigation_id: UUID) -> Session:
+        if not self.router:
+            return self.session
+
+        try:
+            return self.router.session_for(investigation_id)
+        except ShardNotFoundError:
+            self.router.create(investigation_id)
+            return self.router.session_for(investigation_id)
+
+    def _frames_de_dados(self, origem: BinaryIO) -> Iterator[Tuple[bytes, bytes]]:
+        while True:
+            tipo, bruto = self._ler_bruto(origem)
+            if tipo == TIPO_INDICE:
+                return
+            if tipo not in _MODELOS:
+                raise DomainValidationError("Frame desconhecido no bundle.")
+            yield tipo, bruto
+
+    @staticmethod
+    def _linhas(tipo: bytes, bruto: bytes) -> List[Dict[str, Any]]:
+        modelo = _MODELOS[tipo]
+        linhas = [_desserializar(modelo, linha) for linha in json.loads(bruto)]
+
+        if modelo is IdentifierModel:
+            # Chave substituta local: o destino gera novos ids
+            for linha in linhas:
+                linha.pop("id", None)
+
+        return linhas
+
+    @classmethod
+    def _ler_frame(cls, origem: BinaryIO) -> Tuple[bytes, Any]:
+        tipo, bruto = cls._ler_bruto(origem)
+        try:
+            return tipo, json.loads(bruto)
+        except ValueError as exc:
+            raise DomainValidationError("Frame do bundle corrompido.") from exc
+
+    @staticmethod
+    def _ler_bruto(origem: BinaryIO) -> Tuple[bytes, bytes]:
+        cabecalho = origem.read(_FRAME.size)
+        if len(cabecalho) != _FRAME.size:
+            raise DomainValidationError("Bundle truncado ou corrompido.")
+
+        tipo, comprimido, bruto = _FRAME.unpack(cabecalho)
+        if bruto > MAX_BYTES_FRAME:
+            raise DomainValidationError("Frame do bundle excede o tamanho máximo.")
+
+        try:
+            # Limita a descompressão ao tamanho declarado no cabeçalho
+            dados = zlib.decompressobj().decompress(origem.read(comprimido), bruto + 1)
+        except zlib.error as exc:
+            raise DomainValidationError("Frame do bundle corrompido.") from exc
+
+        if len(dados) != bruto:
+            raise DomainValidationError("Frame do bundle corrompido.")
+
+        return tipo, dados
+
+    @staticmethod
+    def _entidade(linha: Dict[str, Any]) -> Evidence:
+        return Evidence(
+            investigation_id=UUID(linha["investigation_id"]),
+            person_id=UUID(linha["person_id"]) if linha["person_id"] else None,
+            tipo=EvidenceType(linha["tipo"]),
+            fonte=linha["fonte"],
+            dado=linha["dado"],
+            coletado_por=linha["coletado_por"],
+            evidence_id=UUID(linha["id"]),
+            data_coleta=linha["data_coleta"],
+        )
+
+    @classmethod
+    def _verificar_evidencia(cls, linha: Dict[str, Any]) -> None:
+        if cls._entidade(linha).hash_integridade != linha["hash_integridade"]:
+            raise DomainValidationError(
+                f"Hash de integridade divergente na evidência {linha['id']}."
+            )
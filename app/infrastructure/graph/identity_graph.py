@@ -0,0 +1,492 @@
+import threading
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from app.domain.entities.identifier import Identifier
+from app.interfaces.repositories.identifier_repository import IdentifierRepository
+from app.interfaces.services.identity_graph import (
+    GraphNode,
+    IdentifierKey,
+    IdentityGraphService,
+)
+
+
+# Prefixos do rótulo codificado de cada vértice
+_PESSOA = 0
+_IDENTIFICADOR = 1
+
+
+def _chave_pessoa(person_id: UUID) -> bytes:
+    return bytes((_PESSOA,)) + person_id.bytes
+
+
+def _chave_identificador(key: IdentifierKey) -> bytes:
+    tipo, valor = key
+    return (
+        bytes((_IDENTIFICADOR,))
+        + tipo.encode("utf-8")
+        + b"\x00"
+        + valor.encode("utf-8")
+    )
+
+
+def _decodificar(chave: bytes) -> GraphNode:
+    if chave[0] == _PESSOA:
+        return UUID(bytes=chave[1:])
+
+    tipo, valor = chave[1:].split(b"\x00", 1)
+    return tipo.decode("utf-8"), valor.decode("utf-8")
+
+
+@dataclass(frozen=True)
+class _CSR:
+    """
+    Adjacência compactada, imutável depois de construída: a compactação
+    monta uma nova e apenas troca a referência.
+    """
+
+    offsets: array
+    targets: array
+    nodes: int
+    edges: int
+
+
+class IdentityGraph(IdentityGraphService):
+    """
+    Grafo em memória de resolução de identidade.
+
+    Pessoas e identificadores normalizados são vértices de um grafo bipartido;
+    cada associação pessoa -> identificador é uma aresta. Componentes conexos
+    (clusters) são mantidos por union-find, de modo que pessoas que
+    compartilham identificadores — dentro ou entre investigações — caem no
+    mesmo cluster.
+
+    O armazenamento é baseado em arrays compactos (`array`): os rótulos dos
+    vértices ficam codificados em um único buffer de bytes, as arestas em
+    listas de adjacência no formato CSR e as arestas incrementais em um
+    overlay pequeno. Consultas leem CSR e overlay juntos, sem reconstruir.
+
+    Ao atingir COMPACTACAO_LIMITE arestas no overlay, um novo CSR é montado
+    em segundo plano a partir de uma cópia das arestas e trocado
+    atomicamente; a requisição que disparou a compactação não a aguarda.
+    Um lock protege union-find, overlay e a troca do CSR.
+    """
+
+    # Arestas incrementais acumuladas antes de compactar o CSR
+    COMPACTACAO_LIMITE = 65536
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._compactacao: Optional[threading.Thread] = None
+
+        # Rótulo codificado -> índice; rótulos em `_labels`, delimitados
+        # por `_label_offsets`
+        self._index: Dict[bytes, int] = {}
+        self._labels = bytearray()
+        self._label_offsets = array("q", [0])
+
+        # Union-find + lista circular de membros por componente
+        self._parent = array("q")
+        self._size = array("q")
+        self._next = array("q")
+
+        # Arestas (origem sempre pessoa, destino sempre identificador)
+        self._edge_src = array("q")
+        self._edge_dst = array("q")
+
+        # Adjacência CSR + overlay incremental
+        self._csr = _CSR(array("q", [0]), array("q"), 0, 0)
+        self._pending: Dict[int, List[int]] = {}
+
+    # =========================
+    # CONSTRUÇÃO
+    # =========================
+
+    @classmethod
+    def from_links(
+        cls, links: Iterable[Tuple[UUID, str, str]]
+    ) -> "IdentityGraph":
+        """
+        Constrói o grafo em uma única passagem sobre as linhas
+        (person_id, tipo, valor) da tabela de identificadores.
+        Os valores devem estar normalizados, como persistidos.
+        """
+
+        graph = cls()
+
+        for person_id, tipo, valor in links:
+            graph._link(person_id, (tipo, valor), overlay=False)
+
+        graph._deduplicar_arestas()
+        graph.compact()
+        return graph
+
+    @classmethod
+    def from_repository(cls, repository: IdentifierRepository) -> "IdentityGraph":
+        return cls.from_links(repository.iter_links())
+
+    def add_person(self, person_id: UUID) -> None:
+        with self._lock:
+            self._node(_chave_pessoa(person_id))
+
+    def add_link(self, person_id: UUID, identifier: Identifier) -> None:
+        """
+        Atualização incremental, chamada após persistir um novo
+        identificador de uma pessoa.
+        """
+
+        with self._lock:
+            self._link(person_id, (identifier.tipo.value, identifier.valor))
+
+            if (
+                self._pending_count() < self.COMPACTACAO_LIMITE
+                or self._compactacao is not None
+            ):
+                return
+
+            arestas = self._copiar_arestas()
+            self._compactacao = threading.Thread(
+                target=self._compactar,
+                args=arestas,
+                name="identity-graph-compaction",
+                daemon=True,
+            )
+            self._compactacao.start()
+
+    def compact(self) -> None:
+        """
+        Compacta o overlay no CSR de forma síncrona, aguardando uma
+        compactação em segundo plano que esteja em andamento.
+        """
+
+        with self._lock:
+            compactacao = self._compactacao
+
+        if compactacao is not None:
+            compactacao.join()
+
+        with self._lock:
+            arestas = self._copiar_arestas()
+
+        self._compactar(*arestas)
+
+    # =========================
+    # CONSULTAS
+    # =========================
+
+    def cluster_for(self, person_id: UUID) -> Dict[str, list]:
+        """
+        Retorna as pessoas e identificadores do cluster da pessoa informada.
+        """
+
+        persons: List[UUID] = []
+        identifiers: List[IdentifierKey] = []
+
+        with self._lock:
+            node = self._index.get(_chave_pessoa(person_id))
+
+            if node is None:
+                return {"persons": persons, "identifiers": identifiers}
+
+            current = node
+            while True:
+                label = self._label(current)
+                if isinstance(label, UUID):
+                    persons.append(label)
+                else:
+                    identifiers.append(label)
+
+                current = self._next[current]
+                if current == node:
+                    break
+
+        return {"persons": persons, "identifiers": identifiers}
+
+    def same_cluster(self, person_a: UUID, person_b: UUID) -> bool:
+        with self._lock:
+            return self._same_cluster(person_a, person_b)
+
+    def shortest_link_path(
+        self, person_a: UUID, person_b: UUID
+    ) -> Optional[List[GraphNode]]:
+        """
+        Menor cadeia de vínculos entre duas pessoas, alternando
+        pessoa -> identificador -> pessoa. Retorna None se não houver ligação.
+        """
+
+        with self._lock:
+            if not self._same_cluster(person_a, person_b):
+                return None
+
+            return self._menor_caminho(
+                self._index[_chave_pessoa(person_a)],
+                self._index[_chave_pessoa(person_b)],
+            )
+
+    @property
+    def node_count(self) -> int:
+        return len(self._label_offsets) - 1
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._edge_src)
+
+    # =========================
+    # INTERNOS - CONSULTAS
+    # =========================
+
+    def _same_cluster(self, person_a: UUID, person_b: UUID) -> bool:
+        a = self._index.get(_chave_pessoa(person_a))
+        b = self._index.get(_chave_pessoa(person_b))
+
+        if a is None or b is None:
+            return False
+
+        return self._find(a) == self._find(b)
+
+    def _menor_caminho(self, origem: int, destino: int) -> Optional[List[GraphNode]]:
+        if origem == destino:
+            return [self._label(origem)]
+
+        # BFS bidirecional: expande sempre a fronteira menor
+        pais_origem: Dict[int, int] = {origem: -1}
+        pais_destino: Dict[int, int] = {destino: -1}
+        fronteira_origem = deque([origem])
+        fronteira_destino = deque([destino])
+
+        while fronteira_origem and fronteira_destino:
+            if len(fronteira_origem) <= len(fronteira_destino):
+                encontro = self._expand(
+                    fronteira_origem, pais_origem, pais_destino
+                )
+            else:
+                encontro = self._expand(
+                    fronteira_destino, pais_destino, pais_origem
+                )
+
+            if encontro is not None:
+                return self._montar_caminho(encontro, pais_origem, pais_destino)
+
+        return None
+
+    # =========================
+    # INTERNOS - VÉRTICES E ARESTAS
+    # =========================
+
+    def _node(self, chave: bytes) -> int:
+        index = self._index.get(chave)
+        if index is not None:
+            return index
+
+        index = self.node_count
+        self._index[chave] = index
+        self._labels += chave
+        self._label_offsets.append(len(self._labels))
+        self._parent.append(index)
+        self._size.append(1)
+        self._next.append(index)
+        return index
+
+    def _label(self, node: int) -> GraphNode:
+        inicio = self._label_offsets[node]
+        fim = self._label_offsets[node + 1]
+        return _decodificar(bytes(self._labels[inicio:fim]))
+
+    def _link(
+        self, person_id: UUID, key: IdentifierKey, overlay: bool = True
+    ) -> None:
+        src = self._node(_chave_pessoa(person_id))
+        dst = self._node(_chave_identificador(key))
+
+        # Na carga em lote a deduplicação e o CSR são feitos ao final; o
+        # overlay só atende atualizações incrementais
+        if overlay:
+            if self._has_edge(src, dst):
+                return
+
+            self._pending.setdefault(src, []).append(dst)
+            self._pending.setdefault(dst, []).append(src)
+
+        self._edge_src.append(src)
+        self._edge_dst.append(dst)
+        self._union(src, dst)
+
+    def _has_edge(self, src: int, dst: int) -> bool:
+        # Percorre a adjacência da pessoa, que tem poucos identificadores
+        return any(vizinho == dst for vizinho in self._neighbors(src))
+
+    def _deduplicar_arestas(self) -> None:
+        """
+        Remove arestas repetidas da carga em lote: agrupa os destinos por
+        origem (counting sort em arrays) e ordena cada grupo, que é pequeno.
+        """
+
+        total_nodes = self.node_count
+        total_edges = len(self._edge_src)
+
+        inicio = array("q", bytes(8 * (total_nodes + 1)))
+        for src in self._edge_src:
+            inicio[src + 1] += 1
+        for i in range(total_nodes):
+            inicio[i + 1] += inicio[i]
+
+        cursor = array("q", inicio)
+        destinos = array("q", bytes(8 * total_edges))
+        for i in range(total_edges):
+            src = self._edge_src[i]
+            destinos[cursor[src]] = self._edge_dst[i]
+            cursor[src] += 1
+
+        edge_src = array("q")
+        edge_dst = array("q")
+        for node in range(total_nodes):
+            a, b = inicio[node], inicio[node + 1]
+            if a == b:
+                continue
+            for dst in sorted(set(destinos[a:b])):
+                edge_src.append(node)
+                edge_dst.append(dst)
+
+        self._edge_src = edge_src
+        self._edge_dst = edge_dst
+
+    # =========================
+    # INTERNOS - UNION-FIND
+    # =========================
+
+    def _find(self, node: int) -> int:
+        parent = self._parent
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+
+        # Compressão de caminho
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+
+        return root
+
+    def _union(self, a: int, b: int) -> None:
+        root_a = self._find(a)
+        root_b = self._find(b)
+
+        if root_a == root_b:
+            return
+
+        if self._size[root_a] < self._size[root_b]:
+            root_a, root_b = root_b, root_a
+
+        self._parent[root_b] = root_a
+        self._size[root_a] += self._size[root_b]
+
+        # Concatena as listas circulares de membros em O(1)
+        self._next[root_a], self._next[root_b] = (
+            self._next[root_b],
+            self._next[root_a],
+        )
+
+    # =========================
+    # INTERNOS - ADJACÊNCIA
+    # =========================
+
+    def _pending_count(self) -> int:
+        return len(self._edge_src) - self._csr.edges
+
+    def _copiar_arestas(self) -> Tuple[array, array, int]:
+        """
+        Cópia das arestas atuais para montar o CSR fora do lock.
+        Deve ser chamado com o lock.
+        """
+
+        return array("q", self._edge_src), array("q", self._edge_dst), self.node_count
+
+    def _compactar(self, edge_src: array, edge_dst: array, total_nodes: int) -> None:
+        csr = self._montar_csr(edge_src, edge_dst, total_nodes)
+
+        with self._lock:
+            self._csr = csr
+
+            # O overlay passa a conter só as arestas gravadas durante a
+            # montagem, que ficaram fora da cópia
+            self._pending = {}
+            for i in range(csr.edges, len(self._edge_src)):
+                src = self._edge_src[i]
+                dst = self._edge_dst[i]
+                self._pending.setdefault(src, []).append(dst)
+                self._pending.setdefault(dst, []).append(src)
+
+            if self._compactacao is threading.current_thread():
+                self._compactacao = None
+
+    @staticmethod
+    def _montar_csr(edge_src: array, edge_dst: array, total_nodes: int) -> _CSR:
+        total_edges = len(edge_src)
+
+        degree = array("q", bytes(8 * (total_nodes + 1)))
+        for i in range(total_edges):
+            degree[edge_src[i] + 1] += 1
+            degree[edge_dst[i] + 1] += 1
+
+        for i in range(total_nodes):
+            degree[i + 1] += degree[i]
+
+        offsets = degree
+        cursor = array("q", offsets)
+        targets = array("q", bytes(8 * 2 * total_edges))
+
+        for i in range(total_edges):
+            src = edge_src[i]
+            dst = edge_dst[i]
+            targets[cursor[src]] = dst
+            cursor[src] += 1
+            targets[cursor[dst]] = src
+            cursor[dst] += 1
+
+        return _CSR(offsets, targets, total_nodes, total_edges)
+
+    def _neighbors(self, node: int) -> Iterable[int]:
+        csr = self._csr
+        if node < csr.nodes:
+            yield from csr.targets[csr.offsets[node]:csr.offsets[node + 1]]
+        yield from self._pending.get(node, ())
+
+    def _expand(
+        self,
+        fronteira: deque,
+        pais: Dict[int, int],
+        pais_opostos: Dict[int, int],
+    ) -> Optional[int]:
+        for _ in range(len(fronteira)):
+            node = fronteira.popleft()
+            for vizinho in self._neighbors(node):
+                if vizinho in pais:
+                    continue
+                pais[vizinho] = node
+                if vizinho in pais_opostos:
+                    return vizinho
+                fronteira.append(vizinho)
+        return None
+
+    def _montar_caminho(
+        self,
+        encontro: int,
+        pais_origem: Dict[int, int],
+        pais_destino: Dict[int, int],
+    ) -> List[GraphNode]:
+        caminho: List[int] = []
+
+        node = encontro
+        while node != -1:
+            caminho.append(node)
+            node = pais_origem[node]
+        caminho.reverse()
+
+        node = pais_destino[encontro]
+        while node != -1:
+            caminho.append(node)
+            node = pais_destino[node]
+
+        return [self._label(i) for i in caminho]
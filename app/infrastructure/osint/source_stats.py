@@ -0,0 +1,149 @@
+import json
+import os
+import tempfile
+import threading
+from dataclasses import replace
+from typing import Dict, Iterable, Optional
+
+from app.domain.services.collection_planner import SourceProfile
+
+
+# Perfis estáticos das fontes (tipos suportados e custo de cota), em JSON:
+# {"fonte": {"tipos_suportados": ["EMAIL"], "custo_por_chamada": 2.0}}
+SOURCES_CONFIG_PATH = os.getenv("OSINT_SOURCES_CONFIG")
+
+# Histórico EWMA persistido entre reinícios do processo
+SOURCE_STATS_PATH = os.getenv("OSINT_SOURCE_STATS_PATH", "./source_stats.json")
+
+
+class SourceStatsRegistry:
+    """
+    Estatísticas históricas por fonte OSINT, atualizadas a cada consulta
+    por média móvel exponencial (EWMA), para alimentar o CollectionPlanner.
+
+    Os perfis são semeados pela configuração das fontes; o histórico
+    (latência e taxa de sucesso) é gravado em `path` por `salvar` e
+    recarregado na construção. Tipos suportados e custo sempre vêm da
+    configuração, para que uma mudança de cota valha no próximo reinício.
+    """
+
+    def __init__(
+        self,
+        perfis: Optional[Iterable[SourceProfile]] = None,
+        alpha: float = 0.2,
+        path: Optional[str] = None,
+    ):
+        self.alpha = alpha
+        self.path = path
+        self._perfis: Dict[str, SourceProfile] = {
+            perfil.fonte: perfil for perfil in perfis or ()
+        }
+        self._lock = threading.Lock()
+
+        self._carregar_historico()
+
+    @classmethod
+    def from_config(
+        cls, config_path: Optional[str], path: Optional[str] = None
+    ) -> "SourceStatsRegistry":
+        perfis = []
+
+        if config_path:
+            with open(config_path, "r", encoding="utf-8") as arquivo:
+                config = json.load(arquivo)
+
+            for fonte, dados in config.items():
+                perfis.append(
+                    SourceProfile(
+                        fonte=fonte,
+                        custo_por_chamada=float(dados.get("custo_por_chamada", 1.0)),
+                        tipos_suportados=frozenset(dados.get("tipos_suportados", ())),
+                    )
+                )
+
+        return cls(perfis, path=path)
+
+    def snapshot(self) -> Dict[str, SourceProfile]:
+        with self._lock:
+            return dict(self._perfis)
+
+    def get(self, fonte: str) -> SourceProfile:
+        with self._lock:
+            return self._perfis.get(fonte) or SourceProfile(fonte=fonte)
+
+    def registrar(self, fonte: str, latencia: float, sucesso: bool) -> None:
+        with self._lock:
+            atual = self._perfis.get(fonte) or SourceProfile(fonte=fonte)
+            self._perfis[fonte] = replace(
+                atual,
+                latencia_media=self._ewma(atual.latencia_media, latencia),
+                taxa_sucesso=self._ewma(atual.taxa_sucesso, 1.0 if sucesso else 0.0),
+            )
+
+    def salvar(self) -> None:
+        """
+        Grava o histórico de forma atômica (arquivo temporário + rename).
+        """
+
+        if not self.path:
+            return
+
+        with self._lock:
+            historico = {
+                fonte: {
+                    "latencia_media": perfil.latencia_media,
+                    "taxa_sucesso": perfil.taxa_sucesso,
+                }
+                for fonte, perfil in self._perfis.items()
+            }
+
+            diretorio = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(diretorio, exist_ok=True)
+
+            # Temporário exclusivo no mesmo diretório: processos que gravam
+            # ao mesmo tempo não compartilham o arquivo antes do rename
+            arquivo = tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=diretorio, suffix=".tmp", delete=False
+            )
+            try:
+                with arquivo:
+                    json.dump(historico, arquivo)
+                os.replace(arquivo.name, self.path)
+            except BaseException:
+                if os.path.exists(arquivo.name):
+                    os.remove(arquivo.name)
+                raise
+
+    def _carregar_historico(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+
+        with open(self.path, "r", encoding="utf-8") as arquivo:
+            historico = json.load(arquivo)
+
+        for fonte, dados in historico.items():
+            atual = self._perfis.get(fonte) or SourceProfile(fonte=fonte)
+            self._perfis[fonte] = replace(
+                atual,
+                latencia_media=dados["latencia_media"],
+                taxa_sucesso=dados["taxa_sucesso"],
+            )
+
+    def _ewma(self, atual: float, observado: float) -> float:
+        return (1 - self.alpha) * atual + self.alpha * observado
+
+
+# Histórico compartilhado pelo processo
+_registry: Optional[SourceStatsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_source_stats_registry() -> SourceStatsRegistry:
+    global _registry
+
+    with _registry_lock:
+        if _registry is None:
+            _registry = SourceStatsRegistry.from_config(
+                SOURCES_CONFIG_PATH, path=SOURCE_STATS_PATH
+            )
+        return _registry
@@ -0,0 +1,297 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.domain.entities.identifier import Identifier
+from app.interfaces.services.osint_service import OSINTResult, OSINTService
+
+
+MAGIC = b"OSINTREC2\n"
+
+MODO_RECORD = "record"
+MODO_REPLAY = "replay"
+
+# Diretório dos cassetes, um por investigação
+CASSETTE_DIR = os.getenv("OSINT_CASSETTE_DIR", "./cassettes")
+
+# Cabeçalho de registro: tamanho comprimido (u32) + chave da requisição
+# (sha256). A chave no cabeçalho permite reconstruir o índice percorrendo
+# apenas os cabeçalhos, sem descomprimir os registros.
+_REGISTRO = struct.Struct(">I32s")
+
+
+class CassetteMissError(LookupError):
+    """
+    Requisição sem resposta gravada no cassete em modo replay.
+    """
+
+
+class ReplayedCollectError(RuntimeError):
+    """
+    Falha de coleta gravada no cassete e reproduzida em modo replay.
+    """
+
+    def __init__(self, tipo: str, mensagem: str):
+        super().__init__(f"{tipo}: {mensagem}")
+        self.tipo = tipo
+        self.mensagem = mensagem
+
+
+def cassette_path(root: str, investigation_id: UUID) -> str:
+    return os.path.join(root, f"{investigation_id}.cassette")
+
+
+def request_key(identifier: Identifier, sources: List[str]) -> str:
+    conteudo = "\x1f".join(
+        [identifier.tipo.value, identifier.valor, *sorted(sources)]
+    )
+    return hashlib.sha256(conteudo.encode("utf-8")).hexdigest()
+
+
+def _varrer(dados: Any) -> Tuple[Dict[str, List[int]], int]:
+    """
+    Percorre os cabeçalhos dos registros e devolve o índice
+    chave -> offsets e o fim do último registro completo. Um registro
+    parcial no fim (queda durante a gravação) é ignorado.
+    """
+
+    indice: Dict[str, List[int]] = {}
+    offset = len(MAGIC)
+    tamanho_total = len(dados)
+
+    while offset + _REGISTRO.size <= tamanho_total:
+        tamanho, chave = _REGISTRO.unpack_from(dados, offset)
+        fim = offset + _REGISTRO.size + tamanho
+        if fim > tamanho_total:
+            break
+
+        indice.setdefault(chave.hex(), []).append(offset)
+        offset = fim
+
+    return indice, offset
+
+
+class RecordingOSINTService(OSINTService):
+    """
+    Decorator de OSINTService que grava cada requisição e resposta (ou
+    falha) em um cassete: arquivo append-only de registros comprimidos.
+
+    Sessões de gravação sucessivas da mesma investigação (uma coleta por
+    pessoa) acrescentam registros ao mesmo cassete. Não há índice gravado
+    no fechamento: o replay o reconstrói a partir dos cabeçalhos, então
+    um processo interrompido perde no máximo o registro que gravava.
+    """
+
+    def __init__(self, inner: OSINTService, path: str):
+        self.inner = inner
+        self.path = path
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._arquivo = open(path, "a+b")
+        self._preparar()
+        self._lock = threading.Lock()
+
+    def collect(self, identifier: Identifier, sources: List[str]) -> List[OSINTResult]:
+        registro: Dict[str, Any] = {
+            "tipo": identifier.tipo.value,
+            "valor": identifier.valor,
+            "sources": list(sources),
+        }
+
+        inicio = time.perf_counter()
+        try:
+            resultados = self.inner.collect(identifier=identifier, sources=sources)
+        except Exception as exc:
+            registro["latencia"] = time.perf_counter() - inicio
+            registro["erro"] = {"tipo": type(exc).__name__, "mensagem": str(exc)}
+            self._gravar(request_key(identifier, sources), registro)
+            raise
+
+        registro["latencia"] = time.perf_counter() - inicio
+        registro["resultados"] = [
+            {"source": r.source, "data": r.data} for r in resultados
+        ]
+        self._gravar(request_key(identifier, sources), registro)
+
+        return resultados
+
+    def close(self) -> None:
+        with self._lock:
+            if self._arquivo.closed:
+                return
+
+            self._arquivo.flush()
+            os.fsync(self._arquivo.fileno())
+            self._arquivo.close()
+
+    def __enter__(self) -> "RecordingOSINTService":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def _preparar(self) -> None:
+        tamanho = self._arquivo.seek(0, os.SEEK_END)
+
+        self._arquivo.seek(0)
+        cabecalho = self._arquivo.read(len(MAGIC))
+
+        # Vazio ou com o cabeçalho incompleto (queda na criação)
+        if tamanho < len(MAGIC) and MAGIC.startswith(cabecalho):
+            self._arquivo.truncate(0)
+            self._arquivo.write(MAGIC)
+            self._arquivo.flush()
+            return
+
+        if cabecalho != MAGIC:
+            self._arquivo.close()
+            raise ValueError("Arquivo não é um cassete OSINT.")
+
+        # Descarta um registro parcial deixado por uma sessão interrompida,
+        # para que os novos registros continuem alcançáveis pela varredura
+        with mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            _, fim = _varrer(mapa)
+
+        if fim < tamanho:
+            self._arquivo.truncate(fim)
+
+    def _gravar(self, chave: str, registro: Dict[str, Any]) -> None:
+        comprimido = zlib.compress(
+            json.dumps(registro, ensure_ascii=False).encode("utf-8")
+        )
+
+        with self._lock:
+            self._arquivo.write(
+                _REGISTRO.pack(len(comprimido), bytes.fromhex(chave)) + comprimido
+            )
+            # Entrega ao sistema operacional a cada registro: uma queda do
+            # processo não perde o que já foi gravado
+            self._arquivo.flush()
+
+
+class ReplayOSINTService(OSINTService):
+    """
+    OSINTService que responde a partir de um cassete gravado, sem rede.
+
+    Requisições repetidas são servidas na ordem em que foram gravadas
+    (a última resposta se repete quando as gravações acabam). Falhas
+    gravadas são reproduzidas como ReplayedCollectError. Com
+    `simular_latencia`, cada resposta aguarda a latência original
+    multiplicada por `fator_latencia`.
+
+    Os registros descomprimidos ficam em um cache LRU de até
+    `max_cache` entradas. Um cassete vazio (criado, mas sem gravações)
+    é aceito e não responde a nenhuma requisição.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        simular_latencia: bool = False,
+        fator_latencia: float = 1.0,
+        max_cache: int = 256,
+    ):
+        self.path = path
+        self.simular_latencia = simular_latencia
+        self.fator_latencia = fator_latencia
+        self.max_cache = max_cache
+
+        self._mapa: Optional[mmap.mmap] = None
+        self._indice: Dict[str, List[int]] = {}
+
+        with open(path, "rb") as arquivo:
+            cabecalho = arquivo.read(len(MAGIC))
+
+            # Cabeçalho ausente ou incompleto: cassete sem gravações (o mmap
+            # de um arquivo vazio falharia)
+            if cabecalho == MAGIC:
+                self._mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+                self._indice, _ = _varrer(self._mapa)
+            elif not MAGIC.startswith(cabecalho):
+                raise ValueError("Arquivo não é um cassete OSINT.")
+
+        self._cursores: Dict[str, int] = {}
+        self._cache: "OrderedDict[int, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def collect(self, identifier: Identifier, sources: List[str]) -> List[OSINTResult]:
+        chave = request_key(identifier, sources)
+        offsets = self._indice.get(chave)
+
+        if not offsets:
+            raise CassetteMissError(
+                f"Requisição não gravada: {identifier.tipo.value} em {sorted(sources)}"
+            )
+
+        with self._lock:
+            posicao = self._cursores.get(chave, 0)
+            self._cursores[chave] = posicao + 1
+            offset = offsets[min(posicao, len(offsets) - 1)]
+
+            registro = self._cache.get(offset)
+            if registro is None:
+                registro = json.loads(self._ler(offset))
+                self._cache[offset] = registro
+                if len(self._cache) > self.max_cache:
+                    self._cache.popitem(last=False)
+            else:
+                self._cache.move_to_end(offset)
+
+        if self.simular_latencia:
+            time.sleep(registro["latencia"] * self.fator_latencia)
+
+        if "erro" in registro:
+            raise ReplayedCollectError(
+                registro["erro"]["tipo"], registro["erro"]["mensagem"]
+            )
+
+        return [
+            OSINTResult(source=r["source"], data=r["data"])
+            for r in registro["resultados"]
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._cursores.clear()
+
+    def close(self) -> None:
+        if self._mapa is not None:
+            self._mapa.close()
+
+    def _ler(self, offset: int) -> bytes:
+        tamanho, _ = _REGISTRO.unpack_from(self._mapa, offset)
+        inicio = offset + _REGISTRO.size
+        return zlib.decompress(self._mapa[inicio:inicio + tamanho])
+
+
+def open_transport(
+    inner: OSINTService,
+    modo: Optional[str],
+    root: str,
+    investigation_id: UUID,
+    fator_latencia: Optional[float] = None,
+) -> OSINTService:
+    """
+    Seleciona o transporte de uma coleta: "record", "replay" ou direto.
+    """
+
+    if modo == MODO_RECORD:
+        return RecordingOSINTService(inner, cassette_path(root, investigation_id))
+
+    if modo == MODO_REPLAY:
+        return ReplayOSINTService(
+            cassette_path(root, investigation_id),
+            simular_latencia=fator_latencia is not None,
+            fator_latencia=fator_latencia or 1.0,
+        )
+
+    return inner
@@ -0,0 +1,58 @@
+import os
+from typing import Iterator
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+
+
+DATABASE_URL = os.getenv("OSINT_DATABASE_URL", "sqlite:///./osint.db")
+
+# Layout opcional com um arquivo SQLite por investigação (ver sharding.py)
+SHARDED = os.getenv("OSINT_DB_SHARDED", "").lower() in ("1", "true", "yes")
+SHARD_DIR = os.getenv("OSINT_SHARD_DIR", "./shards")
+SHARD_BUCKETS = int(os.getenv("OSINT_SHARD_BUCKETS", "0")) or None
+SHARD_MAX_ENGINES = int(os.getenv("OSINT_SHARD_MAX_ENGINES", "64"))
+SHARD_IDLE_SECONDS = float(os.getenv("OSINT_SHARD_IDLE_SECONDS", "300"))
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+def _configurar_sqlite(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    # Só tem efeito em bancos novos; permite liberar espaço aos poucos
+    # com incremental_vacuum (ver retention/purge_engine.py)
+    cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def create_sqlite_engine(url: str) -> Engine:
+    sqlite_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},
+    )
+    event.listen(sqlite_engine, "connect", _configurar_sqlite)
+    return sqlite_engine
+
+
+engine = create_sqlite_engine(DATABASE_URL)
+
+SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+def init_db() -> None:
+    # Importa os modelos para registrá-los no metadata
+    from app.infrastructure.persistence.sqlite import models  # noqa: F401
+
+    Base.metadata.create_all(bind=engine)
+
+
+def get_session() -> Iterator[Session]:
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
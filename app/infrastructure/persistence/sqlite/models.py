@@ -0,0 +1,151 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, LargeBinary, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.persistence.sqlite.database import Base
+
+
+class InvestigationModel(Base):
+    __tablename__ = "investigations"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    titulo: Mapped[str] = mapped_column(String(255))
+    finalidade: Mapped[str] = mapped_column(Text)
+
+    fundamento_legal: Mapped[str] = mapped_column(String(64))
+    descricao_base_legal: Mapped[str] = mapped_column(Text)
+    consentimento: Mapped[bool] = mapped_column(default=False)
+
+    objective: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    scope: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    allowed_sources: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    legal_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    collection_budget: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    collection_usage: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+
+    status: Mapped[str] = mapped_column(String(16))
+    data_criacao: Mapped[datetime] = mapped_column(DateTime)
+    data_encerramento: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True
+    )
+
+
+class PersonModel(Base):
+    __tablename__ = "persons"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    investigation_id: Mapped[str] = mapped_column(
+        ForeignKey("investigations.id")
+    )
+    display_name: Mapped[Optional[str]] = mapped_column(
+        String(255), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    updated_at: Mapped[datetime] = mapped_column(DateTime)
+
+    __table_args__ = (
+        # Suporte à paginação por cursor (keyset)
+        Index("ix_persons_investigation_keyset", "investigation_id", "created_at", "id"),
+    )
+
+
+class IdentifierModel(Base):
+    __tablename__ = "identifiers"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    person_id: Mapped[str] = mapped_column(ForeignKey("persons.id"), index=True)
+    tipo: Mapped[str] = mapped_column(String(32))
+    valor: Mapped[str] = mapped_column(String(512))
+    data_registro: Mapped[datetime] = mapped_column(DateTime)
+
+    __table_args__ = (
+        Index("ix_identifiers_tipo_valor", "tipo", "valor"),
+    )
+
+
+class EvidenceModel(Base):
+    __tablename__ = "evidences"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    investigation_id: Mapped[str] = mapped_column(
+        ForeignKey("investigations.id")
+    )
+    person_id: Mapped[Optional[str]] = mapped_column(
+        ForeignKey("persons.id"), nullable=True, index=True
+    )
+
+    tipo: Mapped[str] = mapped_column(String(32))
+    fonte: Mapped[str] = mapped_column(String(128))
+    dado: Mapped[dict] = mapped_column(JSON)
+
+    coletado_por: Mapped[str] = mapped_column(String(128))
+    data_coleta: Mapped[datetime] = mapped_column(DateTime)
+    hash_integridade: Mapped[str] = mapped_column(String(64))
+
+    __table_args__ = (
+        # Suporte à paginação por cursor (keyset) e filtros empurrados ao SQL
+        Index("ix_evidences_investigation_keyset", "investigation_id", "data_coleta", "id"),
+        Index(
+            "ix_evidences_investigation_fonte_keyset",
+            "investigation_id",
+            "fonte",
+            "data_coleta",
+            "id",
+        ),
+        Index(
+            "ix_evidences_investigation_tipo_keyset",
+            "investigation_id",
+            "tipo",
+            "data_coleta",
+            "id",
+        ),
+    )
+
+
+class EvidenceSignatureModel(Base):
+    __tablename__ = "evidence_signatures"
+
+    evidence_id: Mapped[str] = mapped_column(
+        ForeignKey("evidences.id"), primary_key=True
+    )
+    investigation_id: Mapped[str] = mapped_column(String(36), index=True)
+    assinatura: Mapped[bytes] = mapped_column(LargeBinary)
+
+
+class EvidenceLshBucketModel(Base):
+    __tablename__ = "evidence_lsh_buckets"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    evidence_id: Mapped[str] = mapped_column(ForeignKey("evidences.id"))
+    investigation_id: Mapped[str] = mapped_column(String(36))
+    banda: Mapped[int] = mapped_column()
+    bucket: Mapped[str] = mapped_column(String(16))
+
+    __table_args__ = (
+        Index("ix_lsh_banda_bucket", "banda", "bucket", "investigation_id"),
+        Index("ix_lsh_investigation", "investigation_id", "banda", "bucket"),
+    )
+
+
+class PurgeCheckpointModel(Base):
+    # Progresso de um expurgo de retenção, gravado na mesma transação de
+    # cada lote removido (sem chave estrangeira: sobrevive à investigação)
+    __tablename__ = "purge_checkpoints"
+
+    investigation_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    removidos: Mapped[dict] = mapped_column(JSON)
+    digest_evidencias: Mapped[str] = mapped_column(String(64))
+    atualizado_em: Mapped[datetime] = mapped_column(DateTime)
+
+
+class BundleImportModel(Base):
+    # Importação de bundle em andamento: frames já confirmados, gravado na
+    # mesma transação de cada frame para retomar uma importação interrompida
+    __tablename__ = "bundle_imports"
+
+    investigation_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    assinatura: Mapped[str] = mapped_column(String(64))
+    frames_carregados: Mapped[int] = mapped_column()
+    atualizado_em: Mapped[datetime] = mapped_column(DateTime)
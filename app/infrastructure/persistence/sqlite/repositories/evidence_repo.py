@@ -0,0 +1,122 @@
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.domain.entities.evidence import Evidence
+from app.domain.value_objects.evidence_type import EvidenceType
+from app.infrastructure.persistence.sqlite.models import EvidenceModel
+from app.infrastructure.persistence.sqlite.repositories.keyset import paginate
+from app.interfaces.repositories.evidence_repository import (
+    EvidenceFilter,
+    EvidenceRepository,
+    EvidenceSummary,
+)
+from app.interfaces.repositories.pagination import Page, DEFAULT_PAGE_SIZE
+
+
+class SQLiteEvidenceRepository(EvidenceRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def save(self, evidence: Evidence) -> None:
+        self.session.add(
+            EvidenceModel(
+                id=str(evidence.id),
+                investigation_id=str(evidence.investigation_id),
+                person_id=str(evidence.person_id) if evidence.person_id else None,
+                tipo=evidence.tipo.value,
+                fonte=evidence.fonte,
+                dado=evidence.dado,
+                coletado_por=evidence.coletado_por,
+                data_coleta=evidence.data_coleta,
+                hash_integridade=evidence.hash_integridade,
+            )
+        )
+        self.session.commit()
+
+    def get_by_id(self, evidence_id: UUID) -> Optional[Evidence]:
+        model = self.session.get(EvidenceModel, str(evidence_id))
+        return self._to_entity(model) if model else None
+
+    def list_by_investigation(self, investigation_id: UUID) -> List[Evidence]:
+        models = self.session.scalars(
+            select(EvidenceModel)
+            .where(EvidenceModel.investigation_id == str(investigation_id))
+            .order_by(EvidenceModel.data_coleta, EvidenceModel.id)
+        )
+        return [self._to_entity(model) for model in models]
+
+    def list_page(
+        self,
+        investigation_id: UUID,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        filtros: Optional[EvidenceFilter] = None,
+        incluir_dado: bool = False,
+    ) -> Page[EvidenceSummary]:
+        # Projeção: o payload `dado` só entra no SELECT quando pedido
+        colunas = [
+            EvidenceModel.id,
+            EvidenceModel.investigation_id,
+            EvidenceModel.person_id,
+            EvidenceModel.tipo,
+            EvidenceModel.fonte,
+            EvidenceModel.coletado_por,
+            EvidenceModel.data_coleta.label("sort_value"),
+            EvidenceModel.hash_integridade,
+        ]
+        if incluir_dado:
+            colunas.append(EvidenceModel.dado)
+
+        stmt = select(*colunas).where(
+            EvidenceModel.investigation_id == str(investigation_id)
+        )
+
+        if filtros:
+            if filtros.fonte:
+                stmt = stmt.where(EvidenceModel.fonte == filtros.fonte)
+            if filtros.tipo:
+                stmt = stmt.where(EvidenceModel.tipo == filtros.tipo)
+            if filtros.desde:
+                stmt = stmt.where(EvidenceModel.data_coleta >= filtros.desde)
+            if filtros.ate:
+                stmt = stmt.where(EvidenceModel.data_coleta < filtros.ate)
+
+        return paginate(
+            self.session,
+            stmt,
+            sort_column=EvidenceModel.data_coleta,
+            id_column=EvidenceModel.id,
+            cursor=cursor,
+            limit=limit,
+            to_item=lambda row: EvidenceSummary(
+                id=UUID(row.id),
+                investigation_id=UUID(row.investigation_id),
+                person_id=UUID(row.person_id) if row.person_id else None,
+                tipo=row.tipo,
+                fonte=row.fonte,
+                coletado_por=row.coletado_por,
+                data_coleta=row.sort_value,
+                hash_integridade=row.hash_integridade,
+                dado=row.dado if incluir_dado else None,
+            ),
+        )
+
+    # =========================
+    # MAPEAMENTO
+    # =========================
+
+    @staticmethod
+    def _to_entity(model: EvidenceModel) -> Evidence:
+        return Evidence(
+            investigation_id=UUID(model.investigation_id),
+            person_id=UUID(model.person_id) if model.person_id else None,
+            tipo=EvidenceType(model.tipo),
+            fonte=model.fonte,
+            dado=model.dado,
+            coletado_por=model.coletado_por,
+            evidence_id=UUID(model.id),
+            data_coleta=model.data_coleta,
+        )
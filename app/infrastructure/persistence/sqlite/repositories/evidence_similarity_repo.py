@@ -0,0 +1,192 @@
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from app.domain.entities.evidence import Evidence
+from app.infrastructure.persistence.sqlite.models import (
+    EvidenceLshBucketModel,
+    EvidenceSignatureModel,
+)
+from app.infrastructure.similarity.minhash import (
+    assinatura_de_bytes,
+    lsh_buckets,
+    minhash,
+    similaridade,
+)
+from app.interfaces.repositories.evidence_similarity_repository import (
+    EvidenceSimilarityRepository,
+)
+
+
+class SQLiteEvidenceSimilarityRepository(EvidenceSimilarityRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def index_batch(self, evidences: List[Evidence]) -> None:
+        if not evidences:
+            return
+
+        assinaturas = []
+        buckets = []
+
+        for evidence in evidences:
+            assinatura = minhash(evidence.dado)
+            if assinatura is None:
+                # Sem conteúdo comparável: fica fora do índice
+                continue
+
+            assinaturas.append(
+                {
+                    "evidence_id": str(evidence.id),
+                    "investigation_id": str(evidence.investigation_id),
+                    "assinatura": assinatura.tobytes(),
+                }
+            )
+            for banda, bucket in enumerate(lsh_buckets(assinatura)):
+                buckets.append(
+                    {
+                        "evidence_id": str(evidence.id),
+                        "investigation_id": str(evidence.investigation_id),
+                        "banda": banda,
+                        "bucket": bucket,
+                    }
+                )
+
+        if not assinaturas:
+            return
+
+        # Inserção em lote: uma transação por batch de evidências
+        self.session.execute(insert(EvidenceSignatureModel), assinaturas)
+        self.session.execute(insert(EvidenceLshBucketModel), buckets)
+        self.session.commit()
+
+    def similar(
+        self,
+        evidence_id: UUID,
+        limiar: float = 0.8,
+        investigation_id: Optional[UUID] = None,
+    ) -> List[Tuple[UUID, float]]:
+        consulta = select(EvidenceSignatureModel.assinatura).where(
+            EvidenceSignatureModel.evidence_id == str(evidence_id)
+        )
+        if investigation_id:
+            # A referência também precisa pertencer à investigação
+            consulta = consulta.where(
+                EvidenceSignatureModel.investigation_id == str(investigation_id)
+            )
+
+        referencia = self.session.scalar(consulta)
+
+        if referencia is None:
+            return []
+
+        alvo = assinatura_de_bytes(referencia)
+
+        # Candidatos: evidências que compartilham ao menos um bucket
+        proprios = (
+            select(EvidenceLshBucketModel.banda, EvidenceLshBucketModel.bucket)
+            .where(EvidenceLshBucketModel.evidence_id == str(evidence_id))
+            .subquery()
+        )
+        stmt = (
+            select(EvidenceSignatureModel.evidence_id, EvidenceSignatureModel.assinatura)
+            .join(
+                EvidenceLshBucketModel,
+                EvidenceLshBucketModel.evidence_id == EvidenceSignatureModel.evidence_id,
+            )
+            .join(
+                proprios,
+                (EvidenceLshBucketModel.banda == proprios.c.banda)
+                & (EvidenceLshBucketModel.bucket == proprios.c.bucket),
+            )
+            .where(EvidenceSignatureModel.evidence_id != str(evidence_id))
+            .distinct()
+        )
+        if investigation_id:
+            stmt = stmt.where(
+                EvidenceLshBucketModel.investigation_id == str(investigation_id)
+            )
+
+        resultados = []
+        for candidato_id, dados in self.session.execute(stmt):
+            score = similaridade(alvo, assinatura_de_bytes(dados))
+            if score >= limiar:
+                resultados.append((UUID(candidato_id), score))
+
+        resultados.sort(key=lambda item: item[1], reverse=True)
+        return resultados
+
+    def near_duplicate_clusters(
+        self, investigation_id: UUID, limiar: float = 0.8
+    ) -> List[List[UUID]]:
+        investigation = str(investigation_id)
+
+        # Apenas buckets com colisão; evidências isoladas nem são lidas
+        colisoes = (
+            select(EvidenceLshBucketModel.banda, EvidenceLshBucketModel.bucket)
+            .where(EvidenceLshBucketModel.investigation_id == investigation)
+            .group_by(EvidenceLshBucketModel.banda, EvidenceLshBucketModel.bucket)
+            .having(func.count() > 1)
+            .subquery()
+        )
+        linhas = self.session.execute(
+            select(
+                EvidenceLshBucketModel.banda,
+                EvidenceLshBucketModel.bucket,
+                EvidenceLshBucketModel.evidence_id,
+            )
+            .join(
+                colisoes,
+                (EvidenceLshBucketModel.banda == colisoes.c.banda)
+                & (EvidenceLshBucketModel.bucket == colisoes.c.bucket),
+            )
+            .where(EvidenceLshBucketModel.investigation_id == investigation)
+            .order_by(EvidenceLshBucketModel.banda, EvidenceLshBucketModel.bucket)
+        )
+
+        grupos: Dict[Tuple[int, str], List[str]] = {}
+        for banda, bucket, evidence_id in linhas:
+            grupos.setdefault((banda, bucket), []).append(evidence_id)
+
+        if not grupos:
+            return []
+
+        envolvidos = {eid for membros in grupos.values() for eid in membros}
+        assinaturas = {
+            eid: assinatura_de_bytes(dados)
+            for eid, dados in self.session.execute(
+                select(
+                    EvidenceSignatureModel.evidence_id,
+                    EvidenceSignatureModel.assinatura,
+                ).where(EvidenceSignatureModel.evidence_id.in_(envolvidos))
+            )
+        }
+
+        # Union-find: cada membro de um bucket é verificado apenas contra o
+        # primeiro membro do bucket (não par a par), então o custo é
+        # O(n * bandas). Membros já no mesmo grupo nem são comparados.
+        pais: Dict[str, str] = {eid: eid for eid in envolvidos}
+
+        def find(eid: str) -> str:
+            while pais[eid] != eid:
+                pais[eid] = pais[pais[eid]]
+                eid = pais[eid]
+            return eid
+
+        for membros in grupos.values():
+            representante = membros[0]
+            for eid in membros[1:]:
+                raiz_representante, raiz = find(representante), find(eid)
+                if raiz == raiz_representante:
+                    continue
+
+                if similaridade(assinaturas[representante], assinaturas[eid]) >= limiar:
+                    pais[raiz] = raiz_representante
+
+        clusters: Dict[str, List[UUID]] = {}
+        for eid in envolvidos:
+            clusters.setdefault(find(eid), []).append(UUID(eid))
+
+        return [membros for membros in clusters.values() if len(membros) > 1]
@@ -0,0 +1,41 @@
+from typing import Iterator, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.domain.entities.identifier import Identifier
+from app.infrastructure.persistence.sqlite.models import IdentifierModel
+from app.interfaces.repositories.identifier_repository import IdentifierRepository
+
+
+YIELD_PER = 10000
+
+
+class SQLiteIdentifierRepository(IdentifierRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def save(self, person_id: UUID, identifier: Identifier) -> None:
+        self.session.add(
+            IdentifierModel(
+                person_id=str(person_id),
+                tipo=identifier.tipo.value,
+                valor=identifier.valor,
+                data_registro=identifier.data_registro,
+            )
+        )
+        self.session.commit()
+
+    def iter_links(self) -> Iterator[Tuple[UUID, str, str]]:
+        # Streaming: a tabela inteira nunca é materializada em memória
+        linhas = self.session.execute(
+            select(
+                IdentifierModel.person_id,
+                IdentifierModel.tipo,
+                IdentifierModel.valor,
+            ).execution_options(yield_per=YIELD_PER)
+        )
+
+        for person_id, tipo, valor in linhas:
+            yield UUID(person_id), tipo, valor
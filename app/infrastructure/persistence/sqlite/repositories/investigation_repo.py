@@ -0,0 +1,196 @@
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.domain.entities.investigation import Investigation, InvestigationStatus
+from app.domain.exceptions.domain_exceptions import DomainValidationError
+from app.domain.value_objects.base_legal import BaseLegal, LegalBasisType
+from app.domain.value_objects.collection_budget import CollectionBudget, CollectionUsage
+from app.infrastructure.persistence.sqlite.models import InvestigationModel
+from app.infrastructure.persistence.sqlite.sharding import (
+    ShardNotFoundError,
+    ShardRouter,
+)
+from app.interfaces.repositories.investigation_repository import InvestigationRepository
+
+
+class SQLiteInvestigationRepository(InvestigationRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def save(self, investigation: Investigation) -> None:
+        model = self.session.get(InvestigationModel, str(investigation.id))
+
+        if not model:
+            model = InvestigationModel(
+                id=str(investigation.id),
+                collection_usage=investigation.collection_usage.to_dict(),
+            )
+            self.session.add(model)
+
+        model.titulo = investigation.titulo
+        model.finalidade = investigation.finalidade
+        model.fundamento_legal = investigation.base_legal.fundamento.value
+        model.descricao_base_legal = investigation.base_legal.descricao
+        model.consentimento = investigation.base_legal.consentimento
+        model.objective = investigation.objective
+        model.scope = investigation.scope
+        model.allowed_sources = investigation.allowed_sources
+        model.legal_notes = investigation.legal_notes
+        model.collection_budget = (
+            investigation.collection_budget.to_dict()
+            if investigation.collection_budget
+            else None
+        )
+        model.status = investigation.status.value
+        model.data_criacao = investigation.data_criacao
+        model.data_encerramento = investigation.data_encerramento
+
+        self.session.commit()
+
+    def get_by_id(self, investigation_id: UUID) -> Optional[Investigation]:
+        model = self.session.get(InvestigationModel, str(investigation_id))
+
+        if not model:
+            return None
+
+        return self._to_entity(model)
+
+    # =========================
+    # ORÇAMENTO DE COLETA
+    # =========================
+
+    def reservar_consumo(
+        self,
+        investigation_id: UUID,
+        custo_estimado: float,
+        tempo_estimado: float,
+    ) -> bool:
+        model = self._bloquear(investigation_id)
+        consumo = CollectionUsage(**(model.collection_usage or {}))
+
+        if model.collection_budget and not CollectionBudget(
+            **model.collection_budget
+        ).permite(consumo, custo_estimado, tempo_estimado):
+            self.session.rollback()
+            return False
+
+        consumo.registrar(tempo_estimado, custo_estimado)
+        model.collection_usage = consumo.to_dict()
+        self.session.commit()
+
+        return True
+
+    def ajustar_consumo(self, investigation_id: UUID, tempo_segundos: float) -> None:
+        model = self._bloquear(investigation_id)
+        consumo = CollectionUsage(**(model.collection_usage or {}))
+
+        consumo.tempo_segundos = max(consumo.tempo_segundos + tempo_segundos, 0.0)
+        model.collection_usage = consumo.to_dict()
+        self.session.commit()
+
+    def _bloquear(self, investigation_id: UUID) -> InvestigationModel:
+        """
+        Abre a transação com uma escrita nula, que toma o lock de escrita
+        do SQLite antes da leitura: duas coletas simultâneas não leem o
+        mesmo consumo e a última gravação não sobrescreve a outra.
+        """
+
+        self.session.execute(
+            update(InvestigationModel)
+            .where(InvestigationModel.id == str(investigation_id))
+            .values(collection_usage=InvestigationModel.collection_usage)
+            .execution_options(synchronize_session=False)
+        )
+
+        model = self.session.get(
+            InvestigationModel, str(investigation_id), populate_existing=True
+        )
+
+        if not model:
+            self.session.rollback()
+            raise DomainValidationError("Investigação não encontrada.")
+
+        return model
+
+    # =========================
+    # MAPEAMENTO
+    # =========================
+
+    @staticmethod
+    def _to_entity(model: InvestigationModel) -> Investigation:
+        investigation = Investigation(
+            titulo=model.titulo,
+            finalidade=model.finalidade,
+            base_legal=BaseLegal(
+                fundamento=LegalBasisType(model.fundamento_legal),
+                descricao=model.descricao_base_legal,
+                consentimento=model.consentimento,
+            ),
+            investigation_id=UUID(model.id),
+            data_criacao=model.data_criacao,
+        )
+        investigation.objective = model.objective
+        investigation.scope = model.scope
+        investigation.allowed_sources = model.allowed_sources
+        investigation.legal_notes = model.legal_notes
+        investigation.collection_budget = (
+            CollectionBudget(**model.collection_budget)
+            if model.collection_budget
+            else None
+        )
+        investigation.collection_usage = CollectionUsage(
+            **(model.collection_usage or {})
+        )
+        investigation.status = InvestigationStatus(model.status)
+        investigation.data_encerramento = model.data_encerramento
+        return investigation
+
+
+class ShardedInvestigationRepository(InvestigationRepository):
+    """
+    Repositório de investigações no layout particionado: a primeira
+    gravação de uma investigação registra seu shard no catálogo; as demais
+    operações são delegadas ao repositório SQLite do shard.
+    """
+
+    def __init__(self, router: ShardRouter):
+        self.router = router
+
+    def save(self, investigation: Investigation) -> None:
+        try:
+            session = self.router.session_for(investigation.id)
+        except ShardNotFoundError:
+            self.router.create(investigation.id)
+            session = self.router.session_for(investigation.id)
+
+        with session:
+            SQLiteInvestigationRepository(session).save(investigation)
+
+    def get_by_id(self, investigation_id: UUID) -> Optional[Investigation]:
+        try:
+            session = self.router.session_for(investigation_id)
+        except ShardNotFoundError:
+            return None
+
+        with session:
+            return SQLiteInvestigationRepository(session).get_by_id(investigation_id)
+
+    def reservar_consumo(
+        self,
+        investigation_id: UUID,
+        custo_estimado: float,
+        tempo_estimado: float,
+    ) -> bool:
+        with self.router.session_for(investigation_id) as session:
+            return SQLiteInvestigationRepository(session).reservar_consumo(
+                investigation_id, custo_estimado, tempo_estimado
+            )
+
+    def ajustar_consumo(self, investigation_id: UUID, tempo_segundos: float) -> None:
+        with self.router.session_for(investigation_id) as session:
+            SQLiteInvestigationRepository(session).ajustar_consumo(
+                investigation_id, tempo_segundos
+            )
@@ -0,0 +1,51 @@
+from typing import Any, Callable, List, Optional, Tuple
+
+from sqlalchemy import Select, and_, or_
+from sqlalchemy.orm import Session
+
+from app.interfaces.repositories.pagination import (
+    Page,
+    clamp_page_size,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def paginate(
+    session: Session,
+    stmt: Select,
+    sort_column: Any,
+    id_column: Any,
+    cursor: Optional[str],
+    limit: int,
+    to_item: Callable[[Any], Any],
+) -> Page:
+    """
+    Aplica paginação keyset sobre (sort_column, id_column).
+
+    Em vez de OFFSET, filtra a partir da última chave vista; com índice
+    composto a consulta custa o mesmo em qualquer profundidade de página.
+    """
+
+    limit = clamp_page_size(limit)
+
+    if cursor:
+        sort_value, item_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            or_(
+                sort_column > sort_value,
+                and_(sort_column == sort_value, id_column > item_id),
+            )
+        )
+
+    # Busca um registro a mais para saber se existe próxima página
+    stmt = stmt.order_by(sort_column, id_column).limit(limit + 1)
+    rows: List[Tuple] = list(session.execute(stmt))
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.sort_value, last.id)
+
+    return Page(items=[to_item(row) for row in rows], next_cursor=next_cursor)
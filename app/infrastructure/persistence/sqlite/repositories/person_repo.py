@@ -0,0 +1,124 @@
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.domain.entities.identifier import Identifier
+from app.domain.entities.person import Person
+from app.domain.value_objects.identifier_type import IdentifierType
+from app.infrastructure.persistence.sqlite.models import IdentifierModel, PersonModel
+from app.infrastructure.persistence.sqlite.repositories.keyset import paginate
+from app.interfaces.repositories.pagination import Page, DEFAULT_PAGE_SIZE
+from app.interfaces.repositories.person_repository import (
+    PersonRepository,
+    PersonSummary,
+)
+
+
+class SQLitePersonRepository(PersonRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def save(self, person: Person) -> None:
+        self.session.merge(
+            PersonModel(
+                id=str(person.id),
+                investigation_id=str(person.investigation_id),
+                display_name=person.display_name,
+                created_at=person.created_at,
+                updated_at=person.updated_at,
+            )
+        )
+        self.session.commit()
+
+    def get_by_id(self, person_id: UUID) -> Optional[Person]:
+        model = self.session.get(PersonModel, str(person_id))
+
+        if not model:
+            return None
+
+        identifiers = self.session.scalars(
+            select(IdentifierModel)
+            .where(IdentifierModel.person_id == model.id)
+            .order_by(IdentifierModel.id)
+        ).all()
+
+        return self._to_entity(model, identifiers)
+
+    def list_by_investigation(self, investigation_id: UUID) -> List[Person]:
+        models = self.session.scalars(
+            select(PersonModel)
+            .where(PersonModel.investigation_id == str(investigation_id))
+            .order_by(PersonModel.created_at, PersonModel.id)
+        ).all()
+
+        if not models:
+            return []
+
+        # Carrega identificadores de todas as pessoas em uma única consulta
+        identifiers_por_pessoa: dict = {}
+        for row in self.session.scalars(
+            select(IdentifierModel)
+            .where(IdentifierModel.person_id.in_([m.id for m in models]))
+            .order_by(IdentifierModel.id)
+        ):
+            identifiers_por_pessoa.setdefault(row.person_id, []).append(row)
+
+        return [
+            self._to_entity(model, identifiers_por_pessoa.get(model.id, []))
+            for model in models
+        ]
+
+    def list_page(
+        self,
+        investigation_id: UUID,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[PersonSummary]:
+        stmt = select(
+            PersonModel.id,
+            PersonModel.investigation_id,
+            PersonModel.display_name,
+            PersonModel.created_at.label("sort_value"),
+        ).where(PersonModel.investigation_id == str(investigation_id))
+
+        return paginate(
+            self.session,
+            stmt,
+            sort_column=PersonModel.created_at,
+            id_column=PersonModel.id,
+            cursor=cursor,
+            limit=limit,
+            to_item=lambda row: PersonSummary(
+                id=UUID(row.id),
+                investigation_id=UUID(row.investigation_id),
+                display_name=row.display_name,
+                created_at=row.sort_value,
+            ),
+        )
+
+    # =========================
+    # MAPEAMENTO
+    # =========================
+
+    @staticmethod
+    def _to_entity(
+        model: PersonModel, identifiers: List[IdentifierModel]
+    ) -> Person:
+        person = Person(
+            investigation_id=UUID(model.investigation_id),
+            display_name=model.display_name,
+        )
+        person.id = UUID(model.id)
+        person.created_at = model.created_at
+        person.updated_at = model.updated_at
+        person.identifiers = [
+            Identifier(
+                tipo=IdentifierType(row.tipo),
+                valor=row.valor,
+                data_registro=row.data_registro,
+            )
+            for row in identifiers
+        ]
+        return person
@@ -0,0 +1,397 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Iterator, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import DateTime, Engine, String, create_engine, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, sessionmaker
+
+from app.domain.entities.investigation import InvestigationStatus
+from app.domain.exceptions.domain_exceptions import DomainValidationError
+from app.infrastructure.persistence.sqlite.database import (
+    SHARD_BUCKETS,
+    SHARD_DIR,
+    SHARD_IDLE_SECONDS,
+    SHARD_MAX_ENGINES,
+    Base,
+    create_sqlite_engine,
+)
+
+
+_router: Optional["ShardRouter"] = None
+_router_lock = threading.Lock()
+
+
+class ShardStatus:
+    ATIVO = "ATIVO"
+    ARQUIVADO = "ARQUIVADO"
+
+
+class ShardNotFoundError(LookupError):
+    """
+    Investigação sem shard registrado no catálogo.
+    """
+
+
+class CatalogBase(DeclarativeBase):
+    pass
+
+
+class ShardModel(CatalogBase):
+    __tablename__ = "shards"
+
+    investigation_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    path: Mapped[str] = mapped_column(String(512))
+    status: Mapped[str] = mapped_column(String(16))
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    archived_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+
+class ShardRouter:
+    """
+    Layout particionado: um arquivo SQLite por investigação (ou por bucket
+    de hash), com um catálogo pequeno que roteia investigation_id -> arquivo.
+
+    Cada shard tem seu próprio lock de escrita, então coletas de
+    investigações diferentes não se serializam. Shards só são criados com
+    `create`, na criação da investigação; ids desconhecidos resultam em
+    ShardNotFoundError. Os engines abertos ficam em um cache LRU limitado
+    (`max_engines`) e são descartados após `idle_seconds` sem uso, para
+    não acumular pools e descritores de arquivo.
+
+    Investigações encerradas podem ser compactadas com `VACUUM INTO` em um
+    arquivo somente leitura.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        buckets: Optional[int] = None,
+        max_engines: int = 64,
+        idle_seconds: float = 300.0,
+    ):
+        self.root = root
+        self.buckets = buckets
+        self.max_engines = max_engines
+        self.idle_seconds = idle_seconds
+
+        os.makedirs(os.path.join(root, "archive"), exist_ok=True)
+
+        self._catalog = create_sqlite_engine(
+            f"sqlite:///{os.path.join(root, 'catalog.db')}"
+        )
+        CatalogBase.metadata.create_all(bind=self._catalog)
+        self._catalog_sessions = sessionmaker(bind=self._catalog)
+
+        # chave -> (engine, último uso), em ordem de uso
+        self._engines: "OrderedDict[str, Tuple[Engine, float]]" = OrderedDict()
+        self._arquivando: Set[str] = set()
+        self._lock = threading.Lock()
+
+    # =========================
+    # ROTEAMENTO
+    # =========================
+
+    def create(self, investigation_id: UUID) -> Engine:
+        """
+        Registra o shard de uma nova investigação e cria suas tabelas.
+        """
+
+        chave = self._chave(investigation_id)
+
+        with self._catalog_sessions() as catalog:
+            if catalog.get(ShardModel, str(investigation_id)):
+                raise DomainValidationError("Investigação já possui shard.")
+
+            catalog.add(
+                ShardModel(
+                    investigation_id=str(investigation_id),
+                    path=os.path.join(self.root, f"{chave}.db"),
+                    status=ShardStatus.ATIVO,
+                    created_at=datetime.utcnow(),
+                )
+            )
+            catalog.commit()
+
+        return self.engine_for(investigation_id)
+
+    def engine_for(self, investigation_id: UUID) -> Engine:
+        chave = self._chave(investigation_id)
+
+        with self._lock:
+            self._verificar_disponivel(chave)
+            engine = self._usar(chave)
+            descartados = self._despejar()
+
+        for antigo in descartados:
+            antigo.dispose()
+
+        if engine is not None:
+            return engine
+
+        # Abertura fora do lock: não bloqueia o roteamento das demais
+        engine = self._abrir(investigation_id)
+
+        with self._lock:
+            existente = self._usar(chave)
+            if existente is not None or chave in self._arquivando:
+                engine.dispose()
+                self._verificar_disponivel(chave)
+                return existente
+
+            self._engines[chave] = (engine, time.monotonic())
+            descartados = self._despejar()
+
+        for antigo in descartados:
+            antigo.dispose()
+
+        return engine
+
+    def session_for(self, investigation_id: UUID) -> Session:
+        return Session(
+            bind=self.engine_for(investigation_id),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+
+    def iter_sessions(self) -> Iterator[Session]:
+        """
+        Percorre todas as investigações do catálogo, uma sessão por vez.
+        Shards em arquivamento (ou removidos durante a varredura) são
+        ignorados, sem interromper a varredura das demais.
+        """
+
+        with self._catalog_sessions() as catalog:
+            ids = catalog.scalars(select(ShardModel.investigation_id)).all()
+
+        for investigation_id in ids:
+            try:
+                session = self.session_for(UUID(investigation_id))
+            except (ShardNotFoundError, DomainValidationError):
+                # Em arquivamento ou removida desde a leitura do catálogo
+                continue
+
+            try:
+                yield session
+            finally:
+                session.close()
+
+    # =========================
+    # ARQUIVAMENTO E REMOÇÃO
+    # =========================
+
+    def archive(self, investigation_id: UUID) -> str:
+        """
+        Compacta o shard de uma investigação encerrada em um arquivo
+        somente leitura e remove o arquivo quente.
+
+        A compactação roda sem o lock do roteador; durante ela apenas a
+        própria investigação fica indisponível.
+        """
+
+        if self.buckets:
+            raise DomainValidationError(
+                "Arquivamento exige um shard por investigação."
+            )
+
+        chave = str(investigation_id)
+        destino = os.path.join(self.root, "archive", f"{chave}.db")
+        temporario = f"{destino}.tmp"
+
+        with self._lock:
+            if chave in self._arquivando:
+                raise DomainValidationError("Investigação já está em arquivamento.")
+            self._arquivando.add(chave)
+            em_uso = self._engines.pop(chave, None)
+
+        try:
+            if em_uso:
+                em_uso[0].dispose()
+
+            with self._catalog_sessions() as catalog:
+                shard = catalog.get(ShardModel, chave)
+
+                if not shard:
+                    raise ShardNotFoundError("Investigação não encontrada no catálogo.")
+
+                if shard.status == ShardStatus.ARQUIVADO:
+                    raise DomainValidationError("Investigação já está arquivada.")
+
+                caminho_quente = shard.path
+
+            self._compactar(chave, caminho_quente, temporario)
+            os.replace(temporario, destino)
+
+            with self._catalog_sessions() as catalog:
+                shard = catalog.get(ShardModel, chave)
+                shard.path = destino
+                shard.status = ShardStatus.ARQUIVADO
+                shard.archived_at = datetime.utcnow()
+                catalog.commit()
+        finally:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+            with self._lock:
+                self._arquivando.discard(chave)
+
+        for sufixo in ("", "-wal", "-shm"):
+            if os.path.exists(caminho_quente + sufixo):
+                os.remove(caminho_quente + sufixo)
+
+        return destino
+
+    def drop(self, investigation_id: UUID) -> None:
+        """
+        Remove o arquivo do shard (quente ou arquivado) e a entrada do
+        catálogo. Usado pelo expurgo de retenção; é idempotente, para que
+        um expurgo interrompido possa ser repetido.
+        """
+
+        if self.buckets:
+            raise DomainValidationError(
+                "Remoção de shard exige um shard por investigação."
+            )
+
+        chave = str(investigation_id)
+
+        with self._lock:
+            if chave in self._arquivando:
+                raise DomainValidationError("Investigação em arquivamento.")
+            self._arquivando.add(chave)
+            em_uso = self._engines.pop(chave, None)
+
+        try:
+            if em_uso:
+                em_uso[0].dispose()
+
+            with self._catalog_sessions() as catalog:
+                shard = catalog.get(ShardModel, chave)
+                if not shard:
+                    return
+
+                for sufixo in ("", "-wal", "-shm"):
+                    if os.path.exists(shard.path + sufixo):
+                        os.remove(shard.path + sufixo)
+
+                catalog.delete(shard)
+                catalog.commit()
+        finally:
+            with self._lock:
+                self._arquivando.discard(chave)
+
+    def close(self) -> None:
+        with self._lock:
+            engines = [engine for engine, _ in self._engines.values()]
+            self._engines.clear()
+
+        for engine in engines:
+            engine.dispose()
+        self._catalog.dispose()
+
+    # =========================
+    # INTERNOS
+    # =========================
+
+    def _chave(self, investigation_id: UUID) -> str:
+        if self.buckets:
+            return f"bucket-{investigation_id.int % self.buckets:04d}"
+        return str(investigation_id)
+
+    def _verificar_disponivel(self, chave: str) -> None:
+        if chave in self._arquivando:
+            raise DomainValidationError("Investigação em arquivamento.")
+
+    def _usar(self, chave: str) -> Optional[Engine]:
+        entrada = self._engines.get(chave)
+        if entrada is None:
+            return None
+
+        self._engines[chave] = (entrada[0], time.monotonic())
+        self._engines.move_to_end(chave)
+        return entrada[0]
+
+    def _despejar(self) -> list:
+        """
+        Retira do cache os engines excedentes e os ociosos (os mais
+        antigos ficam no início; o recém-usado, no fim, é preservado).
+        Deve ser chamado com o lock.
+        """
+
+        limite_ocioso = time.monotonic() - self.idle_seconds
+        descartados = []
+
+        while len(self._engines) > 1:
+            chave, (engine, ultimo_uso) = next(iter(self._engines.items()))
+            if len(self._engines) <= self.max_engines and ultimo_uso >= limite_ocioso:
+                break
+
+            del self._engines[chave]
+            descartados.append(engine)
+
+        return descartados
+
+    def _abrir(self, investigation_id: UUID) -> Engine:
+        with self._catalog_sessions() as catalog:
+            shard = catalog.get(ShardModel, str(investigation_id))
+
+            if not shard:
+                raise ShardNotFoundError("Investigação não encontrada.")
+
+            path, status = shard.path, shard.status
+
+        if status == ShardStatus.ARQUIVADO:
+            return create_engine(
+                "sqlite://",
+                creator=lambda: sqlite3.connect(
+                    f"file:{path}?mode=ro", uri=True, check_same_thread=False
+                ),
+            )
+
+        engine = create_sqlite_engine(f"sqlite:///{path}")
+
+        # Importa os modelos para registrá-los no metadata
+        from app.infrastructure.persistence.sqlite import models  # noqa: F401
+
+        Base.metadata.create_all(bind=engine)
+        return engine
+
+    @staticmethod
+    def _compactar(chave: str, caminho_quente: str, temporario: str) -> None:
+        from app.infrastructure.persistence.sqlite.models import InvestigationModel
+
+        engine = create_sqlite_engine(f"sqlite:///{caminho_quente}")
+        try:
+            with engine.connect() as conn:
+                status = conn.scalar(
+                    select(InvestigationModel.status).where(
+                        InvestigationModel.id == chave
+                    )
+                )
+                if status != InvestigationStatus.ENCERRADA.value:
+                    raise DomainValidationError(
+                        "Apenas investigações encerradas podem ser arquivadas."
+                    )
+
+                # VACUUM INTO gera uma cópia compacta e consistente do shard
+                conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+                conn.exec_driver_sql("VACUUM INTO ?", (temporario,))
+        finally:
+            engine.dispose()
+
+
+def get_shard_router() -> ShardRouter:
+    global _router
+
+    with _router_lock:
+        if _router is None:
+            _router = ShardRouter(
+                SHARD_DIR,
+                buckets=SHARD_BUCKETS,
+                max_engines=SHARD_MAX_ENGINES,
+                idle_seconds=SHARD_IDLE_SECONDS,
+            )
+        return _router
@@ -0,0 +1,371 @@
+import cProfile
+import contextvars
+import functools
+import heapq
+import io
+import logging
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+
+PROFILE_HEADER = "X-Profile"
+
+MODO_DETERMINISTICO = "deterministico"
+MODO_AMOSTRAGEM = "amostragem"
+
+EXTENSOES_PERFIL = (".prof", ".collapsed")
+
+logger = logging.getLogger(__name__)
+
+# Decisão de perfilamento da requisição corrente, tomada uma única vez pelo
+# middleware; fora de uma requisição (None), cada execução é sorteada
+_decisao_requisicao: contextvars.ContextVar[Optional[bool]] = contextvars.ContextVar(
+    "decisao_requisicao", default=None
+)
+
+# Perfil em andamento na thread: o cProfile instala um único hook por
+# thread, então execuções aninhadas (ou corrotinas concorrentes no mesmo
+# event loop) são cobertas pelo perfil externo
+_thread = threading.local()
+
+
+@dataclass(order=True)
+class ProfiledExecution:
+    duracao_ms: float
+    nome: str = field(compare=False)
+    timestamp: str = field(compare=False)
+    arquivo: str = field(compare=False)
+    top_funcoes: List[Dict[str, Any]] = field(compare=False, default_factory=list)
+
+
+class Profiler:
+    """
+    Perfilamento sob demanda de execuções de use cases.
+
+    Desligado, o custo por chamada é um único teste de `enabled`. Ligado,
+    perfila uma fração configurável das execuções (ou as marcadas pelo
+    header `X-Profile`) e grava o resultado em `output_dir`:
+
+    - modo determinístico: cProfile, arquivo `.prof` (pstats);
+    - modo amostragem: amostras periódicas da pilha da thread, arquivo
+      `.collapsed` (formato de flame graph).
+
+    Se outro profiler já estiver ativo (outra ferramenta, ou outra thread
+    no Python 3.12+, em que o cProfile é global), a execução segue sem
+    perfil. Falhas ao gravar ou registrar o perfil são apenas registradas
+    em log: nunca substituem o resultado nem a exceção da execução.
+
+    No máximo `max_arquivos` perfis ficam em disco: ao exceder o limite,
+    os mais antigos são removidos, exceto os das execuções mais lentas
+    ainda listadas por `slowest`.
+    """
+
+    def __init__(
+        self,
+        output_dir: str = "./profiles",
+        sample_rate: float = 0.0,
+        modo: str = MODO_DETERMINISTICO,
+        intervalo_amostragem: float = 0.001,
+        max_registros: int = 50,
+        max_arquivos: int = 500,
+    ):
+        self.enabled = False
+        self.output_dir = output_dir
+        self.sample_rate = sample_rate
+        self.modo = modo
+        self.intervalo_amostragem = intervalo_amostragem
+        self.max_registros = max_registros
+        self.max_arquivos = max_arquivos
+
+        self._mais_lentas: List[ProfiledExecution] = []
+        self._arquivos: Optional[Deque[str]] = None
+        self._lock = threading.Lock()
+
+    # =========================
+    # CONFIGURAÇÃO
+    # =========================
+
+    def configure(
+        self,
+        enabled: Optional[bool] = None,
+        sample_rate: Optional[float] = None,
+        modo: Optional[str] = None,
+    ) -> None:
+        if sample_rate is not None:
+            if not 0.0 <= sample_rate <= 1.0:
+                raise ValueError("sample_rate deve estar entre 0 e 1.")
+            self.sample_rate = sample_rate
+
+        if modo is not None:
+            if modo not in (MODO_DETERMINISTICO, MODO_AMOSTRAGEM):
+                raise ValueError(f"Modo de perfilamento inválido: {modo}")
+            self.modo = modo
+
+        if enabled is not None:
+            if enabled:
+                os.makedirs(self.output_dir, exist_ok=True)
+                self._carregar_arquivos()
+            self.enabled = enabled
+
+    def slowest(self, limit: int = 20) -> List[ProfiledExecution]:
+        with self._lock:
+            return sorted(self._mais_lentas, reverse=True)[:limit]
+
+    # =========================
+    # EXECUÇÃO
+    # =========================
+
+    def run(self, nome: str, func: Callable, args: tuple, kwargs: dict) -> Any:
+        with self.perfilar(nome, self._sortear()):
+            return func(*args, **kwargs)
+
+    def sample(self, forcar: bool = False) -> bool:
+        """
+        Decide se uma requisição será perfilada (sempre, se `forcar`).
+        """
+
+        return self.enabled and (forcar or random.random() < self.sample_rate)
+
+    @contextmanager
+    def perfilar(self, nome: str, selecionado: bool = True) -> Iterator[None]:
+        """
+        Perfila o bloco, se `selecionado` e se não houver outro perfil
+        ativo na thread. Serve a código síncrono e a corrotinas.
+        """
+
+        if not selecionado or getattr(_thread, "ativo", False):
+            yield
+            return
+
+        coletor = (
+            _ColetorAmostragem(self.intervalo_amostragem)
+            if self.modo == MODO_AMOSTRAGEM
+            else _ColetorDeterministico()
+        )
+        if not coletor.iniciar():
+            yield
+            return
+
+        _thread.ativo = True
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            duracao_ms = (time.perf_counter() - inicio) * 1000
+            _thread.ativo = False
+            try:
+                coletor.parar()
+                arquivo = self._caminho(nome, coletor.extensao)
+                top_funcoes = coletor.gravar(arquivo)
+                self._registrar(nome, duracao_ms, arquivo, top_funcoes)
+            except Exception:
+                logger.exception("Falha ao gravar o perfil de %s.", nome)
+
+    def _sortear(self) -> bool:
+        decisao = _decisao_requisicao.get()
+        if decisao is not None:
+            return decisao
+        return random.random() < self.sample_rate
+
+    # =========================
+    # INTERNOS
+    # =========================
+
+    def _caminho(self, nome: str, extensao: str) -> str:
+        carimbo = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+        nome = re.sub(r"[^A-Za-z0-9_.-]+", "_", nome).strip("_")
+        return os.path.join(self.output_dir, f"{nome}-{carimbo}.{extensao}")
+
+    def _registrar(
+        self,
+        nome: str,
+        duracao_ms: float,
+        arquivo: str,
+        top_funcoes: List[Dict[str, Any]],
+    ) -> None:
+        registro = ProfiledExecution(
+            duracao_ms=round(duracao_ms, 3),
+            nome=nome,
+            timestamp=datetime.utcnow().isoformat(),
+            arquivo=arquivo,
+            top_funcoes=top_funcoes,
+        )
+
+        # Heap mínimo limitado: mantém apenas as N execuções mais lentas
+        with self._lock:
+            if len(self._mais_lentas) < self.max_registros:
+                heapq.heappush(self._mais_lentas, registro)
+            else:
+                heapq.heappushpop(self._mais_lentas, registro)
+
+            self._rotacionar(arquivo)
+
+    def _carregar_arquivos(self) -> None:
+        # Perfis de execuções anteriores do processo contam para o limite
+        with self._lock:
+            if self._arquivos is not None:
+                return
+
+            existentes = [
+                entrada
+                for entrada in os.scandir(self.output_dir)
+                if entrada.is_file() and entrada.name.endswith(EXTENSOES_PERFIL)
+            ]
+            existentes.sort(key=lambda entrada: entrada.stat().st_mtime)
+            self._arquivos = deque(entrada.path for entrada in existentes)
+
+    def _rotacionar(self, arquivo: str) -> None:
+        """
+        Remove os perfis mais antigos além de `max_arquivos`, preservando
+        os das execuções mais lentas. Deve ser chamado com o lock.
+        """
+
+        if self._arquivos is None:
+            self._arquivos = deque()
+        self._arquivos.append(arquivo)
+
+        excedente = len(self._arquivos) - self.max_arquivos
+        if excedente <= 0:
+            return
+
+        mantidos = {registro.arquivo for registro in self._mais_lentas}
+        restantes: Deque[str] = deque()
+
+        for caminho in self._arquivos:
+            if excedente > 0 and caminho not in mantidos:
+                try:
+                    os.remove(caminho)
+                except FileNotFoundError:
+                    pass
+                excedente -= 1
+            else:
+                restantes.append(caminho)
+
+        self._arquivos = restantes
+
+
+class _ColetorDeterministico:
+    extensao = "prof"
+
+    def __init__(self):
+        self._perfil = cProfile.Profile()
+
+    def iniciar(self) -> bool:
+        # Antes do 3.12 o hook é por thread e seria substituído em silêncio;
+        # a partir do 3.12 o enable falha com outro profiler ativo
+        if sys.getprofile() is not None:
+            return False
+        try:
+            self._perfil.enable()
+        except ValueError:
+            return False
+        return True
+
+    def parar(self) -> None:
+        self._perfil.disable()
+
+    def gravar(self, arquivo: str, limite: int = 5) -> List[Dict[str, Any]]:
+        self._perfil.dump_stats(arquivo)
+
+        stats = pstats.Stats(self._perfil, stream=io.StringIO())
+        linhas = sorted(
+            stats.stats.items(), key=lambda item: item[1][3], reverse=True
+        )[:limite]
+
+        return [
+            {
+                "funcao": f"{nome} ({os.path.basename(origem)}:{linha})",
+                "chamadas": chamadas,
+                "tempo_acumulado_ms": round(acumulado * 1000, 3),
+            }
+            for (origem, linha, nome), (_, chamadas, _, acumulado, _) in linhas
+        ]
+
+
+class _ColetorAmostragem:
+    extensao = "collapsed"
+
+    def __init__(self, intervalo: float):
+        self.intervalo = intervalo
+        self._alvo = threading.get_ident()
+        self._pilhas: Counter = Counter()
+        self._parar = threading.Event()
+        self._amostrador = threading.Thread(target=self._amostrar, daemon=True)
+
+    def iniciar(self) -> bool:
+        self._amostrador.start()
+        return True
+
+    def parar(self) -> None:
+        self._parar.set()
+        self._amostrador.join()
+
+    def gravar(self, arquivo: str, limite: int = 5) -> List[Dict[str, Any]]:
+        with open(arquivo, "w", encoding="utf-8") as saida:
+            for pilha, contagem in self._pilhas.items():
+                saida.write(f"{pilha} {contagem}\n")
+
+        # Conta amostras em que a função está no topo da pilha (self time)
+        topo: Counter = Counter()
+        for pilha, contagem in self._pilhas.items():
+            topo[pilha.rsplit(";", 1)[-1]] += contagem
+
+        return [
+            {"funcao": funcao, "amostras": contagem}
+            for funcao, contagem in topo.most_common(limite)
+        ]
+
+    def _amostrar(self) -> None:
+        while not self._parar.wait(self.intervalo):
+            frame = sys._current_frames().get(self._alvo)
+            pilha = []
+            while frame is not None:
+                codigo = frame.f_code
+                pilha.append(
+                    f"{codigo.co_name} ({os.path.basename(codigo.co_filename)}"
+                    f":{codigo.co_firstlineno})"
+                )
+                frame = frame.f_back
+            if pilha:
+                self._pilhas[";".join(reversed(pilha))] += 1
+
+
+profiler = Profiler(
+    output_dir=os.getenv("OSINT_PROFILE_DIR", "./profiles"),
+    max_arquivos=int(os.getenv("OSINT_PROFILE_MAX_FILES", "500")),
+)
+
+
+def profiled(func: Callable) -> Callable:
+    """
+    Decorator para `execute` de use cases. Com o profiler desligado,
+    o custo é um único teste por chamada.
+    """
+
+    nome = func.__qualname__.replace(".", "-")
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not profiler.enabled:
+            return func(*args, **kwargs)
+        return profiler.run(nome, func, args, kwargs)
+
+    return wrapper
+
+
+def set_request_profiling(decisao: bool) -> contextvars.Token:
+    return _decisao_requisicao.set(decisao)
+
+
+def reset_request_profiling(token: contextvars.Token) -> None:
+    _decisao_requisicao.reset(token)
@@ -0,0 +1,477 @@
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.orm import Session
+
+from app.domain.entities.investigation import InvestigationStatus
+from app.domain.value_objects.retention_policy import RetentionPolicy
+from app.infrastructure.audit.audit_log import GENESIS_HASH, AuditLog
+from app.infrastructure.osint.transport.record_replay import cassette_path
+from app.infrastructure.persistence.sqlite.models import (
+    EvidenceLshBucketModel,
+    EvidenceModel,
+    EvidenceSignatureModel,
+    IdentifierModel,
+    InvestigationModel,
+    PersonModel,
+    PurgeCheckpointModel,
+)
+from app.infrastructure.persistence.sqlite.sharding import ShardRouter
+from app.infrastructure.storage.blob_store import BlobStore
+
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class PurgeResult:
+    investigation_id: str
+    removidos: Dict[str, int] = field(default_factory=dict)
+    digest_evidencias: str = ""
+    concluido_em: Optional[str] = None
+
+
+class RetentionPurgeEngine:
+    """
+    Expurgo de investigações cujo prazo de retenção (LGPD) expirou.
+
+    A remoção é feita em lotes pequenos, cada um em sua própria transação,
+    com limite de linhas por segundo, para nunca segurar o lock de escrita
+    do SQLite por muito tempo. O progresso (contagens e digest) é gravado
+    na tabela `purge_checkpoints` na mesma transação de cada lote, de modo
+    que um expurgo interrompido é retomado exatamente de onde parou. Ao
+    final, um registro com as contagens e o digest dos hashes das
+    evidências removidas é gravado no log de auditoria.
+
+    No layout particionado (`router`), com um shard por investigação, o
+    expurgo não remove linhas: calcula contagens e digest, registra a
+    auditoria e remove o arquivo do shard. Uma queda entre o registro e a
+    remoção repete o expurgo (e o registro) na próxima execução.
+
+    Com `blob_store`, os anexos de que a investigação é dona são liberados;
+    os que ficam sem dono são apagados. Com `cassette_root`, o cassete de
+    gravação/replay da investigação também é removido, como uma etapa do
+    checkpoint.
+
+    `run` isola as investigações: a falha de uma é registrada em log e a
+    varredura segue para as demais, que serão retomadas na próxima execução.
+
+    O digest é encadeado por evidência, em ordem de id:
+    `d = sha256(d_anterior || hash_integridade)`, a partir de GENESIS_HASH.
+    Assim ele pode ser recalculado a partir de um export anterior e não
+    depende do tamanho dos lotes nem de interrupções.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]],
+        audit_log: AuditLog,
+        policy: Optional[RetentionPolicy] = None,
+        batch_size: int = 500,
+        rows_per_second: float = 2000.0,
+        paginas_vacuum: int = 256,
+        ator: str = "RETENTION_ENGINE",
+        router: Optional[ShardRouter] = None,
+        blob_store: Optional[BlobStore] = None,
+        cassette_root: Optional[str] = None,
+    ):
+        if session_factory is None and router is None:
+            raise ValueError("Informe session_factory ou router.")
+
+        self.session_factory = session_factory
+        self.audit_log = audit_log
+        self.policy = policy or RetentionPolicy()
+        self.batch_size = batch_size
+        self.rows_per_second = rows_per_second
+        self.paginas_vacuum = paginas_vacuum
+        self.ator = ator
+        self.router = router
+        self.blob_store = blob_store
+        self.cassette_root = cassette_root
+
+    # =========================
+    # API
+    # =========================
+
+    def find_expired(self, agora: Optional[datetime] = None) -> List[str]:
+        agora = agora or datetime.utcnow()
+
+        # Um predicado por base legal, avaliado no banco
+        condicoes = [
+            and_(
+                InvestigationModel.fundamento_legal == fundamento.value,
+                InvestigationModel.data_encerramento <= agora - prazo,
+            )
+            for fundamento, prazo in self.policy.prazos.items()
+        ]
+
+        encerrada = InvestigationStatus.ENCERRADA.value
+
+        expiradas: List[str] = []
+        for session in self._todas_sessoes():
+            try:
+                expiradas.extend(
+                    session.scalars(
+                        select(InvestigationModel.id)
+                        .where(InvestigationModel.status == encerrada)
+                        .where(InvestigationModel.data_encerramento.is_not(None))
+                        .where(or_(*condicoes))
+                        .order_by(InvestigationModel.data_encerramento)
+                    )
+                )
+            except Exception:
+                logger.exception("Falha ao buscar investigações expiradas.")
+                session.rollback()
+
+        # Shards por bucket são visitados uma vez por investigação
+        return list(dict.fromkeys(expiradas))
+
+    def run(self, agora: Optional[datetime] = None) -> List[PurgeResult]:
+        # Retoma primeiro os expurgos interrompidos
+        pendentes: List[str] = []
+        for session in self._todas_sessoes():
+            try:
+                pendentes.extend(
+                    session.scalars(select(PurgeCheckpointModel.investigation_id))
+                )
+            except Exception:
+                # Ex.: shard arquivado (somente leitura) anterior à tabela
+                # de checkpoints; não há expurgo interrompido nele
+                logger.exception("Falha ao ler checkpoints de expurgo.")
+                session.rollback()
+        pendentes.extend(self.find_expired(agora))
+
+        resultados: List[PurgeResult] = []
+        for investigation_id in dict.fromkeys(pendentes):
+            try:
+                resultados.append(self.purge(investigation_id))
+            except Exception:
+                logger.exception(
+                    "Falha no expurgo da investigação %s.", investigation_id
+                )
+
+        return resultados
+
+    def purge(self, investigation_id: str) -> PurgeResult:
+        if self.router and not self.router.buckets:
+            return self._remover_shard(investigation_id)
+
+        with self._sessao(investigation_id) as session:
+            checkpoint = session.get(PurgeCheckpointModel, investigation_id)
+
+            resultado = PurgeResult(
+                investigation_id=investigation_id,
+                removidos=dict(checkpoint.removidos) if checkpoint else {},
+                digest_evidencias=(
+                    checkpoint.digest_evidencias if checkpoint else GENESIS_HASH
+                ),
+            )
+
+        # Ordem respeita as chaves estrangeiras
+        etapas = [
+            ("evidence_lsh_buckets", self._lote_lsh),
+            ("evidence_signatures", self._lote_assinaturas),
+            ("evidences", self._lote_evidencias),
+            ("identifiers", self._lote_identificadores),
+            ("persons", self._lote_pessoas),
+            ("investigations", self._lote_investigacao),
+        ]
+
+        for tabela, lote in etapas:
+            while True:
+                inicio = time.perf_counter()
+
+                with self._sessao(investigation_id) as session:
+                    removidas, digest = lote(
+                        session, investigation_id, resultado.digest_evidencias
+                    )
+                    if not removidas:
+                        break
+
+                    removidos = dict(resultado.removidos)
+                    removidos[tabela] = removidos.get(tabela, 0) + removidas
+
+                    # Checkpoint e remoção são confirmados juntos
+                    session.merge(
+                        PurgeCheckpointModel(
+                            investigation_id=investigation_id,
+                            removidos=removidos,
+                            digest_evidencias=digest,
+                            atualizado_em=datetime.utcnow(),
+                        )
+                    )
+                    session.commit()
+
+                resultado.removidos = removidos
+                resultado.digest_evidencias = digest
+
+                self._liberar_espaco(investigation_id)
+                self._throttle(removidas, time.perf_counter() - inicio)
+
+        self._remover_cassete(resultado)
+        self._liberar_anexos(resultado)
+        self._registrar(resultado)
+
+        with self._sessao(investigation_id) as session:
+            session.execute(
+                delete(PurgeCheckpointModel).where(
+                    PurgeCheckpointModel.investigation_id == investigation_id
+                )
+            )
+            session.commit()
+
+        return resultado
+
+    # =========================
+    # LAYOUT PARTICIONADO
+    # =========================
+
+    def _remover_shard(self, investigation_id: str) -> PurgeResult:
+        resultado = PurgeResult(
+            investigation_id=investigation_id,
+            digest_evidencias=GENESIS_HASH,
+        )
+
+        with self._sessao(investigation_id) as session:
+            contagens = [
+                ("evidence_lsh_buckets", EvidenceLshBucketModel.investigation_id),
+                ("evidence_signatures", EvidenceSignatureModel.investigation_id),
+                ("evidences", EvidenceModel.investigation_id),
+                ("persons", PersonModel.investigation_id),
+                ("investigations", InvestigationModel.id),
+            ]
+            for tabela, coluna in contagens:
+                total = session.scalar(
+                    select(func.count()).where(coluna == investigation_id)
+                )
+                if total:
+                    resultado.removidos[tabela] = total
+
+            identificadores = session.scalar(
+                select(func.count())
+                .select_from(IdentifierModel)
+                .join(PersonModel, PersonModel.id == IdentifierModel.person_id)
+                .where(PersonModel.investigation_id == investigation_id)
+            )
+            if identificadores:
+                resultado.removidos["identifiers"] = identificadores
+
+            for hash_integridade in session.scalars(
+                select(EvidenceModel.hash_integridade)
+                .where(EvidenceModel.investigation_id == investigation_id)
+                .order_by(EvidenceModel.id)
+                .execution_options(yield_per=self.batch_size)
+            ):
+                resultado.digest_evidencias = self._encadear(
+                    resultado.digest_evidencias, hash_integridade
+                )
+
+        cassete = self._caminho_cassete(investigation_id)
+        if cassete and os.path.exists(cassete):
+            resultado.removidos["cassetes"] = 1
+
+        self._liberar_anexos(resultado)
+
+        # Registrado antes da remoção: uma queda entre os dois repete o
+        # expurgo, mas nunca remove o shard sem registro
+        self._registrar(resultado)
+        if cassete and os.path.exists(cassete):
+            os.remove(cassete)
+        self.router.drop(UUID(investigation_id))
+
+        return resultado
+
+    # =========================
+    # LOTES
+    # =========================
+
+    def _lote_lsh(
+        self, session: Session, investigation_id: str, digest: str
+    ) -> Tuple[int, str]:
+        ids = session.scalars(
+            select(EvidenceLshBucketModel.id)
+            .where(EvidenceLshBucketModel.investigation_id == investigation_id)
+            .limit(self.batch_size)
+        ).all()
+        return self._remover(session, EvidenceLshBucketModel.id, ids), digest
+
+    def _lote_assinaturas(
+        self, session: Session, investigation_id: str, digest: str
+    ) -> Tuple[int, str]:
+        ids = session.scalars(
+            select(EvidenceSignatureModel.evidence_id)
+            .where(EvidenceSignatureModel.investigation_id == investigation_id)
+            .limit(self.batch_size)
+        ).all()
+        coluna = EvidenceSignatureModel.evidence_id
+        return self._remover(session, coluna, ids), digest
+
+    def _lote_evidencias(
+        self, session: Session, investigation_id: str, digest: str
+    ) -> Tuple[int, str]:
+        linhas = session.execute(
+            select(EvidenceModel.id, EvidenceModel.hash_integridade)
+            .where(EvidenceModel.investigation_id == investigation_id)
+            .order_by(EvidenceModel.id)
+            .limit(self.batch_size)
+        ).all()
+
+        # O digest só é adotado pelo chamador após o commit do lote
+        for _, hash_integridade in linhas:
+            digest = self._encadear(digest, hash_integridade)
+
+        ids = [linha.id for linha in linhas]
+        return self._remover(session, EvidenceModel.id, ids), digest
+
+    def _lote_identificadores(
+        self, session: Session, investigation_id: str, digest: str
+    ) -> Tuple[int, str]:
+        ids = session.scalars(
+            select(IdentifierModel.id)
+            .join(PersonModel, PersonModel.id == IdentifierModel.person_id)
+            .where(PersonModel.investigation_id == investigation_id)
+            .limit(self.batch_size)
+        ).all()
+        return self._remover(session, IdentifierModel.id, ids), digest
+
+    def _lote_pessoas(
+        self, session: Session, investigation_id: str, digest: str
+    ) -> Tuple[int, str]:
+        ids = session.scalars(
+            select(PersonModel.id)
+            .where(PersonModel.investigation_id == investigation_id)
+            .limit(self.batch_size)
+        ).all()
+        return self._remover(session, PersonModel.id, ids), digest
+
+    def _lote_investigacao(
+        self, session: Session, investigation_id: str, digest: str
+    ) -> Tuple[int, str]:
+        ids = [investigation_id]
+        return self._remover(session, InvestigationModel.id, ids), digest
+
+    @staticmethod
+    def _encadear(digest: str, hash_integridade: str) -> str:
+        return hashlib.sha256((digest + hash_integridade).encode("ascii")).hexdigest()
+
+    @staticmethod
+    def _remover(session: Session, coluna: Any, ids: List[Any]) -> int:
+        if not ids:
+            return 0
+
+        resultado = session.execute(
+            delete(coluna.class_).where(coluna.in_(ids)).execution_options(
+                synchronize_session=False
+            )
+        )
+        return resultado.rowcount
+
+    # =========================
+    # THROTTLE E ESPAÇO
+    # =========================
+
+    def _throttle(self, linhas: int, decorrido: float) -> None:
+        if self.rows_per_second <= 0:
+            return
+
+        espera = linhas / self.rows_per_second - decorrido
+        if espera > 0:
+            time.sleep(espera)
+
+    def _liberar_espaco(self, investigation_id: str) -> None:
+        # Devolve ao sistema de arquivos algumas páginas livres por lote
+        # (requer auto_vacuum=INCREMENTAL; sem efeito caso contrário)
+        # executescript percorre todos os passos do PRAGMA; um execute
+        # simples libera apenas uma página
+        with self._sessao(investigation_id) as session:
+            conexao = session.connection().connection.driver_connection
+            conexao.executescript(
+                f"PRAGMA incremental_vacuum({int(self.paginas_vacuum)});"
+            )
+
+    # =========================
+    # CASSETES, ANEXOS E AUDITORIA
+    # =========================
+
+    def _caminho_cassete(self, investigation_id: str) -> Optional[str]:
+        if not self.cassette_root:
+            return None
+        return cassette_path(self.cassette_root, UUID(investigation_id))
+
+    def _remover_cassete(self, resultado: PurgeResult) -> None:
+        """
+        A contagem é confirmada no checkpoint antes da remoção do arquivo:
+        uma queda entre os dois remove o arquivo na retomada sem contá-lo
+        de novo.
+        """
+
+        cassete = self._caminho_cassete(resultado.investigation_id)
+        if not cassete or not os.path.exists(cassete):
+            return
+
+        if "cassetes" not in resultado.removidos:
+            removidos = dict(resultado.removidos)
+            removidos["cassetes"] = 1
+
+            with self._sessao(resultado.investigation_id) as session:
+                session.merge(
+                    PurgeCheckpointModel(
+                        investigation_id=resultado.investigation_id,
+                        removidos=removidos,
+                        digest_evidencias=resultado.digest_evidencias,
+                        atualizado_em=datetime.utcnow(),
+                    )
+                )
+                session.commit()
+
+            resultado.removidos = removidos
+
+        os.remove(cassete)
+
+    def _liberar_anexos(self, resultado: PurgeResult) -> None:
+        if not self.blob_store:
+            return
+
+        apagados = self.blob_store.release_owner(resultado.investigation_id)
+        if apagados:
+            resultado.removidos["anexos"] = (
+                resultado.removidos.get("anexos", 0) + len(apagados)
+            )
+
+    def _registrar(self, resultado: PurgeResult) -> None:
+        resultado.concluido_em = datetime.utcnow().isoformat()
+
+        self.audit_log.append(
+            "RetentionPurge",
+            self.ator,
+            {
+                "investigation_id": resultado.investigation_id,
+                "removidos": resultado.removidos,
+                "digest_evidencias": resultado.digest_evidencias,
+                "concluido_em": resultado.concluido_em,
+            },
+        )
+        self.audit_log.flush()
+
+    # =========================
+    # SESSÕES
+    # =========================
+
+    def _sessao(self, investigation_id: str) -> Session:
+        if self.router:
+            return self.router.session_for(UUID(investigation_id))
+        return self.session_factory()
+
+    def _todas_sessoes(self) -> Iterator[Session]:
+        if self.router:
+            yield from self.router.iter_sessions()
+            return
+
+        with self.session_factory() as session:
+            yield session
@@ -0,0 +1,162 @@
+import hashlib
+import re
+from array import array
+from typing import Any, Iterable, List, Optional, Set
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+NUM_PERMUTACOES = 128
+BANDAS = 32
+LINHAS_POR_BANDA = NUM_PERMUTACOES // BANDAS
+TAMANHO_SHINGLE = 3
+
+_PRIMO = (1 << 61) - 1
+_MASCARA = (1 << 32) - 1
+
+# Chaves voláteis que variam entre coletas do mesmo conteúdo
+_CHAVES_VOLATEIS = {
+    "timestamp",
+    "retrieved_at",
+    "fetched_at",
+    "collected_at",
+    "data_coleta",
+    "request_id",
+    "etag",
+}
+
+# Parâmetros de rastreamento removidos de URLs
+_PARAMETROS_RASTREIO = re.compile(r"^(utm_.*|fbclid|gclid|mc_cid|mc_eid|ref|_ga)$")
+
+_PADRAO_TIMESTAMP = re.compile(
+    r"\d{4}-\d{2}-\d{2}[t ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(z|[+-]\d{2}:?\d{2})?"
+)
+_PADRAO_TOKEN = re.compile(r"\w+")
+
+
+def _coeficientes() -> List[tuple]:
+    # Coeficientes determinísticos (a, b) das funções de hash universais
+    coeficientes = []
+    for i in range(NUM_PERMUTACOES):
+        semente = hashlib.blake2b(f"minhash-{i}".encode(), digest_size=16).digest()
+        a = int.from_bytes(semente[:8], "little") % (_PRIMO - 1) + 1
+        b = int.from_bytes(semente[8:], "little") % _PRIMO
+        coeficientes.append((a, b))
+    return coeficientes
+
+
+_COEFICIENTES = _coeficientes()
+
+
+# =========================
+# NORMALIZAÇÃO
+# =========================
+
+
+def _normalizar_url(valor: str) -> str:
+    partes = urlsplit(valor)
+    query = [
+        (chave, v)
+        for chave, v in parse_qsl(partes.query, keep_blank_values=True)
+        if not _PARAMETROS_RASTREIO.match(chave.lower())
+    ]
+    return urlunsplit(
+        (partes.scheme, partes.netloc.lower(), partes.path.rstrip("/"), urlencode(sorted(query)), "")
+    )
+
+
+def _tokens(valor: Any, prefixo: str = "") -> Iterable[str]:
+    if isinstance(valor, dict):
+        for chave in sorted(valor):
+            if str(chave).lower() in _CHAVES_VOLATEIS:
+                continue
+            yield from _tokens(valor[chave], f"{prefixo}{chave}.")
+    elif isinstance(valor, (list, tuple)):
+        for item in valor:
+            yield from _tokens(item, prefixo)
+    elif valor is not None:
+        texto = str(valor).strip().lower()
+        if texto.startswith(("http://", "https://")):
+            texto = _normalizar_url(texto)
+        texto = _PADRAO_TIMESTAMP.sub(" ", texto)
+        for token in _PADRAO_TOKEN.findall(texto):
+            yield f"{prefixo}{token}"
+
+
+def shingles(dado: Any) -> Set[int]:
+    """
+    Conjunto de shingles (n-gramas de tokens) do conteúdo normalizado,
+    representados por hashes de 64 bits.
+    """
+
+    tokens = list(_tokens(dado))
+
+    if len(tokens) < TAMANHO_SHINGLE:
+        grupos = [tuple(tokens)] if tokens else []
+    else:
+        grupos = [
+            tuple(tokens[i:i + TAMANHO_SHINGLE])
+            for i in range(len(tokens) - TAMANHO_SHINGLE + 1)
+        ]
+
+    return {
+        int.from_bytes(
+            hashlib.blake2b("\x1f".join(grupo).encode(), digest_size=8).digest(),
+            "little",
+        )
+        for grupo in grupos
+    }
+
+
+# =========================
+# MINHASH / LSH
+# =========================
+
+
+def minhash(dado: Any) -> Optional[array]:
+    """
+    Assinatura MinHash com NUM_PERMUTACOES valores de 32 bits.
+
+    Retorna None quando o conteúdo normalizado não tem nenhum token (só
+    pontuação ou só chaves voláteis): não há o que comparar, e uma
+    assinatura constante tornaria idênticas evidências sem relação.
+    """
+
+    conjunto = shingles(dado)
+
+    if not conjunto:
+        return None
+
+    assinatura = array("I", [_MASCARA] * NUM_PERMUTACOES)
+    for i, (a, b) in enumerate(_COEFICIENTES):
+        assinatura[i] = min(((a * x + b) % _PRIMO) & _MASCARA for x in conjunto)
+
+    return assinatura
+
+
+def lsh_buckets(assinatura: array) -> List[str]:
+    """
+    Chaves de bucket por banda: evidências que coincidem em ao menos
+    uma banda tornam-se candidatas a quase-duplicatas.
+    """
+
+    buckets = []
+    for banda in range(BANDAS):
+        inicio = banda * LINHAS_POR_BANDA
+        linhas = assinatura[inicio:inicio + LINHAS_POR_BANDA].tobytes()
+        buckets.append(hashlib.blake2b(linhas, digest_size=8).hexdigest())
+    return buckets
+
+
+def similaridade(a: array, b: array) -> float:
+    """
+    Estimativa da similaridade de Jaccard entre duas assinaturas.
+    """
+
+    iguais = sum(1 for x, y in zip(a, b) if x == y)
+    return iguais / NUM_PERMUTACOES
+
+
+def assinatura_de_bytes(dados: bytes) -> array:
+    assinatura = array("I")
+    assinatura.frombytes(dados)
+    return assinatura
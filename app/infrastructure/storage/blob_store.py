@@ -0,0 +1,387 @@
+import hashlib
+import mmap
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import BinaryIO, Dict, Iterator, List, Optional
+
+
+CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class BlobLocation:
+    sha256: str
+    segment: int
+    offset: int
+    length: int
+
+    def to_dado(self, content_type: Optional[str] = None) -> Dict[str, object]:
+        """
+        Referência a ser gravada em `Evidence.dado` no lugar do conteúdo.
+        Como o sha256 entra no dado, ele também entra no hash de integridade
+        da evidência.
+        """
+
+        return {
+            "anexo": {
+                "sha256": self.sha256,
+                "tamanho": self.length,
+                "content_type": content_type,
+            }
+        }
+
+
+class BlobStore:
+    """
+    Armazenamento de anexos de evidência (capturas, HTML, PDFs) fora do
+    banco relacional.
+
+    Os conteúdos são gravados em arquivos de segmento append-only e
+    endereçados pelo sha256. Um índice SQLite mapeia o hash para
+    (segmento, offset, tamanho). A ingestão calcula o hash em streaming e a
+    leitura usa mmap, de modo que o uso de memória não depende do tamanho
+    do anexo.
+
+    Como o conteúdo é deduplicado entre investigações, cada blob guarda
+    as referências dos donos (investigações) que o anexaram. Um blob só é
+    apagado quando seu último dono o libera: os bytes são sobrescritos com
+    zeros no segmento e o segmento é removido quando não tem mais blobs.
+
+    A ingestão não serializa os uploads: o conteúdo é recebido em um
+    arquivo temporário fora do lock, que só é tomado para reservar a
+    região no segmento e, depois da cópia, para gravar o índice. A conexão
+    do índice é sempre usada sob o lock.
+    """
+
+    def __init__(self, root: str, segment_max_bytes: int = 1024 ** 3):
+        self.root = root
+        self.segment_max_bytes = segment_max_bytes
+
+        os.makedirs(root, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._index = sqlite3.connect(
+            os.path.join(root, "index.sqlite"), check_same_thread=False
+        )
+        self._index.execute("PRAGMA journal_mode=WAL")
+        self._index.execute(
+            """
+            CREATE TABLE IF NOT EXISTS blobs (
+                sha256 TEXT PRIMARY KEY,
+                segment INTEGER NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                created_at TEXT NOT NULL
+            )
+            """
+        )
+        self._index.execute(
+            """
+            CREATE TABLE IF NOT EXISTS blob_refs (
+                sha256 TEXT NOT NULL,
+                owner TEXT NOT NULL,
+                PRIMARY KEY (sha256, owner)
+            )
+            """
+        )
+        self._index.execute(
+            "CREATE INDEX IF NOT EXISTS ix_blob_refs_owner ON blob_refs (owner)"
+        )
+        self._index.commit()
+
+        self._tmp_dir = os.path.join(root, "tmp")
+        os.makedirs(self._tmp_dir, exist_ok=True)
+
+        self._segment = self._ultimo_segmento()
+        self._cauda = self._tamanho_segmento(self._segment)
+
+        # Cópias em andamento por segmento: o segmento não é removido
+        # enquanto houver região reservada ainda fora do índice
+        self._em_escrita: Dict[int, int] = {}
+
+    # =========================
+    # INGESTÃO
+    # =========================
+
+    def put(self, stream: BinaryIO, owner: Optional[str] = None) -> BlobLocation:
+        """
+        Recebe o conteúdo do stream em um arquivo temporário, calculando o
+        sha256 durante a cópia, e o transfere para uma região reservada do
+        segmento corrente. Conteúdos já existentes são deduplicados.
+        Com `owner`, registra a referência do dono ao blob.
+        """
+
+        with tempfile.TemporaryFile(dir=self._tmp_dir) as temporario:
+            digest = hashlib.sha256()
+            length = 0
+
+            while True:
+                chunk = stream.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                temporario.write(chunk)
+                length += len(chunk)
+
+            sha256 = digest.hexdigest()
+
+            with self._lock:
+                existente = self._locate(sha256)
+                if existente:
+                    self._referenciar(sha256, owner)
+                    self._index.commit()
+                    return existente
+
+                segment, offset = self._reservar(length)
+
+            try:
+                temporario.seek(0)
+                self._copiar(temporario, segment, offset)
+            except BaseException:
+                with self._lock:
+                    self._em_escrita[segment] -= 1
+                raise
+
+        location = BlobLocation(sha256, segment, offset, length)
+
+        with self._lock:
+            self._em_escrita[segment] -= 1
+
+            # Outro upload do mesmo conteúdo foi indexado durante a cópia:
+            # a região reservada é descartada
+            existente = self._locate(sha256)
+            if existente:
+                self._zerar(location)
+                self._referenciar(sha256, owner)
+                self._index.commit()
+                return existente
+
+            # O índice só é atualizado após os bytes estarem duráveis
+            self._index.execute(
+                "INSERT INTO blobs VALUES (?, ?, ?, ?, ?)",
+                (sha256, segment, offset, length, datetime.utcnow().isoformat()),
+            )
+            self._referenciar(sha256, owner)
+            self._index.commit()
+
+        return location
+
+    # =========================
+    # REFERÊNCIAS
+    # =========================
+
+    def acquire(self, sha256: str, owner: str) -> None:
+        with self._lock:
+            if not self._locate(sha256):
+                raise KeyError(sha256)
+
+            self._referenciar(sha256, owner)
+            self._index.commit()
+
+    def release_owner(self, owner: str) -> List[str]:
+        """
+        Remove todas as referências de um dono e apaga os blobs que
+        ficaram sem referência. É idempotente: pode ser repetida após uma
+        interrupção. Retorna os sha256 apagados.
+        """
+
+        with self._lock:
+            orfaos = [
+                row[0]
+                for row in self._index.execute(
+                    """
+                    SELECT r.sha256 FROM blob_refs r
+                    WHERE r.owner = ?
+                      AND NOT EXISTS (
+                          SELECT 1 FROM blob_refs o
+                          WHERE o.sha256 = r.sha256 AND o.owner != r.owner
+                      )
+                    """,
+                    (owner,),
+                )
+            ]
+
+            # As referências só saem depois dos blobs: uma execução
+            # interrompida volta a encontrar os mesmos órfãos
+            for sha256 in orfaos:
+                location = self._locate(sha256)
+                if location:
+                    self._apagar(location)
+
+            self._index.execute("DELETE FROM blob_refs WHERE owner = ?", (owner,))
+            self._index.commit()
+
+            return orfaos
+
+    # =========================
+    # LEITURA
+    # =========================
+
+    def locate(
+        self, sha256: str, owner: Optional[str] = None
+    ) -> Optional[BlobLocation]:
+        """
+        Localiza o blob pelo sha256. Com `owner`, só o retorna se esse dono
+        o referencia.
+        """
+
+        with self._lock:
+            if owner is not None and not self._index.execute(
+                "SELECT 1 FROM blob_refs WHERE sha256 = ? AND owner = ?",
+                (sha256, owner),
+            ).fetchone():
+                return None
+
+            return self._locate(sha256)
+
+    @contextmanager
+    def open_view(self, location: BlobLocation) -> Iterator[memoryview]:
+        """
+        Mapeia o trecho do segmento em memória e expõe um memoryview
+        somente leitura, sem copiar o conteúdo.
+        """
+
+        if location.length == 0:
+            yield memoryview(b"")
+            return
+
+        # mmap exige offset alinhado à granularidade de alocação
+        inicio = location.offset - (location.offset % mmap.ALLOCATIONGRANULARITY)
+        deslocamento = location.offset - inicio
+
+        with open(self._caminho_segmento(location.segment), "rb") as arquivo:
+            mapa = mmap.mmap(
+                arquivo.fileno(),
+                deslocamento + location.length,
+                access=mmap.ACCESS_READ,
+                offset=inicio,
+            )
+
+        view = memoryview(mapa)
+        trecho = view[deslocamento:deslocamento + location.length]
+        try:
+            yield trecho
+        finally:
+            trecho.release()
+            view.release()
+            try:
+                mapa.close()
+            except BufferError:
+                # Algum consumidor ainda referencia um trecho do mapa;
+                # o mapeamento é liberado quando ele for coletado
+                pass
+
+    def iter_chunks(
+        self, location: BlobLocation, chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[memoryview]:
+        with self.open_view(location) as view:
+            for inicio in range(0, location.length, chunk_size):
+                chunk = view[inicio:inicio + chunk_size]
+                try:
+                    yield chunk
+                finally:
+                    chunk.release()
+
+    # =========================
+    # INTERNOS
+    # =========================
+
+    def _locate(self, sha256: str) -> Optional[BlobLocation]:
+        row = self._index.execute(
+            "SELECT segment, offset, length FROM blobs WHERE sha256 = ?",
+            (sha256,),
+        ).fetchone()
+
+        if not row:
+            return None
+
+        return BlobLocation(sha256, row[0], row[1], row[2])
+
+    def _reservar(self, length: int) -> "tuple[int, int]":
+        """
+        Reserva `length` bytes no fim do segmento corrente.
+        Deve ser chamado com o lock.
+        """
+
+        if self._cauda >= self.segment_max_bytes:
+            self._segment += 1
+            self._cauda = self._tamanho_segmento(self._segment)
+
+        offset = self._cauda
+        self._cauda += length
+        self._em_escrita[self._segment] = self._em_escrita.get(self._segment, 0) + 1
+
+        return self._segment, offset
+
+    def _copiar(self, origem: BinaryIO, segment: int, offset: int) -> None:
+        # Cada upload escreve apenas na sua região; não precisa do lock
+        descritor = os.open(self._caminho_segmento(segment), os.O_RDWR | os.O_CREAT)
+        with os.fdopen(descritor, "r+b") as segmento:
+            segmento.seek(offset)
+            shutil.copyfileobj(origem, segmento, CHUNK_SIZE)
+            segmento.flush()
+            os.fsync(segmento.fileno())
+
+    def _referenciar(self, sha256: str, owner: Optional[str]) -> None:
+        if owner:
+            self._index.execute(
+                "INSERT OR IGNORE INTO blob_refs VALUES (?, ?)", (sha256, owner)
+            )
+
+    def _apagar(self, location: BlobLocation) -> None:
+        """
+        Sobrescreve o conteúdo com zeros antes de retirá-lo do índice, e
+        remove o segmento (exceto o corrente) quando ele fica vazio.
+        Deve ser chamado com o lock.
+        """
+
+        caminho = self._caminho_segmento(location.segment)
+        self._zerar(location)
+
+        self._index.execute("DELETE FROM blobs WHERE sha256 = ?", (location.sha256,))
+        self._index.commit()
+
+        vivos = self._index.execute(
+            "SELECT COUNT(*) FROM blobs WHERE segment = ?", (location.segment,)
+        ).fetchone()[0]
+
+        if (
+            not vivos
+            and location.segment != self._segment
+            and not self._em_escrita.get(location.segment)
+            and os.path.exists(caminho)
+        ):
+            os.remove(caminho)
+
+    def _zerar(self, location: BlobLocation) -> None:
+        caminho = self._caminho_segmento(location.segment)
+
+        if not os.path.exists(caminho):
+            return
+
+        with open(caminho, "r+b") as segmento:
+            segmento.seek(location.offset)
+            restante = location.length
+            while restante:
+                tamanho = min(restante, CHUNK_SIZE)
+                segmento.write(bytes(tamanho))
+                restante -= tamanho
+            segmento.flush()
+            os.fsync(segmento.fileno())
+
+    def _caminho_segmento(self, segment: int) -> str:
+        return os.path.join(self.root, f"segment-{segment:06d}.dat")
+
+    def _tamanho_segmento(self, segment: int) -> int:
+        caminho = self._caminho_segmento(segment)
+        return os.path.getsize(caminho) if os.path.exists(caminho) else 0
+
+    def _ultimo_segmento(self) -> int:
+        row = self._index.execute("SELECT MAX(segment) FROM blobs").fetchone()
+        return row[0] if row and row[0] is not None else 1
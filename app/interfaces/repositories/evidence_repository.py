@@ -0,0 +1,68 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from app.domain.entities.evidence import Evidence
+from app.interfaces.repositories.pagination import Page, DEFAULT_PAGE_SIZE
+
+
+@dataclass
+class EvidenceFilter:
+    fonte: Optional[str] = None
+    tipo: Optional[str] = None
+    desde: Optional[datetime] = None
+    ate: Optional[datetime] = None
+
+
+@dataclass
+class EvidenceSummary:
+    """
+    Projeção de Evidence para listagens. O payload `dado` só é carregado
+    quando solicitado explicitamente.
+    """
+
+    id: UUID
+    investigation_id: UUID
+    person_id: Optional[UUID]
+    tipo: str
+    fonte: str
+    coletado_por: str
+    data_coleta: datetime
+    hash_integridade: str
+    dado: Optional[Dict[str, Any]] = None
+
+
+class EvidenceRepository(ABC):
+    """
+    Contrato de persistência de evidências. Evidências são imutáveis:
+    não há operação de atualização.
+    """
+
+    @abstractmethod
+    def save(self, evidence: Evidence) -> None:
+        ...
+
+    @abstractmethod
+    def get_by_id(self, evidence_id: UUID) -> Optional[Evidence]:
+        ...
+
+    @abstractmethod
+    def list_by_investigation(self, investigation_id: UUID) -> List[Evidence]:
+        ...
+
+    @abstractmethod
+    def list_page(
+        self,
+        investigation_id: UUID,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        filtros: Optional[EvidenceFilter] = None,
+        incluir_dado: bool = False,
+    ) -> Page[EvidenceSummary]:
+        """
+        Paginação por cursor sobre (data_coleta, id), com filtros
+        aplicados no banco e projeção opcional do payload.
+        """
+        ...
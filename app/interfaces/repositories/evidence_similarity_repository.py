@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from app.domain.entities.evidence import Evidence
+
+
+class EvidenceSimilarityRepository(ABC):
+    """
+    Índice de similaridade (MinHash + LSH) sobre o conteúdo normalizado
+    das evidências, para detectar quase-duplicatas entre fontes.
+    """
+
+    @abstractmethod
+    def index_batch(self, evidences: List[Evidence]) -> None:
+        ...
+
+    @abstractmethod
+    def similar(
+        self,
+        evidence_id: UUID,
+        limiar: float = 0.8,
+        investigation_id: Optional[UUID] = None,
+    ) -> List[Tuple[UUID, float]]:
+        """
+        Evidências similares à informada, com a similaridade estimada,
+        em ordem decrescente. Com `investigation_id`, tanto a referência
+        quanto os candidatos são restritos à investigação.
+        """
+        ...
+
+    @abstractmethod
+    def near_duplicate_clusters(
+        self, investigation_id: UUID, limiar: float = 0.8
+    ) -> List[List[UUID]]:
+        """
+        Grupos (com mais de um elemento) de evidências quase duplicadas.
+
+        Os grupos são transitivos: dois membros podem estar abaixo do
+        limiar entre si quando ligados por um terceiro. Quem precisa da
+        similaridade direta deve confirmá-la com `similar`.
+        """
+        ...
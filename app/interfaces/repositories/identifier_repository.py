@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Iterator, Tuple
+from uuid import UUID
+
+from app.domain.entities.identifier import Identifier
+
+
+class IdentifierRepository(ABC):
+    """
+    Contrato de persistência dos identificadores observáveis de pessoas.
+    """
+
+    @abstractmethod
+    def save(self, person_id: UUID, identifier: Identifier) -> None:
+        ...
+
+    @abstractmethod
+    def iter_links(self) -> Iterator[Tuple[UUID, str, str]]:
+        """
+        Percorre todas as associações (person_id, tipo, valor) em uma
+        única consulta, para carga em lote do grafo de identidade.
+        """
+        ...
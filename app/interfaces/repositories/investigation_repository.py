@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from app.domain.entities.investigation import Investigation
+
+
+class InvestigationRepository(ABC):
+    """
+    Contrato de persistência de investigações.
+    """
+
+    @abstractmethod
+    def save(self, investigation: Investigation) -> None:
+        """
+        Persiste a investigação. O consumo do orçamento de coleta não é
+        sobrescrito: ele só muda por `reservar_consumo`/`ajustar_consumo`.
+        """
+        ...
+
+    @abstractmethod
+    def get_by_id(self, investigation_id: UUID) -> Optional[Investigation]:
+        ...
+
+    @abstractmethod
+    def reservar_consumo(
+        self,
+        investigation_id: UUID,
+        custo_estimado: float,
+        tempo_estimado: float,
+    ) -> bool:
+        """
+        Verifica o orçamento contra o consumo persistido e, se couber,
+        registra mais uma consulta com o custo e o tempo estimados, de
+        forma atômica. Retorna False quando o orçamento não permite.
+        """
+        ...
+
+    @abstractmethod
+    def ajustar_consumo(self, investigation_id: UUID, tempo_segundos: float) -> None:
+        """
+        Corrige atomicamente o tempo consumido (tempo real - estimado).
+        """
+        ...
@@ -0,0 +1,43 @@
+import base64
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Generic, List, Optional, Tuple, TypeVar
+
+from app.domain.exceptions.domain_exceptions import DomainValidationError
+
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+@dataclass
+class Page(Generic[T]):
+    """
+    Página de resultados com cursor opaco para a próxima página (keyset).
+    """
+
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(sort_value: datetime, item_id: str) -> str:
+    raw = f"{sort_value.isoformat()}|{item_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        sort_value, item_id = raw.split("|", 1)
+        return datetime.fromisoformat(sort_value), item_id
+    except (ValueError, UnicodeError) as exc:
+        raise DomainValidationError("Cursor de paginação inválido.") from exc
+
+
+def clamp_page_size(limit: int) -> int:
+    if limit < 1:
+        raise DomainValidationError("Tamanho de página inválido.")
+
+    return min(limit, MAX_PAGE_SIZE)
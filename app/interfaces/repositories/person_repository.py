@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from app.domain.entities.person import Person
+from app.interfaces.repositories.pagination import Page, DEFAULT_PAGE_SIZE
+
+
+@dataclass
+class PersonSummary:
+    """
+    Projeção leve de Person para listagens (sem identificadores).
+    """
+
+    id: UUID
+    investigation_id: UUID
+    display_name: Optional[str]
+    created_at: datetime
+
+
+class PersonRepository(ABC):
+    """
+    Contrato de persistência de pessoas investigadas.
+    """
+
+    @abstractmethod
+    def save(self, person: Person) -> None:
+        ...
+
+    @abstractmethod
+    def get_by_id(self, person_id: UUID) -> Optional[Person]:
+        ...
+
+    @abstractmethod
+    def list_by_investigation(self, investigation_id: UUID) -> List[Person]:
+        ...
+
+    @abstractmethod
+    def list_page(
+        self,
+        investigation_id: UUID,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[PersonSummary]:
+        """
+        Paginação por cursor sobre (created_at, id).
+        """
+        ...
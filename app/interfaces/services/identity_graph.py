@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple, Union
+from uuid import UUID
+
+from app.domain.entities.identifier import Identifier
+
+
+IdentifierKey = Tuple[str, str]
+GraphNode = Union[UUID, IdentifierKey]
+
+
+class IdentityGraphService(ABC):
+    """
+    Contrato do grafo de resolução de identidade: pessoas ligadas pelos
+    identificadores que compartilham.
+    """
+
+    @abstractmethod
+    def add_person(self, person_id: UUID) -> None:
+        ...
+
+    @abstractmethod
+    def add_link(self, person_id: UUID, identifier: Identifier) -> None:
+        """
+        Atualização incremental, chamada após persistir um novo
+        identificador de uma pessoa.
+        """
+        ...
+
+    @abstractmethod
+    def cluster_for(self, person_id: UUID) -> Dict[str, list]:
+        ...
+
+    @abstractmethod
+    def same_cluster(self, person_a: UUID, person_b: UUID) -> bool:
+        ...
+
+    @abstractmethod
+    def shortest_link_path(
+        self, person_a: UUID, person_b: UUID
+    ) -> Optional[List[GraphNode]]:
+        ...
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from app.domain.entities.identifier import Identifier
+
+
+@dataclass
+class OSINTResult:
+    source: str
+    data: Dict[str, Any]
+
+
+class OSINTService(ABC):
+    """
+    Contrato dos coletores OSINT automatizados.
+    """
+
+    @abstractmethod
+    def collect(self, identifier: Identifier, sources: List[str]) -> List[OSINTResult]:
+        ...
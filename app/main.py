@@ -0,0 +1,78 @@
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+
+from app.api.dependencies import ADMIN_TOKEN_HEADER, admin_token_valido
+from app.api.routes import admin, evidence, investigations, persons
+from app.infrastructure.audit.audited_use_case import (
+    AUDIT_ACTOR_HEADER,
+    close_audit_log,
+    reset_audit_actor,
+    set_audit_actor,
+)
+from app.infrastructure.persistence.sqlite.database import SHARDED, init_db
+from app.infrastructure.persistence.sqlite.sharding import get_shard_router
+from app.infrastructure.profiling.profiler import (
+    PROFILE_HEADER,
+    profiler,
+    reset_request_profiling,
+    set_request_profiling,
+)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    if SHARDED:
+        get_shard_router()
+    else:
+        init_db()
+
+    yield
+
+    if SHARDED:
+        get_shard_router().close()
+    close_audit_log()
+
+
+app = FastAPI(title="OSINT Investigation Framework", lifespan=lifespan)
+
+app.include_router(investigations.router)
+app.include_router(persons.router)
+app.include_router(evidence.router)
+app.include_router(evidence.attachments_router)
+app.include_router(admin.router)
+
+
+@app.middleware("http")
+async def profile_requests(request: Request, call_next):
+    if not profiler.enabled:
+        return await call_next(request)
+
+    # Uma decisão por requisição: sorteada por sample_rate, ou forçada pelo
+    # header X-Profile quando autenticada como administrativa. Os use cases
+    # executados pela requisição seguem a mesma decisão
+    selecionada = profiler.sample(
+        forcar=bool(request.headers.get(PROFILE_HEADER))
+        and admin_token_valido(request.headers.get(ADMIN_TOKEN_HEADER))
+    )
+
+    token = set_request_profiling(selecionada)
+    try:
+        with profiler.perfilar(f"{request.method}{request.url.path}", selecionada):
+            return await call_next(request)
+    finally:
+        reset_request_profiling(token)
+
+
+@app.middleware("http")
+async def audit_actor(request: Request, call_next):
+    # Ator registrado no log de auditoria pelos use cases da requisição
+    ator = request.headers.get(AUDIT_ACTOR_HEADER)
+    if not ator:
+        return await call_next(request)
+
+    token = set_audit_actor(ator)
+    try:
+        return await call_next(request)
+    finally:
+        reset_audit_actor(token)
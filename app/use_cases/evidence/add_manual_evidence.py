@@ -4,9 +4,15 @@ from typing import Optional
 
 from app.domain.entities.evidence import Evidence
 from app.domain.exceptions.domain_exceptions import DomainValidationError
+from app.domain.value_objects.evidence_type import EvidenceType
 from app.interfaces.repositories.investigation_repository import InvestigationRepository
 from app.interfaces.repositories.person_repository import PersonRepository
 from app.interfaces.repositories.evidence_repository import EvidenceRepository
+from app.interfaces.repositories.evidence_similarity_repository import (
+    EvidenceSimilarityRepository,
+)
+from app.infrastructure.audit.audited_use_case import audited
+from app.infrastructure.profiling.profiler import profiled
 
 
 @dataclass
@@ -28,11 +34,17 @@ class AddManualEvidence:
         investigation_repository: InvestigationRepository,
         evidence_repository: EvidenceRepository,
         person_repository: Optional[PersonRepository] = None,
+        coletado_por: str = "MANUAL",
+        similarity_repository: Optional[EvidenceSimilarityRepository] = None,
     ):
         self.investigation_repository = investigation_repository
         self.evidence_repository = evidence_repository
         self.person_repository = person_repository
+        self.coletado_por = coletado_por
+        self.similarity_repository = similarity_repository
 
+    @audited
+    @profiled
     def execute(self, input_data: AddManualEvidenceInput) -> Evidence:
         # 1. Verificar se a investigação existe
         investigation = self.investigation_repository.get_by_id(
@@ -63,12 +75,18 @@ class AddManualEvidence:
         evidence = Evidence(
             investigation_id=input_data.investigation_id,
             person_id=input_data.person_id,
-            description=input_data.description,
-            source=input_data.source,
+            tipo=EvidenceType.MANUAL,
+            fonte=input_data.source,
+            dado={"descricao": input_data.description},
+            coletado_por=self.coletado_por,
         )
 
         # 5. Persistir
         self.evidence_repository.save(evidence)
 
-        # 6. Retornar evidência criada
+        # 6. Indexar similaridade (somente após persistir)
+        if self.similarity_repository:
+            self.similarity_repository.index_batch([evidence])
+
+        # 7. Retornar evidência criada
         return evidence
\ No newline at end of file
@@ -1,11 +1,15 @@
 from dataclasses import dataclass
 from uuid import UUID
+from typing import Optional
 
 from app.domain.entities.identifier import Identifier
 from app.domain.value_objects.identifier_type import IdentifierType
 from app.domain.exceptions.domain_exceptions import DomainValidationError
 from app.interfaces.repositories.person_repository import PersonRepository
 from app.interfaces.repositories.identifier_repository import IdentifierRepository
+from app.interfaces.services.identity_graph import IdentityGraphService
+from app.infrastructure.audit.audited_use_case import audited
+from app.infrastructure.profiling.profiler import profiled
 
 
 @dataclass
@@ -26,10 +30,14 @@ class AddIdentifierToPerson:
         self,
         person_repository: PersonRepository,
         identifier_repository: IdentifierRepository,
+        identity_graph: Optional[IdentityGraphService] = None,
     ):
         self.person_repository = person_repository
         self.identifier_repository = identifier_repository
+        self.identity_graph = identity_graph
 
+    @audited
+    @profiled
     def execute(self, input_data: AddIdentifierInput) -> Identifier:
         # 1. Verificar se a pessoa existe
         person = self.person_repository.get_by_id(input_data.person_id)
@@ -39,18 +47,20 @@ class AddIdentifierToPerson:
 
         # 2. Criar o identificador (domínio valida formato e consistência)
         identifier = Identifier(
-            person_id=person.id,
-            identifier_type=input_data.identifier_type,
-            value=input_data.value,
-            source=input_data.source,
+            tipo=input_data.identifier_type,
+            valor=input_data.value,
         )
 
         # 3. Regra de domínio: associar e evitar duplicidade
         person.add_identifier(identifier)
 
         # 4. Persistir (ordem importa para cadeia de custódia)
-        self.identifier_repository.save(identifier)
+        self.identifier_repository.save(person.id, identifier)
         self.person_repository.save(person)
 
-        # 5. Retornar identificador criado
+        # 5. Atualizar grafo de identidade (somente após persistir)
+        if self.identity_graph:
+            self.identity_graph.add_link(person.id, identifier)
+
+        # 6. Retornar identificador criado
         return identifier
\ No newline at end of file
@@ -3,6 +3,8 @@ from uuid import UUID
 
 from app.domain.exceptions.domain_exceptions import DomainValidationError
 from app.interfaces.repositories.investigation_repository import InvestigationRepository
+from app.infrastructure.audit.audited_use_case import audited
+from app.infrastructure.profiling.profiler import profiled
 
 
 @dataclass
@@ -19,6 +21,8 @@ class CloseInvestigation:
     def __init__(self, investigation_repository: InvestigationRepository):
         self.investigation_repository = investigation_repository
 
+    @audited
+    @profiled
     def execute(self, input_data: CloseInvestigationInput) -> None:
         # 1. Recuperar investigação
         investigation = self.investigation_repository.get_by_id(
@@ -3,6 +3,8 @@ from dataclasses import dataclass
 from app.domain.entities.investigation import Investigation
 from app.domain.value_objects.base_legal import BaseLegal, LegalBasisType
 from app.interfaces.repositories.investigation_repository import InvestigationRepository
+from app.infrastructure.audit.audited_use_case import audited
+from app.infrastructure.profiling.profiler import profiled
 
 
 @dataclass
@@ -22,6 +24,8 @@ class CreateInvestigation:
     def __init__(self, investigation_repository: InvestigationRepository):
         self.investigation_repository = investigation_repository
 
+    @audited
+    @profiled
     def execute(self, input_data: CreateInvestigationInput) -> Investigation:
         # 1. Criar Base Legal
         base_legal = BaseLegal(
@@ -33,7 +37,7 @@ class CreateInvestigation:
         # 2. Criar Investigação
         investigation = Investigation(
             titulo=input_data.titulo,
-            objetivo=input_data.objetivo,
+            finalidade=input_data.objetivo,
             base_legal=base_legal,
         )
 
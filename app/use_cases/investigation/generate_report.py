@@ -1,16 +1,24 @@
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from app.domain.exceptions.domain_exceptions import DomainValidationError
 from app.interfaces.repositories.investigation_repository import InvestigationRepository
 from app.interfaces.repositories.person_repository import PersonRepository
 from app.interfaces.repositories.evidence_repository import EvidenceRepository
+from app.interfaces.repositories.evidence_similarity_repository import (
+    EvidenceSimilarityRepository,
+)
+from app.infrastructure.audit.audited_use_case import audited
+from app.infrastructure.profiling.profiler import profiled
 
 
 @dataclass
 class GenerateReportInput:
     investigation_id: UUID
+    colapsar_duplicatas: bool = False
+    limiar_similaridade: float = 0.8
 
 
 class GenerateReport:
@@ -24,11 +32,15 @@ class GenerateReport:
         investigation_repository: InvestigationRepository,
         person_repository: PersonRepository,
         evidence_repository: EvidenceRepository,
+        similarity_repository: Optional[EvidenceSimilarityRepository] = None,
     ):
         self.investigation_repository = investigation_repository
         self.person_repository = person_repository
         self.evidence_repository = evidence_repository
+        self.similarity_repository = similarity_repository
 
+    @audited
+    @profiled
     def execute(self, input_data: GenerateReportInput) -> Dict[str, Any]:
         # 1. Recuperar investigação
         investigation = self.investigation_repository.get_by_id(
@@ -58,7 +70,41 @@ class GenerateReport:
             investigation.id
         )
 
-        # 4. Organizar evidências por pessoa
+        # 4. Colapsar quase-duplicatas (opcional)
+        duplicatas: Dict[UUID, List[UUID]] = {}
+
+        if input_data.colapsar_duplicatas:
+            if not self.similarity_repository:
+                raise DomainValidationError(
+                    "Índice de similaridade não configurado."
+                )
+
+            por_id = {evidence.id: evidence for evidence in evidences}
+
+            for cluster in self.similarity_repository.near_duplicate_clusters(
+                investigation.id, limiar=input_data.limiar_similaridade
+            ):
+                # Agrupa por pessoa: cada pessoa mantém seu representante,
+                # a evidência mais antiga entre as suas
+                por_pessoa: Dict[Optional[UUID], List[UUID]] = {}
+                for eid in cluster:
+                    if eid in por_id:
+                        por_pessoa.setdefault(por_id[eid].person_id, []).append(eid)
+
+                for membros in por_pessoa.values():
+                    membros.sort(key=lambda eid: (por_id[eid].data_coleta, str(eid)))
+                    duplicatas.update(
+                        self._confirmar_duplicatas(
+                            membros,
+                            investigation.id,
+                            input_data.limiar_similaridade,
+                        )
+                    )
+
+            ocultas = {eid for membros in duplicatas.values() for eid in membros}
+            evidences = [e for e in evidences if e.id not in ocultas]
+
+        # 5. Organizar evidências por pessoa
         evidencias_por_pessoa: Dict[UUID, List[dict]] = {}
         evidencias_gerais: List[dict] = []
 
@@ -73,6 +119,81 @@ class GenerateReport:
                 "hash_integridade": evidence.hash_integridade,
             }
 
+            if evidence.id in duplicatas:
+                evidence_dict["quase_duplicatas"] = [
+                    str(eid) for eid in duplicatas[evidence.id]
+                ]
+
             if evidence.person_id:
                 evidencias_por_pessoa.setdefault(
-                    evidence.per
+                    evidence.person_id, []
+                ).append(evidence_dict)
+            else:
+                evidencias_gerais.append(evidence_dict)
+
+        # 6. Montar relatório
+        return {
+            "investigacao": {
+                "id": str(investigation.id),
+                "titulo": investigation.titulo,
+                "finalidade": investigation.finalidade,
+                "base_legal": {
+                    "fundamento": investigation.base_legal.fundamento.value,
+                    "descricao": investigation.base_legal.descricao,
+                },
+                "status": investigation.status.value,
+                "data_criacao": investigation.data_criacao.isoformat(),
+                "data_encerramento": investigation.data_encerramento.isoformat()
+                if investigation.data_encerramento
+                else None,
+            },
+            "planejamento": {
+                "objetivo": investigation.objective,
+                "escopo": investigation.scope,
+                "fontes_permitidas": investigation.allowed_sources,
+                "notas_legais": investigation.legal_notes,
+            },
+            "pessoas": [
+                {
+                    "id": str(person.id),
+                    "display_name": person.display_name,
+                    "identificadores": [
+                        {"tipo": identifier.tipo.value, "valor": identifier.valor}
+                        for identifier in person.identifiers
+                    ],
+                    "evidencias": evidencias_por_pessoa.get(person.id, []),
+                }
+                for person in persons
+            ],
+            "evidencias_gerais": evidencias_gerais,
+            "data_geracao": datetime.utcnow().isoformat(),
+        }
+
+    def _confirmar_duplicatas(
+        self, membros: List[UUID], investigation_id: UUID, limiar: float
+    ) -> Dict[UUID, List[UUID]]:
+        """
+        Os grupos do índice são transitivos; aqui cada duplicata listada é
+        confirmada diretamente contra seu representante (a mais antiga
+        ainda não atribuída). As que não atingem o limiar formam grupos
+        próprios, com outro representante.
+        """
+
+        duplicatas: Dict[UUID, List[UUID]] = {}
+        restantes = list(membros)
+
+        while len(restantes) > 1:
+            representante = restantes.pop(0)
+            similares = {
+                eid
+                for eid, _ in self.similarity_repository.similar(
+                    representante, limiar=limiar, investigation_id=investigation_id
+                )
+            }
+
+            confirmadas = [eid for eid in restantes if eid in similares]
+            if confirmadas:
+                duplicatas[representante] = confirmadas
+                restantes = [eid for eid in restantes if eid not in similares]
+
+        return duplicatas
@@ -3,7 +3,10 @@ from uuid import UUID
 from typing import List, Optional
 
 from app.domain.exceptions.domain_exceptions import DomainValidationError
+from app.domain.value_objects.collection_budget import CollectionBudget
 from app.interfaces.repositories.investigation_repository import InvestigationRepository
+from app.infrastructure.audit.audited_use_case import audited
+from app.infrastructure.profiling.profiler import profiled
 
 
 @dataclass
@@ -13,6 +16,9 @@ class PlanInvestigationInput:
     scope: str
     allowed_sources: List[str]
     legal_notes: Optional[str] = None
+    max_chamadas: Optional[int] = None
+    max_tempo_segundos: Optional[float] = None
+    max_custo: Optional[float] = None
 
 
 class PlanInvestigation:
@@ -23,6 +29,8 @@ class PlanInvestigation:
     def __init__(self, investigation_repository: InvestigationRepository):
         self.investigation_repository = investigation_repository
 
+    @audited
+    @profiled
     def execute(self, input_data: PlanInvestigationInput) -> None:
         # 1. Recuperar investigação
         investigation = self.investigation_repository.get_by_id(
@@ -44,13 +52,30 @@ class PlanInvestigation:
                 "Planejamento da investigação já foi definido."
             )
 
-        # 4. Aplicar planejamento
+        # 4. Definir orçamento de coleta (opcional)
+        collection_budget = None
+        if any(
+            limite is not None
+            for limite in (
+                input_data.max_chamadas,
+                input_data.max_tempo_segundos,
+                input_data.max_custo,
+            )
+        ):
+            collection_budget = CollectionBudget(
+                max_chamadas=input_data.max_chamadas,
+                max_tempo_segundos=input_data.max_tempo_segundos,
+                max_custo=input_data.max_custo,
+            )
+
+        # 5. Aplicar planejamento
         investigation.definir_planejamento(
             objective=input_data.objective,
             scope=input_data.scope,
             allowed_sources=input_data.allowed_sources,
             legal_notes=input_data.legal_notes,
+            collection_budget=collection_budget,
         )
 
-        # 5. Persistir alterações
+        # 6. Persistir alterações
         self.investigation_repository.save(investigation)
\ No newline at end of file
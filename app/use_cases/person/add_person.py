@@ -6,6 +6,8 @@ from app.domain.entities.person import Person
 from app.domain.exceptions.domain_exceptions import DomainValidationError
 from app.interfaces.repositories.investigation_repository import InvestigationRepository
 from app.interfaces.repositories.person_repository import PersonRepository
+from app.infrastructure.audit.audited_use_case import audited
+from app.infrastructure.profiling.profiler import profiled
 
 
 @dataclass
@@ -28,6 +30,8 @@ class AddPersonToInvestigation:
         self.investigation_repository = investigation_repository
         self.person_repository = person_repository
 
+    @audited
+    @profiled
     def execute(self, input_data: AddPersonInput) -> Person:
         # 1. Verificar se a investigação existe
         investigation = self.investigation_repository.get_by_id(
@@ -1,17 +1,36 @@
+import logging
+import time
 from dataclasses import dataclass
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 
 from app.domain.entities.evidence import Evidence
 from app.domain.exceptions.domain_exceptions import DomainValidationError
 from app.domain.value_objects.evidence_type import EvidenceType
+from app.domain.services.collection_planner import CollectionPlanner
 
 from app.interfaces.repositories.investigation_repository import InvestigationRepository
 from app.interfaces.repositories.person_repository import PersonRepository
 from app.interfaces.repositories.evidence_repository import EvidenceRepository
+from app.interfaces.repositories.evidence_similarity_repository import (
+    EvidenceSimilarityRepository,
+)
 from app.interfaces.services.osint_service import OSINTService
+from app.infrastructure.osint.source_stats import (
+    SourceStatsRegistry,
+    get_source_stats_registry,
+)
+from app.infrastructure.osint.transport.record_replay import (
+    CASSETTE_DIR,
+    MODO_REPLAY,
+    open_transport,
+)
+from app.infrastructure.audit.audited_use_case import audited
+from app.infrastructure.profiling.profiler import profiled
 
 
+logger = logging.getLogger(__name__)
+
 @dataclass
 class CollectPersonOSINTInput:
     investigation_id: UUID
@@ -23,6 +42,16 @@ class CollectPersonOSINT:
     """
     Use Case responsável por coletar dados OSINT automatizados
     para uma pessoa investigada, respeitando o planejamento.
+
+    As consultas seguem o plano do CollectionPlanner (mais baratas e
+    produtivas primeiro); as que não cabem no saldo do orçamento da
+    investigação são puladas, e as seguintes, mais caras na cota ou no
+    tempo estimado, ainda podem caber.
+
+    Com `modo_transporte`, cada execução grava ("record") as consultas no
+    cassete da investigação ou as reproduz dele ("replay"). O replay não
+    consulta as fontes reais, portanto não consome orçamento nem alimenta
+    o histórico das fontes.
     """
 
     def __init__(
@@ -32,13 +61,27 @@ class CollectPersonOSINT:
         evidence_repository: EvidenceRepository,
         osint_service: OSINTService,
         coletado_por: str = "OSINT_AUTOMATED",
+        source_stats: Optional[SourceStatsRegistry] = None,
+        planner: Optional[CollectionPlanner] = None,
+        similarity_repository: Optional[EvidenceSimilarityRepository] = None,
+        modo_transporte: Optional[str] = None,
+        cassette_root: str = CASSETTE_DIR,
+        fator_latencia: Optional[float] = None,
     ):
         self.investigation_repository = investigation_repository
         self.person_repository = person_repository
         self.evidence_repository = evidence_repository
         self.osint_service = osint_service
         self.coletado_por = coletado_por
-
+        self.source_stats = source_stats or get_source_stats_registry()
+        self.planner = planner or CollectionPlanner()
+        self.similarity_repository = similarity_repository
+        self.modo_transporte = modo_transporte
+        self.cassette_root = cassette_root
+        self.fator_latencia = fator_latencia
+
+    @audited
+    @profiled
     def execute(self, input_data: CollectPersonOSINTInput) -> List[Evidence]:
         # 1. Recuperar investigação
         investigation = self.investigation_repository.get_by_id(
@@ -80,26 +123,80 @@ class CollectPersonOSINT:
                 "Pessoa não pertence à investigação informada."
             )
 
-        evidencias_coletadas: List[Evidence] = []
+        # 5. Montar plano de execução (incompatíveis descartados)
+        consultas = self.planner.plan(
+            identifiers=person.identifiers,
+            sources=input_data.requested_sources,
+            perfis=self.source_stats.snapshot(),
+        )
 
-        # 5. Executar OSINT por identificador
-        for identifier in person.identifiers:
-            resultados = self.osint_service.collect(
-                identifier=identifier,
-                sources=input_data.requested_sources,
-            )
+        evidencias_coletadas: List[Evidence] = []
+        replay = self.modo_transporte == MODO_REPLAY
+        transporte = open_transport(
+            self.osint_service,
+            self.modo_transporte,
+            self.cassette_root,
+            investigation.id,
+            fator_latencia=self.fator_latencia,
+        )
 
-            for resultado in resultados:
-                evidence = Evidence(
-                    investigation_id=investigation.id,
-                    person_id=person.id,
-                    tipo=EvidenceType.OSINT_AUTOMATED,
-                    fonte=resultado.source,
-                    dado=resultado.data,
-                    coletado_por=self.coletado_por,
-                )
-
-                self.evidence_repository.save(evidence)
-                evidencias_coletadas.append(evidence)
+        try:
+            # 6. Executar as consultas que couberem no orçamento. A reserva
+            # é atômica no repositório: coletas simultâneas da mesma
+            # investigação não ultrapassam o orçamento
+            for consulta in consultas:
+                if not replay and not self.investigation_repository.reservar_consumo(
+                    investigation.id,
+                    custo_estimado=consulta.custo_estimado,
+                    tempo_estimado=consulta.latencia_estimada,
+                ):
+                    continue
+
+                inicio = time.perf_counter()
+                resultados = []
+                try:
+                    resultados = transporte.collect(
+                        identifier=consulta.identifier,
+                        sources=[consulta.fonte],
+                    )
+                finally:
+                    # 7. Registrar o tempo real, mesmo se a consulta falhar
+                    if not replay:
+                        latencia = time.perf_counter() - inicio
+                        self.source_stats.registrar(
+                            consulta.fonte, latencia, sucesso=bool(resultados)
+                        )
+                        self.investigation_repository.ajustar_consumo(
+                            investigation.id, latencia - consulta.latencia_estimada
+                        )
+
+                for resultado in resultados:
+                    evidence = Evidence(
+                        investigation_id=investigation.id,
+                        person_id=person.id,
+                        tipo=EvidenceType.OSINT_AUTOMATED,
+                        fonte=resultado.source,
+                        dado=resultado.data,
+                        coletado_por=self.coletado_por,
+                    )
+
+                    self.evidence_repository.save(evidence)
+                    evidencias_coletadas.append(evidence)
+        finally:
+            if transporte is not self.osint_service:
+                transporte.close()
+
+            # 8. Indexar em lote as evidências já persistidas e gravar o
+            # histórico das fontes, inclusive quando a coleta é interrompida
+            if self.similarity_repository and evidencias_coletadas:
+                self.similarity_repository.index_batch(evidencias_coletadas)
+
+            # O histórico é auxiliar: uma falha ao gravá-lo não substitui o
+            # resultado nem o erro da coleta
+            if not replay:
+                try:
+                    self.source_stats.salvar()
+                except Exception:
+                    logger.exception("Falha ao gravar o histórico das fontes.")
 
         return evidencias_coletadas
@@ -0,0 +1,53 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.infrastructure.audit import audited_use_case
+from app.infrastructure.audit.audit_log import AuditLog
+from app.infrastructure.persistence.sqlite import models  # noqa: F401
+from app.infrastructure.persistence.sqlite.database import Base, create_sqlite_engine
+from app.infrastructure.persistence.sqlite.models import InvestigationModel
+
+
+@pytest.fixture(autouse=True)
+def audit_log(tmp_path, monkeypatch):
+    # Use cases auditados gravam no diretório temporário do teste
+    log = AuditLog(str(tmp_path / "audit" / "custody.log"))
+    monkeypatch.setattr(audited_use_case, "_audit_log", log)
+    yield log
+    log.close()
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'osint.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    with Session(bind=engine, autoflush=False, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def investigation_id(session):
+    investigation_id = uuid4()
+    session.add(
+        InvestigationModel(
+            id=str(investigation_id),
+            titulo="Investigação de teste",
+            finalidade="Testes automatizados",
+            fundamento_legal="LEGITIMO_INTERESSE",
+            descricao_base_legal="Testes",
+            consentimento=False,
+            status="ABERTA",
+            data_criacao=datetime(2026, 1, 1),
+        )
+    )
+    session.commit()
+    return investigation_id
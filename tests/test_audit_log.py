@@ -0,0 +1,206 @@
+import hashlib
+import hmac
+import json
+import threading
+from dataclasses import dataclass
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.domain.exceptions.domain_exceptions import DomainValidationError
+from app.infrastructure.audit import audit_log as audit_log_module
+from app.infrastructure.audit import audited_use_case
+from app.infrastructure.audit.audit_log import AuditLog, AuditLogError, verify_chain
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return str(tmp_path / "custody.log")
+
+
+def _linhas(path):
+    with open(path, "rb") as arquivo:
+        return arquivo.read().splitlines()
+
+
+def test_group_commit_concorrente(log_path):
+    log = AuditLog(log_path)
+
+    def escrever(n):
+        for i in range(200):
+            log.append("Teste", f"thread-{n}", {"i": i})
+
+    threads = [threading.Thread(target=escrever, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert log.flush(timeout=10)
+    log.close()
+
+    resultado = verify_chain(log_path)
+    assert resultado.valida
+    assert resultado.entradas == 1600
+
+
+def test_detalhes_nao_nativos(log_path):
+    log = AuditLog(log_path)
+    log.append("Teste", "ator", {"mapa": {uuid4(): 1}, "ordem": {10: 1, 9: 2}})
+    log.append("Teste", "ator", {"id": uuid4(), "conjunto": {1}})
+    assert log.flush(timeout=5)
+    log.close()
+
+    assert verify_chain(log_path).valida
+
+
+def test_adulteracao_detectada(log_path):
+    log = AuditLog(log_path)
+    for i in range(5):
+        log.append("Teste", "ator", {"i": i})
+    log.close()
+
+    linhas = _linhas(log_path)
+    linhas[2] = linhas[2].replace(b'"i":2', b'"i":7')
+    with open(log_path, "wb") as arquivo:
+        arquivo.write(b"\n".join(linhas) + b"\n")
+
+    resultado = verify_chain(log_path)
+    assert not resultado.valida
+    assert resultado.seq_erro == 3
+
+
+def test_retoma_cadeia_apos_linha_parcial(log_path):
+    log = AuditLog(log_path)
+    for i in range(3):
+        log.append("Teste", "ator", {"i": i})
+    log.close()
+
+    # Queda no meio da gravação deixa uma linha incompleta no fim
+    with open(log_path, "ab") as arquivo:
+        arquivo.write(b'{"acao":"Teste","ator":"at')
+
+    log = AuditLog(log_path)
+    assert log.append("Teste", "ator", {"i": 3}) == 4
+    log.close()
+
+    resultado = verify_chain(log_path)
+    assert resultado.valida
+    assert resultado.entradas == 4
+
+
+def test_falha_de_fsync_repassada(log_path, monkeypatch):
+    log = AuditLog(log_path)
+    log.append("Teste", "ator")
+    assert log.flush(timeout=5)
+
+    def fsync_falho(_fd):
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(audit_log_module.os, "fsync", fsync_falho)
+
+    seq = log.append("Teste", "ator")
+    with pytest.raises(AuditLogError):
+        log.wait_durable(seq, timeout=5)
+
+    with pytest.raises(AuditLogError):
+        log.append("Teste", "ator")
+
+    log.close()
+
+
+@dataclass
+class _Entrada:
+    person_id: UUID
+    value: str
+
+
+class _Resultado:
+    def __init__(self):
+        self.id = uuid4()
+        self.hash_integridade = "f" * 64
+
+
+class _UseCase:
+    @audited_use_case.audited
+    def execute(self, input_data: _Entrada):
+        if input_data.value == "falhar":
+            raise DomainValidationError("Email inválido.")
+        return _Resultado()
+
+
+def test_decorator_registra_apenas_referencias(log_path, monkeypatch):
+    log = AuditLog(log_path)
+    monkeypatch.setattr(audited_use_case, "_audit_log", log)
+    monkeypatch.setattr(audited_use_case, "AUDIT_DIGEST_KEY", "chave")
+
+    person_id = uuid4()
+    token = audited_use_case.set_audit_actor("analista")
+    try:
+        _UseCase().execute(_Entrada(person_id, "alvo@example.com"))
+        with pytest.raises(DomainValidationError):
+            _UseCase().execute(_Entrada(person_id, "falhar"))
+    finally:
+        audited_use_case.reset_audit_actor(token)
+
+    log.close()
+    conteudo = b"".join(_linhas(log_path))
+    assert b"alvo@example.com" not in conteudo
+
+    sucesso, erro = [json.loads(linha) for linha in _linhas(log_path)]
+    assert sucesso["acao"] == "_UseCase"
+    assert sucesso["ator"] == "analista"
+    assert sucesso["detalhes"]["entrada"]["person_id"] == str(person_id)
+    conteudo = json.dumps(
+        {"person_id": str(person_id), "value": "alvo@example.com"},
+        sort_keys=True,
+        ensure_ascii=False,
+    ).encode("utf-8")
+    assert sucesso["detalhes"]["entrada"]["digest"] == hmac.new(
+        b"chave", conteudo, hashlib.sha256
+    ).hexdigest()
+    assert sucesso["detalhes"]["status"] == "OK"
+    assert erro["detalhes"]["status"] == "ERRO"
+    assert verify_chain(log_path).valida
+
+
+class _Contador:
+    def __init__(self):
+        self.execucoes = 0
+
+    @audited_use_case.audited
+    def execute(self, input_data: _Entrada):
+        self.execucoes += 1
+        raise DomainValidationError("Email inválido.")
+
+
+def test_decorator_nao_executa_sem_log_e_encadeia_erro(log_path, monkeypatch):
+    log = AuditLog(log_path)
+    monkeypatch.setattr(audited_use_case, "_audit_log", log)
+    use_case = _Contador()
+
+    def append_falho(*_):
+        raise AuditLogError("falha")
+
+    # Falha de gravação no registro do erro não esconde o erro original
+    monkeypatch.setattr(log, "append", append_falho)
+    with pytest.raises(AuditLogError) as info:
+        use_case.execute(_Entrada(uuid4(), "x"))
+    assert isinstance(info.value.__cause__, DomainValidationError)
+
+    # Log encerrado: o use case nem chega a executar
+    log.close()
+    with pytest.raises(AuditLogError):
+        use_case.execute(_Entrada(uuid4(), "x"))
+    assert use_case.execucoes == 1
+
+
+def test_segundo_escritor_recusado(log_path):
+    log = AuditLog(log_path)
+    try:
+        with pytest.raises(AuditLogError):
+            AuditLog(log_path)
+    finally:
+        log.close()
+
+    AuditLog(log_path).close()
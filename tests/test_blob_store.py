@@ -0,0 +1,97 @@
+import hashlib
+import io
+import os
+import threading
+from datetime import datetime
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.api import dependencies
+from app.infrastructure.persistence.sqlite.models import InvestigationModel
+from app.infrastructure.storage.blob_store import BlobStore
+from app.main import app
+
+
+def test_put_deduplicates_and_maps_content(tmp_path):
+    store = BlobStore(str(tmp_path / "blobs"))
+    conteudo = os.urandom(300_000)
+
+    primeiro = store.put(io.BytesIO(conteudo), owner="inv-a")
+    segundo = store.put(io.BytesIO(conteudo), owner="inv-b")
+    outro = store.put(io.BytesIO(b"outro anexo"))
+
+    assert primeiro == segundo
+    assert primeiro.sha256 == hashlib.sha256(conteudo).hexdigest()
+    assert outro.offset == primeiro.offset + primeiro.length
+    assert store.locate(primeiro.sha256, owner="inv-b") == primeiro
+    assert store.locate(primeiro.sha256, owner="inv-c") is None
+
+    with store.open_view(primeiro) as view:
+        assert view.readonly
+        assert bytes(view) == conteudo
+
+    assert b"".join(bytes(c) for c in store.iter_chunks(outro, 4)) == b"outro anexo"
+
+
+def test_concurrent_puts_keep_every_blob_intact(tmp_path):
+    store = BlobStore(str(tmp_path / "blobs"), segment_max_bytes=64 * 1024)
+    conteudos = [os.urandom(20_000 + indice) for indice in range(16)]
+    locations = [None] * len(conteudos)
+
+    def enviar(indice):
+        locations[indice] = store.put(io.BytesIO(conteudos[indice]))
+
+    threads = [
+        threading.Thread(target=enviar, args=(indice,))
+        for indice in range(len(conteudos))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({location.segment for location in locations}) > 1
+    for conteudo, location in zip(conteudos, locations):
+        with store.open_view(store.locate(location.sha256)) as view:
+            assert bytes(view) == conteudo
+
+
+def test_download_restricted_to_owning_investigation(
+    engine, session, investigation_id, tmp_path, monkeypatch
+):
+    outra = uuid4()
+    session.add(
+        InvestigationModel(
+            id=str(outra),
+            titulo="Outra",
+            finalidade="Teste",
+            fundamento_legal="LEGITIMO_INTERESSE",
+            descricao_base_legal="Teste",
+            status="ABERTA",
+            data_criacao=datetime(2026, 1, 1),
+        )
+    )
+    session.commit()
+
+    store = BlobStore(str(tmp_path / "blobs"))
+    monkeypatch.setattr(dependencies, "SessionLocal", sessionmaker(bind=engine))
+    monkeypatch.setitem(
+        app.dependency_overrides, dependencies.get_blob_store, lambda: store
+    )
+    client = TestClient(app)
+
+    resposta = client.post(
+        f"/investigations/{investigation_id}/attachments",
+        files={"arquivo": ("captura.png", b"conteudo do anexo", "image/png")},
+    )
+    assert resposta.status_code == 201
+    sha256 = resposta.json()["anexo"]["sha256"]
+
+    resposta = client.get(f"/investigations/{investigation_id}/attachments/{sha256}")
+    assert resposta.status_code == 200
+    assert resposta.content == b"conteudo do anexo"
+
+    resposta = client.get(f"/investigations/{outra}/attachments/{sha256}")
+    assert resposta.status_code == 404
@@ -0,0 +1,268 @@
+import json
+import os
+import threading
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.domain.entities.identifier import Identifier
+from app.domain.entities.investigation import Investigation
+from app.domain.entities.person import Person
+from app.domain.services.collection_planner import CollectionPlanner, SourceProfile
+from app.domain.value_objects.base_legal import BaseLegal, LegalBasisType
+from app.domain.value_objects.collection_budget import CollectionBudget
+from app.domain.value_objects.identifier_type import IdentifierType
+from app.infrastructure.osint.source_stats import SourceStatsRegistry
+from app.infrastructure.persistence.sqlite.repositories.evidence_repo import (
+    SQLiteEvidenceRepository,
+)
+from app.infrastructure.persistence.sqlite.repositories.identifier_repo import (
+    SQLiteIdentifierRepository,
+)
+from app.infrastructure.persistence.sqlite.repositories.investigation_repo import (
+    SQLiteInvestigationRepository,
+)
+from app.infrastructure.persistence.sqlite.repositories.person_repo import (
+    SQLitePersonRepository,
+)
+from app.interfaces.services.osint_service import OSINTResult, OSINTService
+from app.use_cases.person.collect_person_osint import (
+    CollectPersonOSINT,
+    CollectPersonOSINTInput,
+)
+
+
+class _FalhaOSINT(OSINTService):
+    def __init__(self, falhar_em: int):
+        self.falhar_em = falhar_em
+        self.chamadas = 0
+
+    def collect(self, identifier, sources):
+        self.chamadas += 1
+        if self.chamadas == self.falhar_em:
+            raise ConnectionError("fonte indisponível")
+        return [OSINTResult(source=sources[0], data={"valor": identifier.valor})]
+
+
+class _EcoOSINT(OSINTService):
+    def __init__(self):
+        self.fontes = []
+
+    def collect(self, identifier, sources):
+        self.fontes.append(sources[0])
+        return [OSINTResult(source=sources[0], data={"valor": identifier.valor})]
+
+
+def _pessoa(session, investigation, valores):
+    person = Person(investigation_id=investigation.id)
+    SQLitePersonRepository(session).save(person)
+    for valor in valores:
+        SQLiteIdentifierRepository(session).save(
+            person.id, Identifier(tipo=IdentifierType.EMAIL, valor=valor)
+        )
+    return person
+
+
+def _investigacao(session, max_chamadas=None, max_custo=None):
+    investigation = Investigation(
+        titulo="Teste",
+        finalidade="Teste",
+        base_legal=BaseLegal(LegalBasisType.LEGITIMO_INTERESSE, "Teste"),
+    )
+    investigation.definir_planejamento(
+        "Objetivo",
+        "Escopo",
+        ["whois", "hibp"],
+        collection_budget=CollectionBudget(
+            max_chamadas=max_chamadas, max_custo=max_custo
+        ),
+    )
+    SQLiteInvestigationRepository(session).save(investigation)
+    return investigation
+
+
+def test_concurrent_reservations_never_exceed_budget(engine, session):
+    investigation = _investigacao(session, max_chamadas=10)
+    aprovadas = []
+
+    def reservar():
+        with Session(bind=engine, expire_on_commit=False) as propria:
+            repo = SQLiteInvestigationRepository(propria)
+            for _ in range(10):
+                if repo.reservar_consumo(investigation.id, 0.0, 0.0):
+                    aprovadas.append(1)
+
+    threads = [threading.Thread(target=reservar) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    salva = SQLiteInvestigationRepository(session).get_by_id(investigation.id)
+    assert len(aprovadas) == 10
+    assert salva.collection_usage.chamadas == 10
+
+
+def test_save_does_not_overwrite_usage(session):
+    investigation = _investigacao(session, max_chamadas=5)
+    repo = SQLiteInvestigationRepository(session)
+
+    assert repo.reservar_consumo(investigation.id, 1.0, 0.5)
+
+    # Entidade carregada antes da reserva não sobrescreve o consumo
+    investigation.encerrar()
+    repo.save(investigation)
+
+    assert repo.get_by_id(investigation.id).collection_usage.chamadas == 1
+
+
+def test_failed_collection_keeps_usage_and_evidence(session, tmp_path):
+    investigation = _investigacao(session, max_chamadas=10)
+
+    person = _pessoa(session, investigation, ("a@example.com", "b@example.com"))
+
+    stats = SourceStatsRegistry(path=str(tmp_path / "stats.json"))
+    use_case = CollectPersonOSINT(
+        SQLiteInvestigationRepository(session),
+        SQLitePersonRepository(session),
+        SQLiteEvidenceRepository(session),
+        _FalhaOSINT(falhar_em=3),
+        source_stats=stats,
+    )
+
+    with pytest.raises(ConnectionError):
+        use_case.execute(
+            CollectPersonOSINTInput(
+                investigation_id=investigation.id,
+                person_id=person.id,
+                requested_sources=["whois", "hibp"],
+            )
+        )
+
+    salva = SQLiteInvestigationRepository(session).get_by_id(investigation.id)
+    assert salva.collection_usage.chamadas == 3
+    evidencias = SQLiteEvidenceRepository(session).list_by_investigation(
+        investigation.id
+    )
+    assert len(evidencias) == 2
+    assert (tmp_path / "stats.json").exists()
+
+
+def test_source_profiles_seeded_from_config_and_history_persisted(tmp_path):
+    config = tmp_path / "sources.json"
+    config.write_text(
+        json.dumps({"hibp": {"tipos_suportados": ["EMAIL"], "custo_por_chamada": 3}})
+    )
+    historico = str(tmp_path / "stats.json")
+
+    stats = SourceStatsRegistry.from_config(str(config), path=historico)
+    stats.registrar("hibp", latencia=2.0, sucesso=True)
+    stats.salvar()
+
+    recarregado = SourceStatsRegistry.from_config(str(config), path=historico)
+    perfil = recarregado.get("hibp")
+
+    assert perfil.tipos_suportados == frozenset({"EMAIL"})
+    assert perfil.custo_por_chamada == 3.0
+    assert perfil.latencia_media == pytest.approx(stats.get("hibp").latencia_media)
+    assert perfil.taxa_sucesso == pytest.approx(0.6)
+
+
+def test_planner_orders_by_yield_and_skips_unsupported_types():
+    email = Identifier(tipo=IdentifierType.EMAIL, valor="a@example.com")
+    usuario = Identifier(tipo=IdentifierType.USERNAME, valor="fulano")
+    perfis = {
+        "lenta": SourceProfile("lenta", latencia_media=30.0, taxa_sucesso=0.9),
+        "barata": SourceProfile("barata", latencia_media=0.5, taxa_sucesso=0.8),
+        "cara": SourceProfile(
+            "cara", taxa_sucesso=0.9, custo_por_chamada=10.0,
+            tipos_suportados=frozenset({"EMAIL"}),
+        ),
+    }
+
+    consultas = CollectionPlanner().plan(
+        [email, usuario], ["lenta", "cara", "barata"], perfis
+    )
+
+    assert [(c.fonte, c.identifier.tipo) for c in consultas] == [
+        ("barata", IdentifierType.EMAIL),
+        ("barata", IdentifierType.USERNAME),
+        ("lenta", IdentifierType.EMAIL),
+        ("lenta", IdentifierType.USERNAME),
+        ("cara", IdentifierType.EMAIL),
+    ]
+
+
+def test_lookup_over_budget_is_skipped_not_final(session, tmp_path):
+    investigation = _investigacao(session, max_custo=3.0)
+    person = _pessoa(session, investigation, ("a@example.com",))
+
+    # whois rende mais por custo, mas não cabe no saldo; hibp ainda cabe
+    stats = SourceStatsRegistry(
+        [
+            SourceProfile("whois", taxa_sucesso=1.0, custo_por_chamada=5.0),
+            SourceProfile("hibp", taxa_sucesso=0.1, custo_por_chamada=1.0),
+        ],
+        path=str(tmp_path / "stats.json"),
+    )
+    osint = _EcoOSINT()
+    use_case = CollectPersonOSINT(
+        SQLiteInvestigationRepository(session),
+        SQLitePersonRepository(session),
+        SQLiteEvidenceRepository(session),
+        osint,
+        source_stats=stats,
+    )
+
+    evidencias = use_case.execute(
+        CollectPersonOSINTInput(
+            investigation_id=investigation.id,
+            person_id=person.id,
+            requested_sources=["whois", "hibp"],
+        )
+    )
+
+    assert osint.fontes == ["hibp"]
+    assert len(evidencias) == 1
+
+
+def test_stats_save_failure_does_not_mask_collection_error(
+    session, tmp_path, monkeypatch
+):
+    investigation = _investigacao(session, max_chamadas=10)
+    person = _pessoa(session, investigation, ("a@example.com",))
+
+    stats = SourceStatsRegistry(path=str(tmp_path / "stats.json"))
+
+    def salvar_falho():
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(stats, "salvar", salvar_falho)
+    use_case = CollectPersonOSINT(
+        SQLiteInvestigationRepository(session),
+        SQLitePersonRepository(session),
+        SQLiteEvidenceRepository(session),
+        _FalhaOSINT(falhar_em=1),
+        source_stats=stats,
+    )
+
+    with pytest.raises(ConnectionError):
+        use_case.execute(
+            CollectPersonOSINTInput(
+                investigation_id=investigation.id,
+                person_id=person.id,
+                requested_sources=["whois"],
+            )
+        )
+
+
+
+def test_stats_saved_atomically_without_leftovers(tmp_path):
+    diretorio = tmp_path / "historico"
+    stats = SourceStatsRegistry(path=str(diretorio / "stats.json"))
+    stats.registrar("hibp", latencia=1.0, sucesso=True)
+
+    stats.salvar()
+    stats.salvar()
+
+    assert os.listdir(diretorio) == ["stats.json"]
@@ -0,0 +1,136 @@
+import threading
+from datetime import datetime
+from uuid import uuid4
+
+from app.domain.entities.identifier import Identifier
+from app.domain.value_objects.identifier_type import IdentifierType
+from app.infrastructure.graph.identity_graph import IdentityGraph
+from app.infrastructure.persistence.sqlite.models import PersonModel
+from app.infrastructure.persistence.sqlite.repositories.identifier_repo import (
+    SQLiteIdentifierRepository,
+)
+from app.infrastructure.persistence.sqlite.repositories.person_repo import (
+    SQLitePersonRepository,
+)
+from app.use_cases.identifier.add_identifier import (
+    AddIdentifierInput,
+    AddIdentifierToPerson,
+)
+
+
+def test_carga_em_lote_deduplica_arestas():
+    a, b, c = uuid4(), uuid4(), uuid4()
+    graph = IdentityGraph.from_links([
+        (a, "EMAIL", "x@example.com"),
+        (a, "EMAIL", "x@example.com"),
+        (b, "EMAIL", "x@example.com"),
+        (b, "USERNAME", "fulano"),
+        (c, "USERNAME", "ciclano"),
+    ])
+
+    assert graph.edge_count == 4
+    assert graph.same_cluster(a, b)
+    assert not graph.same_cluster(a, c)
+    assert set(graph.cluster_for(a)["persons"]) == {a, b}
+
+
+def test_caminho_combina_carga_e_atualizacoes():
+    a, b, c = uuid4(), uuid4(), uuid4()
+    graph = IdentityGraph.from_links([
+        (a, "EMAIL", "x@example.com"),
+        (b, "EMAIL", "x@example.com"),
+    ])
+
+    graph.add_link(b, Identifier(IdentifierType.USERNAME, "fulano"))
+    graph.add_link(c, Identifier(IdentifierType.USERNAME, "fulano"))
+    graph.add_link(c, Identifier(IdentifierType.USERNAME, "fulano"))
+
+    assert graph.edge_count == 4
+    assert graph.shortest_link_path(a, c) == [
+        a,
+        ("EMAIL", "x@example.com"),
+        b,
+        ("USERNAME", "fulano"),
+        c,
+    ]
+
+    # Após compactar, o resultado das consultas não muda
+    graph.compact()
+    assert graph.shortest_link_path(a, c)[2] == b
+    assert set(graph.cluster_for(c)["persons"]) == {a, b, c}
+
+
+def test_compactacao_em_segundo_plano_com_consultas_concorrentes():
+    graph = IdentityGraph()
+    graph.COMPACTACAO_LIMITE = 64
+    pessoas = [uuid4() for _ in range(400)]
+    erros = []
+
+    def adicionar(inicio):
+        # Cada pessoa compartilha um identificador com a anterior
+        for i in range(inicio, len(pessoas), 4):
+            graph.add_link(pessoas[i], Identifier(IdentifierType.USERNAME, f"u{i}"))
+            if i:
+                graph.add_link(
+                    pessoas[i], Identifier(IdentifierType.USERNAME, f"u{i - 1}")
+                )
+
+    def consultar():
+        for _ in range(200):
+            caminho = graph.shortest_link_path(pessoas[0], pessoas[1])
+            if caminho is not None and caminho != [
+                pessoas[0], ("USERNAME", "u0"), pessoas[1]
+            ]:
+                erros.append(caminho)
+
+    threads = [threading.Thread(target=adicionar, args=(n,)) for n in range(4)]
+    threads.append(threading.Thread(target=consultar))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    graph.compact()
+
+    assert not erros
+    assert graph.edge_count == 2 * len(pessoas) - 1
+    assert len(graph.shortest_link_path(pessoas[0], pessoas[-1])) == 2 * 400 - 1
+    assert len(graph.cluster_for(pessoas[200])["persons"]) == 400
+
+
+def test_grafo_a_partir_da_tabela(session, investigation_id):
+    people = []
+    for nome in ("A", "B"):
+        person_id = uuid4()
+        session.add(
+            PersonModel(
+                id=str(person_id),
+                investigation_id=str(investigation_id),
+                display_name=nome,
+                created_at=datetime(2026, 1, 1),
+                updated_at=datetime(2026, 1, 1),
+            )
+        )
+        people.append(person_id)
+    session.commit()
+
+    graph = IdentityGraph()
+    use_case = AddIdentifierToPerson(
+        SQLitePersonRepository(session),
+        SQLiteIdentifierRepository(session),
+        identity_graph=graph,
+    )
+    for person_id in people:
+        use_case.execute(
+            AddIdentifierInput(
+                person_id=person_id,
+                identifier_type=IdentifierType.EMAIL,
+                value=" Comum@Example.com ",
+                source="manual",
+            )
+        )
+
+    carregado = IdentityGraph.from_repository(SQLiteIdentifierRepository(session))
+
+    assert graph.same_cluster(*people)
+    assert carregado.same_cluster(*people)
+    assert carregado.cluster_for(people[0])["identifiers"] == [("EMAIL", "comum@example.com")]
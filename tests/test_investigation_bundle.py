@@ -0,0 +1,253 @@
+import io
+import json
+import struct
+import zlib
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.domain.entities.evidence import Evidence
+from app.domain.exceptions.domain_exceptions import DomainValidationError
+from app.domain.value_objects.evidence_type import EvidenceType
+from app.infrastructure.bundle import investigation_bundle
+from app.infrastructure.bundle.investigation_bundle import BundleExporter, BundleImporter
+from app.infrastructure.persistence.sqlite.database import Base, create_sqlite_engine
+from app.infrastructure.persistence.sqlite.models import (
+    BundleImportModel,
+    EvidenceModel,
+    EvidenceSignatureModel,
+    IdentifierModel,
+    PersonModel,
+)
+from app.infrastructure.persistence.sqlite.repositories.evidence_repo import (
+    SQLiteEvidenceRepository,
+)
+from app.infrastructure.persistence.sqlite.repositories.evidence_similarity_repo import (
+    SQLiteEvidenceSimilarityRepository,
+)
+from app.infrastructure.persistence.sqlite.sharding import ShardRouter
+
+CHAVE = b"chave-de-teste"
+
+_FRAME = struct.Struct(">4sII")
+_TRAILER = struct.Struct(">QQ8s")
+
+
+@pytest.fixture
+def destino(tmp_path):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'destino.db'}")
+    Base.metadata.create_all(bind=engine)
+    with Session(bind=engine) as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def populada(session, investigation_id):
+    person_id = str(uuid4())
+    session.add(
+        PersonModel(
+            id=person_id,
+            investigation_id=str(investigation_id),
+            display_name="Alvo",
+            created_at=datetime(2026, 1, 2),
+            updated_at=datetime(2026, 1, 2),
+        )
+    )
+    session.flush()
+    session.add(
+        IdentifierModel(
+            person_id=person_id,
+            tipo="EMAIL",
+            valor="alvo@example.com",
+            data_registro=datetime(2026, 1, 2),
+        )
+    )
+    session.commit()
+
+    repo = SQLiteEvidenceRepository(session)
+    for i in range(30):
+        repo.save(
+            Evidence(
+                investigation_id=investigation_id,
+                tipo=EvidenceType.OSINT_AUTOMATED,
+                fonte="whois",
+                dado={"indice": i, "texto": "x" * 500},
+                coletado_por="teste",
+            )
+        )
+    return investigation_id
+
+
+def _exportar(session, investigation_id):
+    buffer = io.BytesIO()
+    manifesto = BundleExporter(session, CHAVE).export(investigation_id, buffer)
+    buffer.seek(0)
+    return buffer, manifesto
+
+
+def _frames(dados):
+    offset = len(investigation_bundle.MAGIC)
+    offset_indice, offset_manifesto, _ = _TRAILER.unpack(dados[-_TRAILER.size:])
+    frames = []
+    while offset < offset_manifesto:
+        tipo, comprimido, _ = _FRAME.unpack_from(dados, offset)
+        inicio = offset + _FRAME.size
+        frames.append((tipo, zlib.decompress(dados[inicio:inicio + comprimido])))
+        offset = inicio + comprimido
+    manifesto = dados[offset_manifesto:-_TRAILER.size]
+    return frames, manifesto
+
+
+def _remontar(frames, manifesto_frame):
+    saida = io.BytesIO()
+    saida.write(investigation_bundle.MAGIC)
+    offset_indice = None
+    for tipo, bruto in frames:
+        if tipo == b"INDX":
+            offset_indice = saida.tell()
+        comprimido = zlib.compress(bruto)
+        saida.write(_FRAME.pack(tipo, len(comprimido), len(bruto)))
+        saida.write(comprimido)
+    offset_manifesto = saida.tell()
+    saida.write(manifesto_frame)
+    saida.write(_TRAILER.pack(offset_indice, offset_manifesto, b"OSINTEND"))
+    saida.seek(0)
+    return saida
+
+
+def test_exporta_e_importa(session, populada, destino):
+    buffer, manifesto = _exportar(session, populada)
+
+    assert manifesto["contagens"] == {"INVS": 1, "PERS": 1, "IDNT": 1, "EVID": 30}
+
+    BundleImporter(destino, CHAVE).import_(buffer)
+
+    assert destino.scalar(select(func.count()).select_from(EvidenceModel)) == 30
+    assert destino.scalar(select(IdentifierModel.valor)) == "alvo@example.com"
+
+
+def test_frames_limitados_em_bytes(session, populada, destino, monkeypatch):
+    monkeypatch.setattr(investigation_bundle, "BYTES_POR_FRAME", 4096)
+
+    buffer, _ = _exportar(session, populada)
+    frames, _ = _frames(buffer.getvalue())
+
+    evidencias = [bruto for tipo, bruto in frames if tipo == b"EVID"]
+    assert len(evidencias) > 1
+    assert all(len(bruto) <= 4096 for bruto in evidencias)
+
+    BundleImporter(destino, CHAVE).import_(buffer)
+    assert destino.scalar(select(func.count()).select_from(EvidenceModel)) == 30
+
+
+@pytest.mark.parametrize("tipo, original, adulterado", [
+    (b"IDNT", b"alvo@example.com", b"mallory@evil"),
+    (b"PERS", b'"Alvo"', b'"Mallory"'),
+    (b"INVS", b"Investiga", b"Mallorygo"),
+])
+def test_adulteracao_de_frames_rejeitada(session, populada, destino, tipo, original, adulterado):
+    buffer, _ = _exportar(session, populada)
+    frames, manifesto_frame = _frames(buffer.getvalue())
+
+    frames = [
+        (t, bruto.replace(original, adulterado) if t == tipo else bruto)
+        for t, bruto in frames
+    ]
+    adulterado_bundle = _remontar(frames, manifesto_frame)
+
+    with pytest.raises(DomainValidationError, match="Digest dos frames"):
+        BundleImporter(destino, CHAVE).import_(adulterado_bundle)
+
+    assert destino.scalar(select(func.count()).select_from(PersonModel)) == 0
+
+
+def test_chave_incorreta_rejeitada(session, populada, destino):
+    buffer, _ = _exportar(session, populada)
+
+    with pytest.raises(DomainValidationError):
+        BundleImporter(destino, b"outra-chave").read_manifest(buffer)
+
+
+def test_manifesto_declara_digests_por_tipo(session, populada):
+    buffer, manifesto = _exportar(session, populada)
+    _, manifesto_frame = _frames(buffer.getvalue())
+    _, comprimido, _ = _FRAME.unpack_from(manifesto_frame)
+    gravado = json.loads(zlib.decompress(manifesto_frame[_FRAME.size:_FRAME.size + comprimido]))
+
+    assert set(gravado["digests_frames"]) == {"INVS", "PERS", "IDNT", "EVID"}
+    assert gravado == manifesto
+
+
+def test_bundle_sem_assinatura_exige_opt_in(session, populada, destino):
+    buffer = io.BytesIO()
+    BundleExporter(session).export(populada, buffer)
+
+    with pytest.raises(DomainValidationError, match="chave de assinatura"):
+        BundleImporter(destino).import_(buffer)
+
+    BundleImporter(destino, aceitar_sem_assinatura=True).import_(buffer)
+    assert destino.scalar(select(func.count()).select_from(EvidenceModel)) == 30
+
+
+@pytest.mark.parametrize("conteudo", [
+    b"",
+    b"OSINT",
+    investigation_bundle.MAGIC,
+    investigation_bundle.MAGIC + b"\0" * _TRAILER.size,
+])
+def test_entrada_curta_rejeitada(destino, conteudo):
+    with pytest.raises(DomainValidationError):
+        BundleImporter(destino, CHAVE).read_manifest(io.BytesIO(conteudo))
+
+
+def test_importacao_interrompida_retomada(session, populada, destino, monkeypatch):
+    monkeypatch.setattr(investigation_bundle, "BYTES_POR_FRAME", 4096)
+    buffer, _ = _exportar(session, populada)
+
+    indexar = SQLiteEvidenceSimilarityRepository.index_batch
+    chamadas = []
+
+    def indexar_com_queda(self, evidences):
+        chamadas.append(len(evidences))
+        if len(chamadas) == 2:
+            raise OSError("queda")
+        indexar(self, evidences)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(
+            SQLiteEvidenceSimilarityRepository, "index_batch", indexar_com_queda
+        )
+        with pytest.raises(OSError):
+            BundleImporter(destino, CHAVE).import_(buffer)
+
+    # Apenas os frames confirmados antes da queda
+    parciais = destino.scalar(select(func.count()).select_from(EvidenceModel))
+    assert parciais == chamadas[0]
+
+    BundleImporter(destino, CHAVE).import_(buffer)
+
+    assert destino.scalar(select(func.count()).select_from(EvidenceModel)) == 30
+    assert destino.scalar(
+        select(func.count()).select_from(EvidenceSignatureModel)
+    ) == 30
+    assert destino.scalar(select(func.count()).select_from(BundleImportModel)) == 0
+
+    with pytest.raises(DomainValidationError, match="já existe"):
+        BundleImporter(destino, CHAVE).import_(buffer)
+
+
+def test_importacao_particionada_cria_shard(session, populada, tmp_path):
+    buffer, manifesto = _exportar(session, populada)
+    router = ShardRouter(str(tmp_path / "shards"))
+    try:
+        BundleImporter(None, CHAVE, router=router).import_(buffer)
+
+        with router.session_for(populada) as shard:
+            total = shard.scalar(select(func.count()).select_from(EvidenceModel))
+        assert total == manifesto["contagens"]["EVID"]
+    finally:
+        router.close()
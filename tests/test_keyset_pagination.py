@@ -0,0 +1,148 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.api import dependencies
+from app.domain.exceptions.domain_exceptions import DomainValidationError
+from app.infrastructure.persistence.sqlite.models import EvidenceModel, PersonModel
+from app.infrastructure.persistence.sqlite.repositories.evidence_repo import (
+    SQLiteEvidenceRepository,
+)
+from app.infrastructure.persistence.sqlite.repositories.person_repo import (
+    SQLitePersonRepository,
+)
+from app.interfaces.repositories.evidence_repository import EvidenceFilter
+from app.interfaces.repositories.pagination import (
+    MAX_PAGE_SIZE,
+    clamp_page_size,
+    decode_cursor,
+    encode_cursor,
+)
+from app.main import app
+
+
+def _percorrer(listar, **kwargs):
+    itens, cursor, paginas = [], None, 0
+    while True:
+        page = listar(cursor=cursor, **kwargs)
+        itens.extend(page.items)
+        paginas += 1
+        if page.next_cursor is None:
+            return itens, paginas
+        cursor = page.next_cursor
+
+
+def _inserir_evidencias(session, investigation_id, total, inicio):
+    for i in range(total):
+        session.add(
+            EvidenceModel(
+                id=str(uuid4()),
+                investigation_id=str(investigation_id),
+                tipo="OSINT_AUTOMATED",
+                fonte="whois" if i % 2 else "email",
+                dado={"indice": i},
+                coletado_por="teste",
+                # Blocos de timestamps repetidos exercitam o desempate por id
+                data_coleta=inicio + timedelta(seconds=i // 4),
+                hash_integridade="0" * 64,
+            )
+        )
+    session.commit()
+
+
+def test_cursor_ida_e_volta():
+    momento = datetime(2026, 3, 1, 12, 30, 15, 123456)
+    cursor = encode_cursor(momento, "abc|def")
+
+    assert decode_cursor(cursor) == (momento, "abc|def")
+
+
+@pytest.mark.parametrize("cursor", ["nao-e-base64!", "c2VtLXNlcGFyYWRvcg==", "fHg="])
+def test_cursor_invalido(cursor):
+    with pytest.raises(DomainValidationError):
+        decode_cursor(cursor)
+
+
+def test_tamanho_de_pagina():
+    assert clamp_page_size(10) == 10
+    assert clamp_page_size(MAX_PAGE_SIZE * 10) == MAX_PAGE_SIZE
+
+    with pytest.raises(DomainValidationError):
+        clamp_page_size(0)
+
+
+def test_pessoas_sem_lacunas_nem_repeticoes(session, investigation_id):
+    criado_em = datetime(2026, 1, 1)
+    ids = []
+    for i in range(23):
+        person_id = str(uuid4())
+        ids.append((criado_em + timedelta(minutes=i // 3), person_id))
+        session.add(
+            PersonModel(
+                id=person_id,
+                investigation_id=str(investigation_id),
+                display_name=f"Pessoa {i}",
+                created_at=criado_em + timedelta(minutes=i // 3),
+                updated_at=criado_em,
+            )
+        )
+    session.commit()
+
+    repo = SQLitePersonRepository(session)
+    itens, paginas = _percorrer(repo.list_page, investigation_id=investigation_id, limit=5)
+
+    assert paginas == 5
+    assert [str(item.id) for item in itens] == [pid for _, pid in sorted(ids)]
+
+
+def test_evidencias_com_filtro_e_projecao(session, investigation_id):
+    _inserir_evidencias(session, investigation_id, 40, datetime(2026, 2, 1))
+    repo = SQLiteEvidenceRepository(session)
+
+    itens, _ = _percorrer(
+        repo.list_page,
+        investigation_id=investigation_id,
+        limit=7,
+        filtros=EvidenceFilter(fonte="whois"),
+    )
+
+    assert len(itens) == 20
+    assert len({item.id for item in itens}) == 20
+    assert all(item.fonte == "whois" for item in itens)
+    assert all(item.dado is None for item in itens)
+
+    chaves = [(item.data_coleta, str(item.id)) for item in itens]
+    assert chaves == sorted(chaves)
+
+    page = repo.list_page(investigation_id, limit=3, incluir_dado=True)
+    assert all(item.dado is not None for item in page.items)
+
+
+def test_pagina_final_sem_cursor(session, investigation_id):
+    _inserir_evidencias(session, investigation_id, 6, datetime(2026, 2, 1))
+    repo = SQLiteEvidenceRepository(session)
+
+    page = repo.list_page(investigation_id, limit=6)
+
+    assert len(page.items) == 6
+    assert page.next_cursor is None
+
+
+def test_rota_valida_filtro_de_tipo(engine, session, investigation_id, monkeypatch):
+    _inserir_evidencias(session, investigation_id, 4, datetime(2026, 2, 1))
+    monkeypatch.setattr(dependencies, "SessionLocal", sessionmaker(bind=engine))
+    client = TestClient(app)
+    url = f"/investigations/{investigation_id}/evidences"
+
+    resposta = client.get(url, params={"tipo": "OSINT_AUTOMATED"})
+    assert resposta.status_code == 200
+    assert len(resposta.json()["items"]) == 4
+
+    resposta = client.get(url, params={"tipo": "MANUAL"})
+    assert resposta.status_code == 200
+    assert resposta.json()["items"] == []
+
+    assert client.get(url, params={"tipo": "DESCONHECIDO"}).status_code == 422
@@ -0,0 +1,104 @@
+import cProfile
+import os
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import dependencies
+from app.infrastructure.profiling import profiler as profiler_module
+from app.infrastructure.profiling.profiler import Profiler
+from app.main import app
+
+
+def test_admin_routes_require_token(monkeypatch):
+    client = TestClient(app)
+
+    monkeypatch.setattr(dependencies, "ADMIN_TOKEN", None)
+    assert client.put("/admin/profiling", json={"enabled": True}).status_code == 403
+
+    monkeypatch.setattr(dependencies, "ADMIN_TOKEN", "segredo")
+    resposta = client.put(
+        "/admin/profiling",
+        json={"sample_rate": 0.5},
+        headers={"X-Admin-Token": "errado"},
+    )
+    assert resposta.status_code == 401
+
+    resposta = client.get("/admin/profiling", headers={"X-Admin-Token": "segredo"})
+    assert resposta.status_code == 200
+
+
+def test_profile_files_are_rotated_keeping_slowest(tmp_path):
+    output_dir = tmp_path / "profiles"
+    profiler = Profiler(
+        output_dir=str(output_dir), sample_rate=1.0, max_registros=1, max_arquivos=3
+    )
+    profiler.configure(enabled=True)
+
+    # A primeira execução é a mais lenta e deve sobreviver à rotação
+    profiler.run("lenta", time.sleep, (0.05,), {})
+    for _ in range(6):
+        profiler.run("rapida", time.sleep, (0,), {})
+
+    arquivos = os.listdir(output_dir)
+    mais_lenta = profiler.slowest(1)[0]
+
+    assert len(arquivos) == 3
+    assert mais_lenta.nome == "lenta"
+    assert os.path.basename(mais_lenta.arquivo) in arquivos
+
+
+def test_request_profiled_by_middleware(tmp_path, monkeypatch):
+    monkeypatch.setattr(dependencies, "ADMIN_TOKEN", "segredo")
+    monkeypatch.setattr(profiler_module.profiler, "output_dir", str(tmp_path))
+    monkeypatch.setattr(profiler_module.profiler, "_mais_lentas", [])
+    monkeypatch.setattr(profiler_module.profiler, "_arquivos", None)
+    monkeypatch.setattr(profiler_module.profiler, "sample_rate", 0.0)
+    monkeypatch.setattr(profiler_module.profiler, "enabled", True)
+    client = TestClient(app)
+
+    # sample_rate zero: sem o header, nenhuma requisição é perfilada
+    client.get("/admin/profiling", headers={"X-Admin-Token": "segredo"})
+    assert profiler_module.profiler.slowest() == []
+
+    client.get(
+        "/admin/profiling", headers={"X-Admin-Token": "segredo", "X-Profile": "1"}
+    )
+    execucao = profiler_module.profiler.slowest()[0]
+
+    assert execucao.nome == "GET/admin/profiling"
+    assert os.path.exists(execucao.arquivo)
+
+
+def test_profile_failures_never_replace_outcome(tmp_path, monkeypatch):
+    profiler = Profiler(output_dir=str(tmp_path), sample_rate=1.0)
+    profiler.configure(enabled=True)
+
+    def gravar_falho(*_):
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(
+        profiler_module._ColetorDeterministico, "gravar", gravar_falho
+    )
+
+    assert profiler.run("soma", sum, ([1, 2],), {}) == 3
+    with pytest.raises(ZeroDivisionError):
+        profiler.run("divisao", lambda: 1 / 0, (), {})
+    assert profiler.slowest() == []
+
+
+def test_skips_profiling_when_another_profiler_is_active(tmp_path):
+    output_dir = tmp_path / "profiles"
+    profiler = Profiler(output_dir=str(output_dir), sample_rate=1.0)
+    profiler.configure(enabled=True)
+
+    externo = cProfile.Profile()
+    externo.enable()
+    try:
+        assert profiler.run("soma", sum, ([1, 2],), {}) == 3
+    finally:
+        externo.disable()
+
+    assert profiler.slowest() == []
+    assert os.listdir(output_dir) == []
@@ -0,0 +1,191 @@
+from typing import List
+from uuid import uuid4
+
+import pytest
+
+from app.domain.entities.identifier import Identifier
+from app.domain.entities.investigation import Investigation
+from app.domain.entities.person import Person
+from app.domain.value_objects.base_legal import BaseLegal, LegalBasisType
+from app.domain.value_objects.collection_budget import CollectionBudget
+from app.domain.value_objects.identifier_type import IdentifierType
+from app.infrastructure.osint.source_stats import SourceStatsRegistry
+from app.infrastructure.osint.transport.record_replay import (
+    CassetteMissError,
+    RecordingOSINTService,
+    ReplayedCollectError,
+    ReplayOSINTService,
+    cassette_path,
+    open_transport,
+)
+from app.infrastructure.persistence.sqlite.repositories.evidence_repo import (
+    SQLiteEvidenceRepository,
+)
+from app.infrastructure.persistence.sqlite.repositories.identifier_repo import (
+    SQLiteIdentifierRepository,
+)
+from app.infrastructure.persistence.sqlite.repositories.investigation_repo import (
+    SQLiteInvestigationRepository,
+)
+from app.infrastructure.persistence.sqlite.repositories.person_repo import (
+    SQLitePersonRepository,
+)
+from app.interfaces.services.osint_service import OSINTResult, OSINTService
+from app.use_cases.person.collect_person_osint import (
+    CollectPersonOSINT,
+    CollectPersonOSINTInput,
+)
+
+
+class _FakeOSINT(OSINTService):
+    def __init__(self):
+        self.chamadas = 0
+
+    def collect(self, identifier: Identifier, sources: List[str]) -> List[OSINTResult]:
+        self.chamadas += 1
+        if identifier.valor.startswith("falha"):
+            raise TimeoutError("fonte indisponível")
+        return [
+            OSINTResult(source=source, data={"valor": identifier.valor, "n": self.chamadas})
+            for source in sources
+        ]
+
+
+def _email(valor):
+    return Identifier(IdentifierType.EMAIL, valor)
+
+
+def test_sessoes_sucessivas_acumulam_no_cassete(tmp_path):
+    investigation_id = uuid4()
+    inner = _FakeOSINT()
+
+    # Uma sessão de gravação por pessoa, como no CollectPersonOSINT
+    with open_transport(inner, "record", str(tmp_path), investigation_id) as gravador:
+        gravador.collect(_email("a@example.com"), ["hibp"])
+        gravador.collect(_email("a@example.com"), ["hibp"])
+    with open_transport(inner, "record", str(tmp_path), investigation_id) as gravador:
+        gravador.collect(_email("b@example.com"), ["hibp", "gravatar"])
+
+    replay = open_transport(inner, "replay", str(tmp_path), investigation_id)
+    try:
+        primeira = replay.collect(_email("a@example.com"), ["hibp"])
+        segunda = replay.collect(_email("a@example.com"), ["hibp"])
+        terceira = replay.collect(_email("a@example.com"), ["hibp"])
+        b = replay.collect(_email("b@example.com"), ["gravatar", "hibp"])
+
+        assert [r.data["n"] for r in (primeira + segunda + terceira)] == [1, 2, 2]
+        assert {r.source for r in b} == {"hibp", "gravatar"}
+
+        with pytest.raises(CassetteMissError):
+            replay.collect(_email("c@example.com"), ["hibp"])
+    finally:
+        replay.close()
+
+    assert inner.chamadas == 3
+
+
+def test_falhas_sao_gravadas_e_reproduzidas(tmp_path):
+    investigation_id = uuid4()
+
+    with open_transport(_FakeOSINT(), "record", str(tmp_path), investigation_id) as gravador:
+        with pytest.raises(TimeoutError):
+            gravador.collect(_email("falha@example.com"), ["hibp"])
+
+    replay = open_transport(_FakeOSINT(), "replay", str(tmp_path), investigation_id)
+    try:
+        with pytest.raises(ReplayedCollectError) as erro:
+            replay.collect(_email("falha@example.com"), ["hibp"])
+        assert erro.value.tipo == "TimeoutError"
+    finally:
+        replay.close()
+
+
+def test_gravacao_interrompida_continua_legivel(tmp_path):
+    investigation_id = uuid4()
+    path = cassette_path(str(tmp_path), investigation_id)
+
+    # Sem close(): simula um processo que caiu no meio da sessão
+    gravador = open_transport(_FakeOSINT(), "record", str(tmp_path), investigation_id)
+    gravador.collect(_email("a@example.com"), ["hibp"])
+    gravador._arquivo.flush()
+    with open(path, "ab") as arquivo:
+        arquivo.write(b"\x00\x00\x10\x00parcial")
+
+    gravador = open_transport(_FakeOSINT(), "record", str(tmp_path), investigation_id)
+    gravador.collect(_email("b@example.com"), ["hibp"])
+    gravador.close()
+
+    replay = open_transport(_FakeOSINT(), "replay", str(tmp_path), investigation_id)
+    try:
+        assert replay.collect(_email("a@example.com"), ["hibp"])[0].data["valor"] == "a@example.com"
+        assert replay.collect(_email("b@example.com"), ["hibp"])[0].data["valor"] == "b@example.com"
+    finally:
+        replay.close()
+
+
+def test_cassete_vazio(tmp_path):
+    path = tmp_path / "vazio.cassette"
+    path.write_bytes(b"")
+
+    replay = ReplayOSINTService(str(path))
+    try:
+        with pytest.raises(CassetteMissError):
+            replay.collect(_email("a@example.com"), ["hibp"])
+    finally:
+        replay.close()
+
+    # A gravação sobre um cassete vazio começa pelo cabeçalho
+    with RecordingOSINTService(_FakeOSINT(), str(path)) as gravador:
+        gravador.collect(_email("a@example.com"), ["hibp"])
+
+    replay = ReplayOSINTService(str(path))
+    try:
+        assert replay.collect(_email("a@example.com"), ["hibp"])
+    finally:
+        replay.close()
+
+
+def test_replay_da_coleta_nao_consome_orcamento(session, tmp_path):
+    investigation = Investigation(
+        titulo="Teste",
+        finalidade="Teste",
+        base_legal=BaseLegal(LegalBasisType.LEGITIMO_INTERESSE, "Teste"),
+    )
+    investigation.definir_planejamento(
+        "Objetivo", "Escopo", ["hibp"],
+        collection_budget=CollectionBudget(max_chamadas=1),
+    )
+    investigations = SQLiteInvestigationRepository(session)
+    investigations.save(investigation)
+
+    person = Person(investigation_id=investigation.id)
+    SQLitePersonRepository(session).save(person)
+    SQLiteIdentifierRepository(session).save(person.id, _email("a@example.com"))
+
+    stats = SourceStatsRegistry(path=str(tmp_path / "stats.json"))
+    entrada = CollectPersonOSINTInput(
+        investigation_id=investigation.id,
+        person_id=person.id,
+        requested_sources=["hibp"],
+    )
+
+    def coleta(inner, modo):
+        return CollectPersonOSINT(
+            investigations,
+            SQLitePersonRepository(session),
+            SQLiteEvidenceRepository(session),
+            inner,
+            source_stats=stats,
+            modo_transporte=modo,
+            cassette_root=str(tmp_path / "cassettes"),
+        ).execute(entrada)
+
+    assert len(coleta(_FakeOSINT(), "record")) == 1
+    historico = stats.snapshot()
+
+    # Orçamento esgotado na gravação; o replay não consulta a fonte real
+    inner = _FakeOSINT()
+    assert len(coleta(inner, "replay")) == 1
+    assert inner.chamadas == 0
+    assert investigations.get_by_id(investigation.id).collection_usage.chamadas == 1
+    assert stats.snapshot() == historico
@@ -0,0 +1,267 @@
+import hashlib
+import io
+import json
+import os
+import sqlite3
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.infrastructure.audit.audit_log import GENESIS_HASH
+from app.infrastructure.persistence.sqlite.models import (
+    EvidenceModel,
+    InvestigationModel,
+    PurgeCheckpointModel,
+)
+from app.infrastructure.persistence.sqlite.sharding import ShardRouter
+from app.infrastructure.retention import purge_engine as purge_engine_module
+from app.infrastructure.retention.purge_engine import RetentionPurgeEngine
+from app.infrastructure.storage.blob_store import BlobStore
+
+
+class _Queda(Exception):
+    pass
+
+
+def _encerrar(session, investigation_id):
+    investigation = session.get(InvestigationModel, str(investigation_id))
+    investigation.status = "ENCERRADA"
+    investigation.data_encerramento = datetime(2020, 1, 1)
+    session.commit()
+
+
+def _evidencias(session, investigation_id, total):
+    for indice in range(total):
+        session.add(
+            EvidenceModel(
+                id=str(uuid4()),
+                investigation_id=str(investigation_id),
+                tipo="MANUAL",
+                fonte="teste",
+                dado={"indice": indice},
+                coletado_por="MANUAL",
+                data_coleta=datetime(2019, 1, 1),
+                hash_integridade=hashlib.sha256(str(indice).encode()).hexdigest(),
+            )
+        )
+    session.commit()
+
+
+def _digest_esperado(session):
+    digest = GENESIS_HASH
+    for hash_integridade in session.scalars(
+        select(EvidenceModel.hash_integridade).order_by(EvidenceModel.id)
+    ):
+        digest = hashlib.sha256(
+            (digest + hash_integridade).encode("ascii")
+        ).hexdigest()
+    return digest
+
+
+def _registros_expurgo(audit_log):
+    audit_log.flush()
+    with open(audit_log.path, "rb") as arquivo:
+        entradas = [json.loads(linha) for linha in arquivo]
+    return [e for e in entradas if e["acao"] == "RetentionPurge"]
+
+
+def test_interrupted_purge_resumes_from_checkpoint(
+    engine, session, investigation_id, audit_log
+):
+    _evidencias(session, investigation_id, 5)
+    _encerrar(session, investigation_id)
+    esperado = _digest_esperado(session)
+
+    def fabrica():
+        return Session(bind=engine, expire_on_commit=False)
+
+    purge_engine = RetentionPurgeEngine(
+        fabrica, audit_log, batch_size=2, rows_per_second=0
+    )
+
+    # Queda logo após o segundo lote de evidências confirmado
+    lotes = []
+
+    def throttle(linhas, _decorrido):
+        lotes.append(linhas)
+        if len(lotes) == 2:
+            raise _Queda()
+
+    purge_engine._throttle = throttle
+
+    with pytest.raises(_Queda):
+        purge_engine.purge(str(investigation_id))
+
+    with fabrica() as nova:
+        checkpoint = nova.get(PurgeCheckpointModel, str(investigation_id))
+        restantes = nova.scalar(select(func.count()).select_from(EvidenceModel))
+
+    # O checkpoint reflete exatamente as linhas removidas
+    assert checkpoint.removidos == {"evidences": 4}
+    assert restantes == 1
+
+    purge_engine._throttle = lambda *_: None
+    resultados = purge_engine.run()
+
+    assert [r.investigation_id for r in resultados] == [str(investigation_id)]
+    assert resultados[0].removidos["evidences"] == 5
+    assert resultados[0].digest_evidencias == esperado
+
+    with fabrica() as nova:
+        checkpoints = nova.scalar(
+            select(func.count()).select_from(PurgeCheckpointModel)
+        )
+
+    assert checkpoints == 0
+    registro = _registros_expurgo(audit_log)[-1]
+    assert registro["detalhes"]["digest_evidencias"] == esperado
+
+
+def test_blob_is_erased_only_after_last_owner_releases(tmp_path):
+    store = BlobStore(str(tmp_path / "blobs"))
+    conteudo = b"captura de tela" * 100
+
+    location = store.put(io.BytesIO(conteudo), owner="inv-a")
+    store.put(io.BytesIO(conteudo), owner="inv-b")
+
+    assert store.release_owner("inv-a") == []
+    with store.open_view(store.locate(location.sha256)) as view:
+        assert bytes(view) == conteudo
+
+    assert store.release_owner("inv-b") == [location.sha256]
+    assert store.locate(location.sha256) is None
+
+    with open(store._caminho_segmento(location.segment), "rb") as segmento:
+        segmento.seek(location.offset)
+        assert segmento.read(location.length) == bytes(location.length)
+
+    # Repetir a liberação não tem efeito
+    assert store.release_owner("inv-b") == []
+
+
+def test_sharded_purge_drops_shard_file(tmp_path, audit_log):
+    router = ShardRouter(str(tmp_path / "shards"))
+    store = BlobStore(str(tmp_path / "blobs"))
+    try:
+        investigation_id = uuid4()
+        router.create(investigation_id)
+        with router.session_for(investigation_id) as session:
+            session.add(
+                InvestigationModel(
+                    id=str(investigation_id),
+                    titulo="Teste",
+                    finalidade="Teste",
+                    fundamento_legal="LEGITIMO_INTERESSE",
+                    descricao_base_legal="Teste",
+                    status="ABERTA",
+                    data_criacao=datetime(2019, 1, 1),
+                )
+            )
+            session.commit()
+            _evidencias(session, investigation_id, 3)
+            _encerrar(session, investigation_id)
+            esperado = _digest_esperado(session)
+
+        location = store.put(io.BytesIO(b"anexo"), owner=str(investigation_id))
+
+        purge_engine = RetentionPurgeEngine(
+            None, audit_log, router=router, blob_store=store
+        )
+        resultados = purge_engine.run()
+
+        assert resultados[0].removidos["evidences"] == 3
+        assert resultados[0].removidos["anexos"] == 1
+        assert resultados[0].digest_evidencias == esperado
+        assert not os.path.exists(os.path.join(router.root, f"{investigation_id}.db"))
+        assert store.locate(location.sha256) is None
+        assert purge_engine.find_expired() == []
+        assert len(_registros_expurgo(audit_log)) == 1
+    finally:
+        router.close()
+
+
+def test_cassette_removed_as_checkpointed_step(
+    engine, session, investigation_id, audit_log, tmp_path, monkeypatch
+):
+    _evidencias(session, investigation_id, 2)
+    _encerrar(session, investigation_id)
+
+    cassetes = tmp_path / "cassettes"
+    cassetes.mkdir()
+    cassete = cassetes / f"{investigation_id}.cassette"
+    cassete.write_bytes(b"gravacao")
+
+    def fabrica():
+        return Session(bind=engine, expire_on_commit=False)
+
+    purge_engine = RetentionPurgeEngine(
+        fabrica, audit_log, rows_per_second=0, cassette_root=str(cassetes)
+    )
+
+    def remover_com_queda(_caminho):
+        raise _Queda()
+
+    # Queda entre o checkpoint da etapa e a remoção do arquivo
+    with monkeypatch.context() as patch:
+        patch.setattr(purge_engine_module.os, "remove", remover_com_queda)
+        with pytest.raises(_Queda):
+            purge_engine.purge(str(investigation_id))
+
+    with fabrica() as nova:
+        checkpoint = nova.get(PurgeCheckpointModel, str(investigation_id))
+    assert checkpoint.removidos["cassetes"] == 1
+    assert cassete.exists()
+
+    resultados = purge_engine.run()
+
+    assert resultados[0].removidos["cassetes"] == 1
+    assert not cassete.exists()
+    assert _registros_expurgo(audit_log)[-1]["detalhes"]["removidos"]["cassetes"] == 1
+
+
+def test_run_skips_failing_investigations(tmp_path, audit_log):
+    router = ShardRouter(str(tmp_path / "shards"))
+    try:
+        ids = [uuid4(), uuid4()]
+        for investigation_id in ids:
+            router.create(investigation_id)
+            with router.session_for(investigation_id) as session:
+                session.add(
+                    InvestigationModel(
+                        id=str(investigation_id),
+                        titulo="Teste",
+                        finalidade="Teste",
+                        fundamento_legal="LEGITIMO_INTERESSE",
+                        descricao_base_legal="Teste",
+                        status="ENCERRADA",
+                        data_criacao=datetime(2019, 1, 1),
+                        data_encerramento=datetime(2020, 1, 1),
+                    )
+                )
+                session.commit()
+
+        # Shard arquivado antes da existência da tabela de checkpoints
+        arquivado = router.archive(ids[0])
+        conexao = sqlite3.connect(arquivado)
+        conexao.execute("DROP TABLE purge_checkpoints")
+        conexao.commit()
+        conexao.close()
+
+        purge_engine = RetentionPurgeEngine(None, audit_log, router=router)
+        original = purge_engine._remover_shard
+
+        def remover(investigation_id):
+            if investigation_id == str(ids[1]):
+                raise OSError("disco indisponível")
+            return original(investigation_id)
+
+        purge_engine._remover_shard = remover
+        resultados = purge_engine.run()
+
+        assert [r.investigation_id for r in resultados] == [str(ids[0])]
+        assert purge_engine.find_expired() == [str(ids[1])]
+    finally:
+        router.close()
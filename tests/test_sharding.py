@@ -0,0 +1,165 @@
+import os
+import time
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select, update
+from sqlalchemy.exc import OperationalError
+
+from app.api import dependencies
+from app.domain.exceptions.domain_exceptions import DomainValidationError
+from app.infrastructure.persistence.sqlite.models import InvestigationModel, PersonModel
+from app.infrastructure.persistence.sqlite.sharding import (
+    ShardNotFoundError,
+    ShardRouter,
+    ShardStatus,
+)
+from app.main import app
+
+
+@pytest.fixture
+def router(tmp_path):
+    router = ShardRouter(str(tmp_path / "shards"))
+    yield router
+    router.close()
+
+
+def _shards(router):
+    return sorted(nome for nome in os.listdir(router.root) if nome.endswith(".db"))
+
+
+def _criar_investigacao(router, status="ABERTA"):
+    investigation_id = uuid4()
+    router.create(investigation_id)
+    with router.session_for(investigation_id) as session:
+        session.add(
+            InvestigationModel(
+                id=str(investigation_id),
+                titulo="Teste",
+                finalidade="Teste",
+                fundamento_legal="LEGITIMO_INTERESSE",
+                descricao_base_legal="Teste",
+                status=status,
+                data_criacao=datetime(2026, 1, 1),
+            )
+        )
+        session.commit()
+    return investigation_id
+
+
+def test_id_desconhecido_nao_cria_shard(router):
+    antes = _shards(router)
+
+    with pytest.raises(ShardNotFoundError):
+        router.session_for(uuid4())
+
+    assert _shards(router) == antes
+
+
+def test_api_retorna_404_sem_criar_shard(router, monkeypatch):
+    monkeypatch.setattr(dependencies, "SHARDED", True)
+    monkeypatch.setattr(dependencies, "get_shard_router", lambda: router)
+    client = TestClient(app)
+    antes = _shards(router)
+
+    for _ in range(5):
+        assert client.get(f"/investigations/{uuid4()}/persons").status_code == 404
+
+    investigation_id = _criar_investigacao(router)
+    resposta = client.get(f"/investigations/{investigation_id}/persons")
+
+    assert resposta.status_code == 200
+    assert _shards(router) == sorted(antes + [f"{investigation_id}.db"])
+
+
+def test_engines_ociosos_sao_despejados(tmp_path):
+    router = ShardRouter(str(tmp_path / "shards"), max_engines=2)
+    try:
+        ids = [_criar_investigacao(router) for _ in range(4)]
+        assert len(router._engines) == 2
+        assert list(router._engines) == [str(i) for i in ids[-2:]]
+
+        router.idle_seconds = 0.05
+        time.sleep(0.1)
+        router.engine_for(ids[0])
+        assert list(router._engines) == [str(ids[0])]
+    finally:
+        router.close()
+
+
+def test_arquivamento_exige_investigacao_encerrada(router):
+    investigation_id = _criar_investigacao(router)
+
+    with pytest.raises(DomainValidationError):
+        router.archive(investigation_id)
+
+    # Continua roteável e gravável após a recusa
+    with router.session_for(investigation_id) as session:
+        session.execute(
+            update(InvestigationModel).values(status="ENCERRADA", data_encerramento=datetime(2026, 2, 1))
+        )
+        session.commit()
+
+    destino = router.archive(investigation_id)
+
+    assert os.path.exists(destino)
+    assert not os.path.exists(os.path.join(router.root, f"{investigation_id}.db"))
+
+    with router._catalog_sessions() as catalog:
+        from app.infrastructure.persistence.sqlite.sharding import ShardModel
+
+        assert catalog.get(ShardModel, str(investigation_id)).status == ShardStatus.ARQUIVADO
+
+    with router.session_for(investigation_id) as session:
+        assert session.get(InvestigationModel, str(investigation_id)).status == "ENCERRADA"
+        session.add(
+            PersonModel(
+                id=str(uuid4()),
+                investigation_id=str(investigation_id),
+                created_at=datetime(2026, 1, 1),
+                updated_at=datetime(2026, 1, 1),
+            )
+        )
+        with pytest.raises(OperationalError):
+            session.commit()
+
+
+def test_api_cria_investigacao_particionada_e_le_de_volta(router, monkeypatch):
+    monkeypatch.setattr(dependencies, "SHARDED", True)
+    monkeypatch.setattr(dependencies, "get_shard_router", lambda: router)
+    client = TestClient(app)
+
+    resposta = client.post(
+        "/investigations",
+        json={
+            "titulo": "Fraude",
+            "objetivo": "Apurar fraude",
+            "fundamento_legal": "LEGITIMO_INTERESSE",
+            "descricao_base_legal": "Prevenção a fraudes",
+        },
+    )
+    assert resposta.status_code == 201
+    investigation_id = resposta.json()["id"]
+
+    assert f"{investigation_id}.db" in _shards(router)
+
+    lida = client.get(f"/investigations/{investigation_id}")
+    assert lida.status_code == 200
+    assert lida.json()["titulo"] == "Fraude"
+
+    pessoas = client.get(f"/investigations/{investigation_id}/persons")
+    assert pessoas.status_code == 200
+    assert client.get(f"/investigations/{uuid4()}").status_code == 404
+
+
+def test_varredura_ignora_shard_em_arquivamento(router):
+    ids = [_criar_investigacao(router) for _ in range(3)]
+    router._arquivando.add(str(ids[1]))
+
+    visitados = []
+    for session in router.iter_sessions():
+        visitados.append(session.scalar(select(InvestigationModel.id)))
+
+    assert sorted(visitados) == sorted([str(ids[0]), str(ids[2])])
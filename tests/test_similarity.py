@@ -0,0 +1,204 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from app.domain.entities.evidence import Evidence
+from app.domain.entities.investigation import Investigation
+from app.domain.value_objects.base_legal import BaseLegal, LegalBasisType
+from app.domain.value_objects.evidence_type import EvidenceType
+from app.infrastructure.persistence.sqlite.models import InvestigationModel, PersonModel
+from app.infrastructure.persistence.sqlite.repositories.evidence_repo import (
+    SQLiteEvidenceRepository,
+)
+from app.infrastructure.persistence.sqlite.repositories.evidence_similarity_repo import (
+    SQLiteEvidenceSimilarityRepository,
+)
+from app.infrastructure.persistence.sqlite.repositories.person_repo import (
+    SQLitePersonRepository,
+)
+from app.infrastructure.similarity.minhash import minhash
+from app.use_cases.evidence.add_manual_evidence import (
+    AddManualEvidence,
+    AddManualEvidenceInput,
+)
+from app.use_cases.investigation.generate_report import (
+    GenerateReport,
+    GenerateReportInput,
+)
+
+PERFIL = {
+    "perfil": "https://example.com/u/fulano?utm_source=x",
+    "bio": "analista de dados em sao paulo, fotografia e corrida de rua",
+    "seguidores": 120,
+}
+
+
+class _InvestigationRepository:
+    def __init__(self, investigation):
+        self.investigation = investigation
+
+    def get_by_id(self, _investigation_id):
+        return self.investigation
+
+
+def _investigacao(investigation_id, encerrada):
+    investigation = Investigation(
+        titulo="Teste",
+        finalidade="Teste",
+        base_legal=BaseLegal(LegalBasisType.LEGITIMO_INTERESSE, "Teste"),
+        investigation_id=investigation_id,
+    )
+    investigation.definir_planejamento("Objetivo", "Escopo", ["whois"])
+    if encerrada:
+        investigation.encerrar()
+    return investigation
+
+
+def _pessoa(session, investigation_id):
+    person_id = uuid4()
+    session.add(
+        PersonModel(
+            id=str(person_id),
+            investigation_id=str(investigation_id),
+            display_name="Pessoa",
+            created_at=datetime(2026, 1, 1),
+            updated_at=datetime(2026, 1, 1),
+        )
+    )
+    session.commit()
+    return person_id
+
+
+def test_conteudo_sem_tokens_nao_e_indexado(session, investigation_id):
+    assert minhash({"a": "!!!"}) is None
+    assert minhash({"timestamp": "2026-01-01T00:00:00"}) is None
+
+    evidencias = [
+        Evidence(investigation_id, EvidenceType.OSINT_AUTOMATED, "x", dado, "teste")
+        for dado in ({"a": "!!!"}, {"b": "???"}, {"fetched_at": "ontem"})
+    ]
+    repo = SQLiteEvidenceRepository(session)
+    for evidence in evidencias:
+        repo.save(evidence)
+
+    similaridade = SQLiteEvidenceSimilarityRepository(session)
+    similaridade.index_batch(evidencias)
+
+    assert similaridade.similar(evidencias[0].id, limiar=0.0) == []
+    assert similaridade.near_duplicate_clusters(investigation_id) == []
+
+
+def test_relatorio_colapsa_duplicatas_por_pessoa(session, investigation_id):
+    pessoa_a = _pessoa(session, investigation_id)
+    pessoa_b = _pessoa(session, investigation_id)
+    inicio = datetime(2026, 1, 2)
+
+    evidencias = []
+    for i, person_id in enumerate([pessoa_a, pessoa_a, pessoa_b]):
+        evidencias.append(
+            Evidence(
+                investigation_id=investigation_id,
+                person_id=person_id,
+                tipo=EvidenceType.OSINT_AUTOMATED,
+                fonte=f"fonte-{i}",
+                dado=dict(PERFIL, retrieved_at=f"2026-01-0{i + 1}"),
+                coletado_por="teste",
+                data_coleta=inicio + timedelta(hours=i),
+            )
+        )
+
+    repo = SQLiteEvidenceRepository(session)
+    for evidence in evidencias:
+        repo.save(evidence)
+    similaridade = SQLiteEvidenceSimilarityRepository(session)
+    similaridade.index_batch(evidencias)
+
+    relatorio = GenerateReport(
+        _InvestigationRepository(_investigacao(investigation_id, encerrada=True)),
+        SQLitePersonRepository(session),
+        repo,
+        similaridade,
+    ).execute(GenerateReportInput(investigation_id, colapsar_duplicatas=True))
+
+    por_pessoa = {p["id"]: p["evidencias"] for p in relatorio["pessoas"]}
+    de_a = por_pessoa[str(pessoa_a)]
+    de_b = por_pessoa[str(pessoa_b)]
+
+    assert [e["id"] for e in de_a] == [str(evidencias[0].id)]
+    assert de_a[0]["quase_duplicatas"] == [str(evidencias[1].id)]
+    assert [e["id"] for e in de_b] == [str(evidencias[2].id)]
+    assert "quase_duplicatas" not in de_b[0]
+
+
+def test_evidencia_manual_e_indexada(session, investigation_id):
+    repo = SQLiteEvidenceRepository(session)
+    similaridade = SQLiteEvidenceSimilarityRepository(session)
+    use_case = AddManualEvidence(
+        _InvestigationRepository(_investigacao(investigation_id, encerrada=False)),
+        repo,
+        similarity_repository=similaridade,
+    )
+
+    descricao = "print da pagina de perfil mostrando o mesmo endereco de email e telefone"
+    primeira = use_case.execute(AddManualEvidenceInput(investigation_id, descricao, "captura"))
+    segunda = use_case.execute(AddManualEvidenceInput(investigation_id, descricao + ".", "captura"))
+
+    assert primeira.tipo == EvidenceType.MANUAL
+    assert [eid for eid, _ in similaridade.similar(primeira.id)] == [segunda.id]
+
+
+def test_clusters_verificam_membros_contra_representante(
+    session, investigation_id, monkeypatch
+):
+    from app.infrastructure.persistence.sqlite.repositories import (
+        evidence_similarity_repo,
+    )
+    from app.infrastructure.similarity.minhash import BANDAS, similaridade
+
+    comparacoes = []
+
+    def contar(a, b):
+        comparacoes.append(1)
+        return similaridade(a, b)
+
+    monkeypatch.setattr(evidence_similarity_repo, "similaridade", contar)
+
+    total = 300
+    evidencias = [
+        Evidence(
+            investigation_id,
+            EvidenceType.OSINT_AUTOMATED,
+            "x",
+            dict(PERFIL, retrieved_at=str(i)),
+            "teste",
+        )
+        for i in range(total)
+    ]
+    repo = SQLiteEvidenceRepository(session)
+    for evidence in evidencias:
+        repo.save(evidence)
+    similaridade_repo = SQLiteEvidenceSimilarityRepository(session)
+    similaridade_repo.index_batch(evidencias)
+
+    clusters = similaridade_repo.near_duplicate_clusters(investigation_id)
+
+    assert [len(cluster) for cluster in clusters] == [total]
+    # Nunca par a par: no máximo uma comparação por membro e banda
+    assert len(comparacoes) <= total * BANDAS
+    assert len(comparacoes) < total * (total - 1) // 2
+
+
+def test_similar_restrito_a_investigacao(session, investigation_id):
+    evidencias = [
+        Evidence(investigation_id, EvidenceType.OSINT_AUTOMATED, "x", PERFIL, "teste")
+        for _ in range(2)
+    ]
+    repo = SQLiteEvidenceRepository(session)
+    for evidence in evidencias:
+        repo.save(evidence)
+    similaridade_repo = SQLiteEvidenceSimilarityRepository(session)
+    similaridade_repo.index_batch(evidencias)
+
+    referencia = evidencias[0].id
+
+    assert similaridade_repo.similar(referencia, investigation_id=investigation_id)
+    assert similaridade_repo.similar(referencia, investigation_id=uuid4()) == []